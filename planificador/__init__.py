@@ -0,0 +1,11 @@
+"""
+=============================================================================
+PLANIFICADOR DE EVENTOS - ETIHAD STADIUM
+=============================================================================
+Paquete principal del sistema de gestión de partidos:
+- models: Clases de dominio (eventos, recursos y restricciones)
+- services: Planificación, validación y persistencia
+- utils: Utilidades de fechas y validación de entradas
+- main: Interfaz de consola (punto de entrada)
+=============================================================================
+"""
@@ -19,18 +19,100 @@ Restricciones implementadas:
 =============================================================================
 """
 
+import argparse
 import os
+import re
 import sys
 from datetime import datetime, timedelta
+from typing import Dict
 
-# Agregar el directorio actual al path para imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from planificador.models.evento import Partido
+from planificador.models.recurso import Recurso, Arbitro, TipoArbitro
+from planificador.services.planificador import PlanificadorEventos
+from planificador.utils.fecha_utils import validar_fecha, formatear_fecha, formatear_fecha_larga
 
-from models.evento import Partido
-from models.recurso import Arbitro, TipoArbitro
-from services.planificador import PlanificadorEventos
-from services.persistencia import GestorPersistencia
-from utils.fecha_utils import validar_fecha, formatear_fecha, formatear_fecha_larga
+# readline es opcional: no existe en la consola clásica de Windows.
+# Importarlo una vez al inicio deja configurada la edición de línea
+# para todas las llamadas posteriores a input()
+try:
+    import readline
+except ImportError:
+    readline = None
+
+
+# Entrada válida para solicitar_entero_positivo: solo dígitos ASCII
+_PATRON_ENTERO = re.compile(r'\A[0-9]+\Z')
+
+
+# En POSIX la pantalla se limpia con la secuencia ANSI, sin lanzar un
+# proceso 'clear'; la consola clásica de Windows sigue usando 'cls'
+_ES_WINDOWS = os.name == 'nt'
+_SECUENCIA_LIMPIAR = "\033[2J\033[H"
+
+
+# Separadores y bordes de las tarjetas de los listados
+_SEPARADOR = "=" * 60
+_LINEA_CAJA = "─" * 56
+_CAJA_INICIO = f"┌{_LINEA_CAJA}┐"
+_CAJA_DIVISION = f"├{_LINEA_CAJA}┤"
+_CAJA_FIN = f"└{_LINEA_CAJA}┘"
+
+
+if readline is not None:
+    readline.parse_and_bind('tab: complete')
+
+
+def _establecer_opciones_completado(opciones: list = None):
+    """
+    Define las opciones que se completan con TAB en el siguiente input().
+    
+    Args:
+        opciones: Textos completables, o None para desactivar el completado
+    """
+    if readline is None:
+        return
+    
+    if not opciones:
+        readline.set_completer(None)
+        return
+    
+    def completar(texto: str, estado: int):
+        coincidencias = [op for op in opciones if op.startswith(texto)]
+        return coincidencias[estado] if estado < len(coincidencias) else None
+    
+    readline.set_completer(completar)
+
+
+# Textos fijos de la interfaz (se construyen una sola vez)
+_BANNER = """
+╔══════════════════════════════════════════════════════════════════╗
+║                                                                  ║
+║     ⚽  PLANIFICADOR DE EVENTOS - ETIHAD STADIUM  ⚽             ║
+║                                                                  ║
+║         Sistema Inteligente de Gestión de Partidos               ║
+║                    Manchester City FC                            ║
+║                                                                  ║
+╚══════════════════════════════════════════════════════════════════╝
+        """
+
+_MENU_PRINCIPAL = """
+┌──────────────────────────────────────────────────────────────────┐
+│                      MENÚ PRINCIPAL                              │
+├──────────────────────────────────────────────────────────────────┤
+│                                                                  │
+│   [1] 📅  Planificar nuevo partido                               │
+│   [2] 📋  Listar todos los partidos                              │
+│   [3] 🔍  Ver detalles de un partido                             │
+│   [4] ❌  Eliminar un partido                                    │
+│   [5] 🔎  Buscar próximo horario disponible                      │
+│   [6] 👨‍⚖️  Ver árbitros disponibles                              │
+│   [7] 📊  Ver agenda de un árbitro                               │
+│   [8] 💾  Guardar datos                                          │
+│   [9] 📂  Cargar datos                                           │
+│   [0] 🚪  Salir                                                  │
+│                                                                  │
+└──────────────────────────────────────────────────────────────────┘
+        """
 
 
 class InterfazConsola:
@@ -48,9 +130,35 @@ class InterfazConsola:
     def __init__(self):
         """Inicializa la interfaz con el planificador y recursos por defecto."""
         self.planificador = PlanificadorEventos()
-        self.gestor_persistencia = GestorPersistencia()
+        self._gestor_persistencia = None
         self.archivo_datos = "data/datos_ejemplo.json"
         self._inicializar_recursos_default()
+        
+        # Opciones del menú principal ('0' se trata aparte: sale del bucle)
+        self._acciones_menu = {
+            '1': self.planificar_partido,
+            '2': self.listar_partidos,
+            '3': self.ver_detalles_partido,
+            '4': self.eliminar_partido,
+            '5': self.buscar_horario_disponible,
+            '6': self.ver_arbitros_disponibles,
+            '7': self.ver_agenda_arbitro,
+            '8': self.guardar_datos,
+            '9': self.cargar_datos
+        }
+    
+    @property
+    def gestor_persistencia(self):
+        """
+        Gestor de persistencia, creado la primera vez que se usa.
+        
+        La importación se difiere hasta guardar o cargar datos para no
+        pagarla al iniciar la aplicación.
+        """
+        if self._gestor_persistencia is None:
+            from planificador.services.persistencia import GestorPersistencia
+            self._gestor_persistencia = GestorPersistencia()
+        return self._gestor_persistencia
     
     def _inicializar_recursos_default(self):
         """
@@ -80,23 +188,12 @@ class InterfazConsola:
             "John Brooks", "Graham Scott", "Darren Bond"
         ]
         
-        # Agregar árbitros principales
-        for nombre in arbitros_principales:
-            self.planificador.agregar_recurso(
-                Arbitro(nombre, TipoArbitro.PRINCIPAL)
-            )
-        
-        # Agregar árbitros de línea
-        for nombre in arbitros_linea:
-            self.planificador.agregar_recurso(
-                Arbitro(nombre, TipoArbitro.LINEA)
-            )
-        
-        # Agregar cuartos árbitros
-        for nombre in cuartos_arbitros:
-            self.planificador.agregar_recurso(
-                Arbitro(nombre, TipoArbitro.CUARTO)
-            )
+        # Agregar todos los árbitros en una sola operación
+        self.planificador.agregar_recursos(
+            [Arbitro(nombre, TipoArbitro.PRINCIPAL) for nombre in arbitros_principales] +
+            [Arbitro(nombre, TipoArbitro.LINEA) for nombre in arbitros_linea] +
+            [Arbitro(nombre, TipoArbitro.CUARTO) for nombre in cuartos_arbitros]
+        )
     
     # =========================================================================
     # UTILIDADES DE INTERFAZ
@@ -104,47 +201,32 @@ class InterfazConsola:
     
     def limpiar_pantalla(self):
         """Limpia la pantalla de la consola."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if _ES_WINDOWS:
+            os.system('cls')
+        else:
+            sys.stdout.write(_SECUENCIA_LIMPIAR)
+            sys.stdout.flush()
     
     def pausar(self, mensaje: str = "Presione ENTER para continuar..."):
         """Pausa la ejecución hasta que el usuario presione ENTER."""
         input(f"\n{mensaje}")
     
+    def _mostrar(self, lineas: list):
+        """
+        Escribe en pantalla un bloque de líneas con una sola escritura.
+        
+        Args:
+            lineas: Líneas a mostrar (equivalente a un print por línea)
+        """
+        sys.stdout.write("\n".join(lineas) + "\n")
+    
     def mostrar_banner(self):
         """Muestra el banner principal de la aplicación."""
-        banner = """
-╔══════════════════════════════════════════════════════════════════╗
-║                                                                  ║
-║     ⚽  PLANIFICADOR DE EVENTOS - ETIHAD STADIUM  ⚽             ║
-║                                                                  ║
-║         Sistema Inteligente de Gestión de Partidos               ║
-║                    Manchester City FC                            ║
-║                                                                  ║
-╚══════════════════════════════════════════════════════════════════╝
-        """
-        print(banner)
+        print(_BANNER)
     
     def mostrar_menu_principal(self):
         """Muestra el menú principal de opciones."""
-        menu = """
-┌──────────────────────────────────────────────────────────────────┐
-│                      MENÚ PRINCIPAL                              │
-├──────────────────────────────────────────────────────────────────┤
-│                                                                  │
-│   [1] 📅  Planificar nuevo partido                               │
-│   [2] 📋  Listar todos los partidos                              │
-│   [3] 🔍  Ver detalles de un partido                             │
-│   [4] ❌  Eliminar un partido                                    │
-│   [5] 🔎  Buscar próximo horario disponible                      │
-│   [6] 👨‍⚖️  Ver árbitros disponibles                              │
-│   [7] 📊  Ver agenda de un árbitro                               │
-│   [8] 💾  Guardar datos                                          │
-│   [9] 📂  Cargar datos                                           │
-│   [0] 🚪  Salir                                                  │
-│                                                                  │
-└──────────────────────────────────────────────────────────────────┘
-        """
-        print(menu)
+        print(_MENU_PRINCIPAL)
     
     # =========================================================================
     # MÉTODOS DE ENTRADA CON VALIDACIÓN
@@ -202,40 +284,38 @@ class InterfazConsola:
             int: Número válido ingresado
         """
         while True:
-            try:
-                entrada = input(f"{mensaje}: ").strip()
-                
-                # Verificar que no contenga letras
+            entrada = input(f"{mensaje}: ").strip()
+            
+            # Caso habitual: solo dígitos ASCII, una sola comprobación en C
+            if _PATRON_ENTERO.match(entrada):
+                numero = int(entrada)
+            else:
                 if any(c.isalpha() for c in entrada):
                     print("❌ ERROR: No se permiten letras. Ingrese solo números.")
                     continue
-                
-                # Verificar que no sea negativo (incluyendo el signo -)
                 if '-' in entrada:
                     print("❌ ERROR: No se permiten números negativos.")
                     continue
-                
-                # Verificar que no esté vacío
                 if not entrada:
                     print("❌ ERROR: Debe ingresar un valor.")
                     continue
-                
-                numero = int(entrada)
-                
-                # Validar mínimo
-                if numero < minimo:
-                    print(f"❌ ERROR: El valor debe ser al menos {minimo}.")
-                    continue
-                
-                # Validar máximo
-                if maximo is not None and numero > maximo:
-                    print(f"❌ ERROR: El valor no puede ser mayor a {maximo}.")
+                try:
+                    numero = int(entrada)
+                except ValueError:
+                    print("❌ ERROR: Ingrese un número válido.")
                     continue
-                
-                return numero
-                
-            except ValueError:
-                print("❌ ERROR: Ingrese un número válido.")
+            
+            # Validar mínimo
+            if numero < minimo:
+                print(f"❌ ERROR: El valor debe ser al menos {minimo}.")
+                continue
+            
+            # Validar máximo
+            if maximo is not None and numero > maximo:
+                print(f"❌ ERROR: El valor no puede ser mayor a {maximo}.")
+                continue
+            
+            return numero
     
     def solicitar_texto(self, mensaje: str, minimo_caracteres: int = 1) -> str:
         """
@@ -248,11 +328,18 @@ class InterfazConsola:
         Returns:
             str: Texto válido ingresado
         """
+        prompt = f"{mensaje}: "
+        error = f"❌ ERROR: Debe ingresar al menos {minimo_caracteres} caracter(es)."
+        
         while True:
-            entrada = input(f"{mensaje}: ").strip()
+            entrada = input(prompt)
+            
+            # Entrada vacía: se rechaza sin recortar espacios
+            if entrada:
+                entrada = entrada.strip()
             
             if len(entrada) < minimo_caracteres:
-                print(f"❌ ERROR: Debe ingresar al menos {minimo_caracteres} caracter(es).")
+                print(error)
                 continue
             
             return entrada
@@ -274,9 +361,9 @@ class InterfazConsola:
         6. Validar y crear el partido
         """
         self.limpiar_pantalla()
-        print("\n" + "=" * 60)
+        print("\n" + _SEPARADOR)
         print("         📅 PLANIFICAR NUEVO PARTIDO")
-        print("=" * 60)
+        print(_SEPARADOR)
         
         # Solicitar equipo visitante
         print("\n📌 INFORMACIÓN DEL PARTIDO")
@@ -304,12 +391,17 @@ class InterfazConsola:
         print("-" * 40)
         print("Recuerde: Los árbitros necesitan 7 días de descanso entre partidos.")
         
+        # Disponibilidad de todos los tipos, calculada una sola vez para
+        # las cuatro selecciones
+        disponibles = self.planificador.obtener_arbitros_disponibles_todos_tipos(
+            fecha_inicio, fecha_fin
+        )
+        
         # Árbitro principal
         print("\n👨‍⚖️ ÁRBITRO PRINCIPAL (se necesita 1):")
         arbitro_principal = self._seleccionar_arbitro(
             TipoArbitro.PRINCIPAL,
-            fecha_inicio,
-            fecha_fin
+            disponibles[TipoArbitro.PRINCIPAL.value]
         )
         if not arbitro_principal:
             return
@@ -321,8 +413,7 @@ class InterfazConsola:
             print(f"\n   Seleccione árbitro de línea {i + 1}:")
             arbitro = self._seleccionar_arbitro(
                 TipoArbitro.LINEA,
-                fecha_inicio,
-                fecha_fin,
+                disponibles[TipoArbitro.LINEA.value],
                 excluir=arbitros_linea
             )
             if not arbitro:
@@ -333,8 +424,7 @@ class InterfazConsola:
         print("\n👨‍⚖️ CUARTO ÁRBITRO (se necesita 1):")
         cuarto_arbitro = self._seleccionar_arbitro(
             TipoArbitro.CUARTO,
-            fecha_inicio,
-            fecha_fin
+            disponibles[TipoArbitro.CUARTO.value]
         )
         if not cuarto_arbitro:
             return
@@ -354,41 +444,37 @@ class InterfazConsola:
         exito, mensaje = self.planificador.planificar_evento(partido)
         
         if exito:
-            print("\n" + "=" * 60)
+            print("\n" + _SEPARADOR)
             print("✅ ¡PARTIDO PLANIFICADO EXITOSAMENTE!")
-            print("=" * 60)
-            print(partido.obtener_detalles())
+            print(_SEPARADOR)
+            partido.imprimir_detalles()
         else:
-            print("\n" + "=" * 60)
+            print("\n" + _SEPARADOR)
             print("❌ NO SE PUDO PLANIFICAR EL PARTIDO")
-            print("=" * 60)
+            print(_SEPARADOR)
             print(f"\nRazón: {mensaje}")
         
         self.pausar()
     
     def _seleccionar_arbitro(self, tipo: TipoArbitro, 
-                              fecha_inicio: datetime,
-                              fecha_fin: datetime, 
+                              candidatos: list,
                               excluir: list = None) -> Arbitro:
         """
         Permite al usuario seleccionar un árbitro disponible.
         
         Args:
             tipo: Tipo de árbitro a seleccionar
-            fecha_inicio: Fecha de inicio del partido
-            fecha_fin: Fecha de fin del partido
+            candidatos: Árbitros de ese tipo disponibles para el partido
             excluir: Lista de árbitros a excluir de la selección
             
         Returns:
             Arbitro seleccionado o None si se cancela
         """
         excluir = excluir or []
-        excluir_ids = [a.id for a in excluir]
+        excluir_ids = frozenset(a.id for a in excluir)
         
-        # Obtener árbitros disponibles del tipo especificado
-        arbitros_disponibles = self.planificador.obtener_arbitros_disponibles(
-            tipo, fecha_inicio, fecha_fin, excluir_ids
-        )
+        # Descartar los árbitros ya elegidos para este partido
+        arbitros_disponibles = [a for a in candidatos if a.id not in excluir_ids]
         
         if not arbitros_disponibles:
             print(f"\n❌ No hay árbitros de tipo '{tipo.value}' disponibles para esta fecha.")
@@ -401,12 +487,18 @@ class InterfazConsola:
             print(f"   [{i}] {arbitro.nombre}")
         print(f"   [0] Cancelar operación")
         
-        # Solicitar selección
-        seleccion = self.solicitar_entero_positivo(
-            "   Seleccione una opción",
-            minimo=0,
-            maximo=len(arbitros_disponibles)
+        # Solicitar selección (las opciones se completan con TAB)
+        _establecer_opciones_completado(
+            [str(i) for i in range(len(arbitros_disponibles) + 1)]
         )
+        try:
+            seleccion = self.solicitar_entero_positivo(
+                "   Seleccione una opción",
+                minimo=0,
+                maximo=len(arbitros_disponibles)
+            )
+        finally:
+            _establecer_opciones_completado(None)
         
         if seleccion == 0:
             print("\n   ❌ Operación cancelada por el usuario.")
@@ -424,35 +516,36 @@ class InterfazConsola:
     def listar_partidos(self):
         """Muestra todos los partidos planificados ordenados por fecha."""
         self.limpiar_pantalla()
-        print("\n" + "=" * 60)
-        print("         📋 PARTIDOS PLANIFICADOS")
-        print("=" * 60)
+        lineas = [
+            "\n" + _SEPARADOR,
+            "         📋 PARTIDOS PLANIFICADOS",
+            _SEPARADOR
+        ]
         
-        eventos = self.planificador.obtener_eventos()
+        eventos_ordenados = self.planificador.obtener_eventos_ordenados()
         
-        if not eventos:
-            print("\n📭 No hay partidos planificados actualmente.")
-            print("   Use la opción [1] del menú para planificar un nuevo partido.")
+        if not eventos_ordenados:
+            lineas.append("\n📭 No hay partidos planificados actualmente.")
+            lineas.append("   Use la opción [1] del menú para planificar un nuevo partido.")
         else:
-            # Ordenar por fecha
-            eventos_ordenados = sorted(eventos, key=lambda e: e.fecha_inicio)
-            
-            print(f"\n📊 Total de partidos: {len(eventos_ordenados)}")
-            print("-" * 60)
+            lineas.append(f"\n📊 Total de partidos: {len(eventos_ordenados)}")
+            lineas.append("-" * 60)
             
+            ahora = datetime.now()
             for i, partido in enumerate(eventos_ordenados, 1):
                 # Determinar estado del partido
-                if partido.fecha_inicio > datetime.now():
+                if partido.fecha_inicio > ahora:
                     estado = "🟢 PRÓXIMO"
                 else:
                     estado = "🔴 PASADO"
                 
-                print(f"\n┌{'─' * 56}┐")
-                print(f"│ {i}. {partido.nombre[:48]:<48} │")
-                print(f"│    📅 {formatear_fecha(partido.fecha_inicio):<46} │")
-                print(f"│    {estado:<52} │")
-                print(f"└{'─' * 56}┘")
+                lineas.append("\n" + _CAJA_INICIO)
+                lineas.append(f"│ {i}. {partido.nombre[:48]:<48} │")
+                lineas.append(f"│    📅 {formatear_fecha(partido.fecha_inicio):<46} │")
+                lineas.append(f"│    {estado:<52} │")
+                lineas.append(_CAJA_FIN)
         
+        self._mostrar(lineas)
         self.pausar()
     
     # =========================================================================
@@ -462,19 +555,18 @@ class InterfazConsola:
     def ver_detalles_partido(self):
         """Muestra los detalles completos de un partido específico."""
         self.limpiar_pantalla()
-        print("\n" + "=" * 60)
+        print("\n" + _SEPARADOR)
         print("         🔍 DETALLES DE PARTIDO")
-        print("=" * 60)
+        print(_SEPARADOR)
         
-        eventos = self.planificador.obtener_eventos()
+        eventos_ordenados = self.planificador.obtener_eventos_ordenados()
         
-        if not eventos:
+        if not eventos_ordenados:
             print("\n📭 No hay partidos planificados.")
             self.pausar()
             return
         
         # Mostrar lista de partidos para seleccionar
-        eventos_ordenados = sorted(eventos, key=lambda e: e.fecha_inicio)
         
         print("\nPartidos disponibles:")
         print("-" * 40)
@@ -495,7 +587,7 @@ class InterfazConsola:
         
         # Mostrar detalles del partido seleccionado
         partido = eventos_ordenados[seleccion - 1]
-        print(partido.obtener_detalles())
+        partido.imprimir_detalles()
         
         self.pausar()
     
@@ -506,19 +598,18 @@ class InterfazConsola:
     def eliminar_partido(self):
         """Elimina un partido planificado, liberando los árbitros asignados."""
         self.limpiar_pantalla()
-        print("\n" + "=" * 60)
+        print("\n" + _SEPARADOR)
         print("         ❌ ELIMINAR PARTIDO")
-        print("=" * 60)
+        print(_SEPARADOR)
         
-        eventos = self.planificador.obtener_eventos()
+        eventos_ordenados = self.planificador.obtener_eventos_ordenados()
         
-        if not eventos:
+        if not eventos_ordenados:
             print("\n📭 No hay partidos planificados para eliminar.")
             self.pausar()
             return
         
         # Mostrar lista de partidos
-        eventos_ordenados = sorted(eventos, key=lambda e: e.fecha_inicio)
         
         print("\nPartidos disponibles:")
         print("-" * 40)
@@ -574,9 +665,9 @@ class InterfazConsola:
         - Disponibilidad de árbitros de todos los tipos
         """
         self.limpiar_pantalla()
-        print("\n" + "=" * 60)
+        print("\n" + _SEPARADOR)
         print("         🔎 BUSCAR PRÓXIMO HORARIO DISPONIBLE")
-        print("=" * 60)
+        print(_SEPARADOR)
         
         print("\nEsta función buscará el próximo horario donde se pueda")
         print("realizar un partido cumpliendo todas las restricciones:")
@@ -597,9 +688,9 @@ class InterfazConsola:
         if resultado:
             fecha_sugerida, arbitros_disponibles = resultado
             
-            print("=" * 60)
+            print(_SEPARADOR)
             print("✅ ¡HORARIO DISPONIBLE ENCONTRADO!")
-            print("=" * 60)
+            print(_SEPARADOR)
             
             print(f"\n📅 Fecha sugerida: {formatear_fecha_larga(fecha_sugerida)}")
             
@@ -617,9 +708,9 @@ class InterfazConsola:
                 else:
                     print(f"      (Ninguno disponible)")
         else:
-            print("=" * 60)
+            print(_SEPARADOR)
             print("❌ NO SE ENCONTRÓ HORARIO DISPONIBLE")
-            print("=" * 60)
+            print(_SEPARADOR)
             print("\nNo se encontró un horario disponible en los próximos 60 días.")
             print("Esto puede deberse a que:")
             print("   • Todos los árbitros están ocupados")
@@ -634,42 +725,32 @@ class InterfazConsola:
     def ver_arbitros_disponibles(self):
         """Muestra todos los árbitros del sistema organizados por tipo."""
         self.limpiar_pantalla()
-        print("\n" + "=" * 60)
-        print("         👨‍⚖️ ÁRBITROS DEL SISTEMA")
-        print("=" * 60)
-        
-        # Obtener todos los árbitros
-        arbitros = [
-            r for r in self.planificador.recursos.values() 
-            if isinstance(r, Arbitro)
+        lineas = [
+            "\n" + _SEPARADOR,
+            "         👨‍⚖️ ÁRBITROS DEL SISTEMA",
+            _SEPARADOR
         ]
         
-        # Agrupar por tipo
-        por_tipo = {}
-        for arbitro in arbitros:
-            tipo = arbitro.tipo.value
-            if tipo not in por_tipo:
-                por_tipo[tipo] = []
-            por_tipo[tipo].append(arbitro)
+        # Agenda de todos los árbitros en una sola pasada
+        eventos_por_recurso = self.planificador.obtener_eventos_por_recurso()
+        ahora = datetime.now()
         
-        # Mostrar árbitros por tipo
-        orden_tipos = ['Árbitro Principal', 'Árbitro de Línea', 'Cuarto Árbitro']
-        
-        for tipo in orden_tipos:
-            if tipo in por_tipo:
-                lista = por_tipo[tipo]
-                
-                print(f"\n┌{'─' * 56}┐")
-                print(f"│ {tipo.upper():<54} │")
-                print(f"│ Total: {len(lista):<47} │")
-                print(f"├{'─' * 56}┤")
+        # Mostrar árbitros por tipo (ya agrupados por el planificador)
+        for tipo in TipoArbitro:
+            lista = self.planificador.obtener_recursos_por_tipo(tipo)
+            
+            if lista:
+                lineas.append("\n" + _CAJA_INICIO)
+                lineas.append(f"│ {tipo.value.upper():<54} │")
+                lineas.append(f"│ Total: {len(lista):<47} │")
+                lineas.append(_CAJA_DIVISION)
                 
                 for arbitro in lista:
                     # Verificar partidos asignados
-                    partidos_asignados = self.planificador.obtener_eventos_recurso(arbitro.id)
+                    partidos_asignados = eventos_por_recurso.get(arbitro.id, [])
                     partidos_futuros = [
                         p for p in partidos_asignados 
-                        if p.fecha_inicio > datetime.now()
+                        if p.fecha_inicio > ahora
                     ]
                     
                     if partidos_futuros:
@@ -678,10 +759,11 @@ class InterfazConsola:
                         estado = "(Disponible)"
                     
                     nombre_truncado = arbitro.nombre[:30]
-                    print(f"│   • {nombre_truncado:<25} {estado:<22} │")
+                    lineas.append(f"│   • {nombre_truncado:<25} {estado:<22} │")
                 
-                print(f"└{'─' * 56}┘")
+                lineas.append(_CAJA_FIN)
         
+        self._mostrar(lineas)
         self.pausar()
     
     # =========================================================================
@@ -691,31 +773,31 @@ class InterfazConsola:
     def ver_agenda_arbitro(self):
         """Muestra la agenda completa de un árbitro específico."""
         self.limpiar_pantalla()
-        print("\n" + "=" * 60)
-        print("         📊 AGENDA DE ÁRBITRO")
-        print("=" * 60)
-        
-        # Obtener todos los árbitros ordenados
-        arbitros = [
-            r for r in self.planificador.recursos.values() 
-            if isinstance(r, Arbitro)
+        lineas = [
+            "\n" + _SEPARADOR,
+            "         📊 AGENDA DE ÁRBITRO",
+            _SEPARADOR
         ]
-        arbitros_ordenados = sorted(arbitros, key=lambda a: (a.tipo.value, a.nombre))
+        
+        # Obtener todos los árbitros ordenados por tipo y nombre
+        arbitros_ordenados = self.planificador.obtener_arbitros_ordenados()
         
         # Mostrar lista de árbitros
-        print("\nSeleccione un árbitro:")
-        print("-" * 40)
+        lineas.append("\nSeleccione un árbitro:")
+        lineas.append("-" * 40)
         
         tipo_actual = None
         for i, arbitro in enumerate(arbitros_ordenados, 1):
             # Mostrar encabezado de tipo si cambia
-            if arbitro.tipo.value != tipo_actual:
-                tipo_actual = arbitro.tipo.value
-                print(f"\n   --- {tipo_actual} ---")
+            if arbitro.tipo is not tipo_actual:
+                tipo_actual = arbitro.tipo
+                lineas.append(f"\n   --- {tipo_actual.value} ---")
             
-            print(f"   [{i}] {arbitro.nombre}")
+            lineas.append(f"   [{i}] {arbitro.nombre}")
+        
+        lineas.append(f"\n   [0] Cancelar")
         
-        print(f"\n   [0] Cancelar")
+        self._mostrar(lineas)
         
         # Solicitar selección
         seleccion = self.solicitar_entero_positivo(
@@ -729,50 +811,49 @@ class InterfazConsola:
         
         # Mostrar agenda del árbitro seleccionado
         arbitro = arbitros_ordenados[seleccion - 1]
-        
-        print("\n" + "=" * 60)
-        print(f"         📅 AGENDA: {arbitro.nombre.upper()}")
-        print("=" * 60)
-        
-        print(f"\n   Tipo: {arbitro.tipo.value}")
-        print(f"   Nacionalidad: {arbitro.nacionalidad}")
-        print(f"   Experiencia: {arbitro.experiencia_anios} años")
-        print(f"   Descanso requerido: {Arbitro.DIAS_DESCANSO_REQUERIDOS} días entre partidos")
+        lineas = [
+            "\n" + _SEPARADOR,
+            f"         📅 AGENDA: {arbitro.nombre.upper()}",
+            _SEPARADOR,
+            f"\n   Tipo: {arbitro.tipo.value}",
+            f"   Nacionalidad: {arbitro.nacionalidad}",
+            f"   Experiencia: {arbitro.experiencia_anios} años",
+            f"   Descanso requerido: {Arbitro.DIAS_DESCANSO_REQUERIDOS} días entre partidos"
+        ]
         
         # Obtener partidos asignados
         partidos = self.planificador.obtener_eventos_recurso(arbitro.id)
         
         if not partidos:
-            print("\n   📭 Este árbitro no tiene partidos asignados.")
+            lineas.append("\n   📭 Este árbitro no tiene partidos asignados.")
         else:
-            partidos_ordenados = sorted(partidos, key=lambda p: p.fecha_inicio)
-            
-            # Separar en futuros y pasados
+            # La agenda ya viene en orden cronológico: separar en futuros y pasados
             ahora = datetime.now()
-            futuros = [p for p in partidos_ordenados if p.fecha_inicio > ahora]
-            pasados = [p for p in partidos_ordenados if p.fecha_inicio <= ahora]
+            futuros = [p for p in partidos if p.fecha_inicio > ahora]
+            pasados = [p for p in partidos if p.fecha_inicio <= ahora]
             
-            print(f"\n   📊 Total de partidos: {len(partidos_ordenados)}")
-            print(f"      • Próximos: {len(futuros)}")
-            print(f"      • Pasados: {len(pasados)}")
+            lineas.append(f"\n   📊 Total de partidos: {len(partidos)}")
+            lineas.append(f"      • Próximos: {len(futuros)}")
+            lineas.append(f"      • Pasados: {len(pasados)}")
             
             if futuros:
-                print(f"\n   🟢 PRÓXIMOS PARTIDOS:")
-                print("   " + "-" * 40)
+                lineas.append(f"\n   🟢 PRÓXIMOS PARTIDOS:")
+                lineas.append("   " + "-" * 40)
                 for partido in futuros:
-                    print(f"\n   📅 {formatear_fecha(partido.fecha_inicio)}")
-                    print(f"      {partido.nombre}")
+                    lineas.append(f"\n   📅 {formatear_fecha(partido.fecha_inicio)}")
+                    lineas.append(f"      {partido.nombre}")
             
             if pasados:
-                print(f"\n   🔴 PARTIDOS PASADOS:")
-                print("   " + "-" * 40)
+                lineas.append(f"\n   🔴 PARTIDOS PASADOS:")
+                lineas.append("   " + "-" * 40)
                 for partido in pasados[-5:]:  # Mostrar solo los últimos 5
-                    print(f"\n   📅 {formatear_fecha(partido.fecha_inicio)}")
-                    print(f"      {partido.nombre}")
+                    lineas.append(f"\n   📅 {formatear_fecha(partido.fecha_inicio)}")
+                    lineas.append(f"      {partido.nombre}")
                 
                 if len(pasados) > 5:
-                    print(f"\n   ... y {len(pasados) - 5} partidos anteriores")
+                    lineas.append(f"\n   ... y {len(pasados) - 5} partidos anteriores")
         
+        self._mostrar(lineas)
         self.pausar()
     
     # =========================================================================
@@ -782,9 +863,9 @@ class InterfazConsola:
     def guardar_datos(self):
         """Guarda todos los datos del planificador en un archivo JSON."""
         self.limpiar_pantalla()
-        print("\n" + "=" * 60)
+        print("\n" + _SEPARADOR)
         print("         💾 GUARDAR DATOS")
-        print("=" * 60)
+        print(_SEPARADOR)
         
         # Mostrar información actual
         num_eventos = len(self.planificador.eventos)
@@ -822,9 +903,9 @@ class InterfazConsola:
     def cargar_datos(self):
         """Carga los datos del planificador desde un archivo JSON."""
         self.limpiar_pantalla()
-        print("\n" + "=" * 60)
+        print("\n" + _SEPARADOR)
         print("         📂 CARGAR DATOS")
-        print("=" * 60)
+        print(_SEPARADOR)
         
         print(f"\n📁 Archivo a cargar: {self.archivo_datos}")
         
@@ -866,6 +947,103 @@ class InterfazConsola:
         
         self.pausar()
     
+    # =========================================================================
+    # FUNCIONALIDAD: IMPORTAR PARTIDOS (SIN MENÚ)
+    # =========================================================================
+    
+    def importar_partidos(self, ruta_archivo: str) -> bool:
+        """
+        Importa los partidos de un archivo JSON sin interacción.
+        
+        Parte de los datos guardados (si existen), planifica todos los
+        partidos del archivo en un solo lote validando las restricciones,
+        y guarda el resultado una única vez al final. Los partidos usan los
+        árbitros ya registrados que correspondan (ver
+        _resolver_recursos_importados) y solo se registran los árbitros
+        nuevos de los partidos aceptados.
+        
+        Args:
+            ruta_archivo: Archivo JSON con el formato de guardado
+            
+        Returns:
+            bool: True si la importación se guardó correctamente
+        """
+        gestor = self.gestor_persistencia
+        
+        if gestor.existe_archivo(self.archivo_datos):
+            exito, resultado = gestor.cargar(self.archivo_datos)
+            if not exito:
+                print(f"❌ Error al cargar '{self.archivo_datos}': {resultado}")
+                return False
+            self.planificador = resultado
+        
+        exito, importado = gestor.cargar(ruta_archivo)
+        if not exito:
+            print(f"❌ Error al importar: {importado}")
+            return False
+        
+        # Apuntar los partidos a los recursos del sistema antes de validar,
+        # así el descanso de un árbitro ya registrado se respeta
+        equivalentes = self._resolver_recursos_importados(importado)
+        eventos = importado.obtener_eventos()
+        for evento in eventos:
+            evento.recursos = [equivalentes[r.id] for r in evento.recursos]
+        
+        planificados, rechazados = self.planificador.planificar_eventos(eventos)
+        
+        # Registrar solo los recursos nuevos que usan los partidos aceptados
+        self.planificador.agregar_recursos(
+            recurso for evento in planificados for recurso in evento.recursos
+        )
+        
+        print(f"✅ Partidos importados: {len(planificados)}")
+        for evento, motivo in rechazados:
+            print(f"❌ {evento}: {motivo}")
+        
+        exito, mensaje = gestor.guardar(self.planificador, self.archivo_datos)
+        if not exito:
+            print(f"❌ Error al guardar: {mensaje}")
+            return False
+        
+        print(f"   {mensaje}")
+        return True
+    
+    def _resolver_recursos_importados(self, importado: PlanificadorEventos
+                                      ) -> Dict[str, Recurso]:
+        """
+        Asocia cada recurso importado con el recurso del sistema que lo
+        representa.
+        
+        Se usa el recurso registrado con el mismo ID; si no hay, un árbitro
+        registrado con el mismo nombre y tipo; si tampoco, el propio recurso
+        importado, que queda como referencia para los siguientes árbitros
+        iguales del archivo.
+        
+        Args:
+            importado: Planificador cargado desde el archivo a importar
+            
+        Returns:
+            Dict[str, Recurso]: Diccionario {id_importado: recurso_a_usar}
+        """
+        recursos = self.planificador.recursos
+        arbitros = {
+            (arbitro.nombre, arbitro.tipo): arbitro
+            for arbitro in self.planificador.obtener_arbitros_ordenados()
+        }
+        equivalentes = {}
+        
+        for recurso in importado.obtener_todos_recursos():
+            equivalente = recursos.get(recurso.id)
+            
+            if equivalente is None and isinstance(recurso, Arbitro):
+                equivalente = arbitros.setdefault(
+                    (recurso.nombre, recurso.tipo), recurso
+                )
+            
+            equivalentes[recurso.id] = equivalente if equivalente is not None else recurso
+        
+        return equivalentes
+    
     # =========================================================================
     # BUCLE PRINCIPAL
     # =========================================================================
@@ -884,24 +1062,9 @@ class InterfazConsola:
             
             opcion = input("Seleccione una opción: ").strip()
             
-            if opcion == '1':
-                self.planificar_partido()
-            elif opcion == '2':
-                self.listar_partidos()
-            elif opcion == '3':
-                self.ver_detalles_partido()
-            elif opcion == '4':
-                self.eliminar_partido()
-            elif opcion == '5':
-                self.buscar_horario_disponible()
-            elif opcion == '6':
-                self.ver_arbitros_disponibles()
-            elif opcion == '7':
-                self.ver_agenda_arbitro()
-            elif opcion == '8':
-                self.guardar_datos()
-            elif opcion == '9':
-                self.cargar_datos()
+            accion = self._acciones_menu.get(opcion)
+            if accion is not None:
+                accion()
             elif opcion == '0':
                 self.salir()
                 break
@@ -912,26 +1075,45 @@ class InterfazConsola:
     def salir(self):
         """Muestra mensaje de despedida y termina la aplicación."""
         self.limpiar_pantalla()
-        print("\n" + "=" * 60)
+        print("\n" + _SEPARADOR)
         print("   ¡Gracias por usar el Planificador del Etihad Stadium!")
-        print("=" * 60)
+        print(_SEPARADOR)
         print("""
                     ⚽ ¡Hasta pronto! ⚽
         
            Manchester City FC - Etihad Stadium
               "Superbia in Proelio"
         """)
-        print("=" * 60 + "\n")
+        print(_SEPARADOR + "\n")
 
 
 # =============================================================================
 # PUNTO DE ENTRADA
 # =============================================================================
 
-def main():
-    """Función principal que inicia la aplicación."""
+def main(argv: list = None):
+    """
+    Función principal que inicia la aplicación.
+    
+    Con '--importar ARCHIVO' importa los partidos del archivo y termina,
+    sin mostrar el menú.
+    
+    Args:
+        argv: Argumentos de línea de comandos (default: sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(
+        description="Planificador de eventos del Etihad Stadium"
+    )
+    parser.add_argument(
+        '--importar', metavar='ARCHIVO',
+        help="importa los partidos de un archivo JSON y guarda una sola vez"
+    )
+    argumentos = parser.parse_args(argv)
+    
     try:
         app = InterfazConsola()
+        if argumentos.importar:
+            sys.exit(0 if app.importar_partidos(argumentos.importar) else 1)
         app.ejecutar()
     except KeyboardInterrupt:
         print("\n\n⚠️  Aplicación interrumpida por el usuario.")
@@ -9,26 +9,40 @@ Este módulo contiene las clases de dominio del sistema:
 =============================================================================
 """
 
-from .evento import Evento, Partido
-from .recurso import Recurso, Arbitro, TipoArbitro
-from .restricciones import (
-    Restriccion, 
-    RestriccionCoRequisito, 
-    RestriccionExclusionMutua
-)
+import importlib
 
-__all__ = [
+# Submódulo que define cada nombre exportado. Los submódulos se importan
+# la primera vez que se pide uno de sus nombres (PEP 562), de modo que
+# importar, por ejemplo, planificador.models.evento no carga también
+# las restricciones.
+_SUBMODULOS = {
     # Eventos
-    'Evento',
-    'Partido',
+    'Evento': '.evento',
+    'Partido': '.evento',
     
     # Recursos
-    'Recurso',
-    'Arbitro',
-    'TipoArbitro',
+    'Recurso': '.recurso',
+    'Arbitro': '.recurso',
+    'TipoArbitro': '.recurso',
     
     # Restricciones
-    'Restriccion',
-    'RestriccionCoRequisito',
-    'RestriccionExclusionMutua'
-]
\ No newline at end of file
+    'Restriccion': '.restricciones',
+    'RestriccionCoRequisito': '.restricciones',
+    'RestriccionExclusionMutua': '.restricciones'
+}
+
+__all__ = list(_SUBMODULOS)
+
+
+def __getattr__(nombre: str):
+    """Importa bajo demanda el submódulo que define un nombre exportado."""
+    if nombre not in _SUBMODULOS:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    
+    valor = getattr(importlib.import_module(_SUBMODULOS[nombre], __name__), nombre)
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
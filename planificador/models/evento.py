@@ -7,9 +7,34 @@ Define las clases para representar eventos (partidos de fútbol).
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterator, KeysView, List, Optional, TextIO, Tuple
+import sys
 import uuid
 
+from .recurso import Arbitro, TipoArbitro
+
+
+def marca_tiempo(fecha: datetime) -> int:
+    """
+    Convierte una fecha en un entero que conserva su orden.
+    
+    Cuenta microsegundos desde el inicio del calendario (sin zona horaria),
+    de modo que comparar dos marcas equivale a comparar las fechas.
+    
+    Args:
+        fecha: Fecha a convertir
+        
+    Returns:
+        int: Marca de tiempo en microsegundos
+    """
+    segundos = (
+        fecha.toordinal() * 86400
+        + fecha.hour * 3600
+        + fecha.minute * 60
+        + fecha.second
+    )
+    return segundos * 1_000_000 + fecha.microsecond
+
 
 class Evento:
     """
@@ -24,10 +49,19 @@ class Evento:
         fecha_inicio (datetime): Fecha y hora de inicio
         fecha_fin (datetime): Fecha y hora de finalización
         recursos (List): Lista de recursos asignados al evento
+                         (almacenados internamente como {id: recurso})
     """
     
+    # Atributos fijos: sin __dict__ por instancia
+    __slots__ = (
+        'id', '_hash', 'nombre',
+        '_fecha_inicio', '_fecha_fin', '_ts_inicio', '_ts_fin',
+        '_dia_inicio', '_dia_fin', '_textos_cache', '_recursos', '_arbitros_por_tipo'
+    )
+    
     def __init__(self, nombre: str, fecha_inicio: datetime, 
-                 fecha_fin: datetime, recursos: List = None):
+                 fecha_fin: datetime, recursos: List = None,
+                 id: Optional[str] = None):
         """
         Inicializa un nuevo evento.
         
@@ -36,21 +70,120 @@ class Evento:
             fecha_inicio: Fecha y hora de inicio del evento
             fecha_fin: Fecha y hora de finalización del evento
             recursos: Lista opcional de recursos asignados
+            id: Identificador existente (al cargar); si se omite se genera uno
         """
-        self.id = str(uuid.uuid4())
+        self.id = id if id is not None else str(uuid.uuid4())
+        # El id no cambia tras la construcción: el hash se calcula una vez
+        self._hash = hash(self.id)
         self.nombre = nombre
         self.fecha_inicio = fecha_inicio
         self.fecha_fin = fecha_fin
-        self.recursos = recursos or []
+        self._asignar_recursos(recursos or [])
     
     def __str__(self) -> str:
         """Representación en cadena del evento."""
-        return f"{self.nombre} ({self.fecha_inicio.strftime('%d/%m/%Y %H:%M')})"
+        return f"{self.nombre} ({self._textos()[0]})"
     
     def __repr__(self) -> str:
         """Representación técnica del evento."""
         return f"Evento(id={self.id[:8]}..., nombre='{self.nombre}')"
     
+    @property
+    def fecha_inicio(self) -> datetime:
+        """Fecha y hora de inicio del evento."""
+        return self._fecha_inicio
+    
+    @fecha_inicio.setter
+    def fecha_inicio(self, fecha: datetime):
+        """Actualiza la fecha de inicio, su marca de tiempo y su día."""
+        self._fecha_inicio = fecha
+        self._textos_cache = None
+        self._ts_inicio = marca_tiempo(fecha)
+        self._dia_inicio = fecha.toordinal()
+    
+    @property
+    def fecha_fin(self) -> datetime:
+        """Fecha y hora de finalización del evento."""
+        return self._fecha_fin
+    
+    @fecha_fin.setter
+    def fecha_fin(self, fecha: datetime):
+        """Actualiza la fecha de fin, su marca de tiempo y su día."""
+        self._fecha_fin = fecha
+        self._textos_cache = None
+        self._ts_fin = marca_tiempo(fecha)
+        self._dia_fin = fecha.toordinal()
+    
+    @property
+    def dia_inicio(self) -> int:
+        """Día de inicio como ordinal de la fecha (sin la hora)."""
+        return self._dia_inicio
+    
+    @property
+    def dia_fin(self) -> int:
+        """Día de fin como ordinal de la fecha (sin la hora)."""
+        return self._dia_fin
+    
+    @property
+    def texto_inicio(self) -> str:
+        """Fecha y hora de inicio como 'DD/MM/AAAA HH:MM'."""
+        return self._textos()[0]
+    
+    @property
+    def texto_fin(self) -> str:
+        """Fecha y hora de fin como 'DD/MM/AAAA HH:MM'."""
+        return self._textos()[1]
+    
+    @property
+    def texto_fecha(self) -> str:
+        """Fecha de inicio como 'DD/MM/AAAA'."""
+        return self._textos()[2]
+    
+    @property
+    def recursos(self) -> List:
+        """Lista de recursos asignados, en orden de asignación."""
+        return list(self._recursos.values())
+    
+    @recursos.setter
+    def recursos(self, recursos: List):
+        """Reemplaza los recursos asignados."""
+        self._asignar_recursos(recursos)
+    
+    @property
+    def recurso_ids(self) -> KeysView:
+        """Vista de conjunto con los IDs de los recursos asignados."""
+        return self._recursos.keys()
+    
+    def _asignar_recursos(self, recursos: List):
+        """
+        Reemplaza los recursos y reconstruye los grupos de árbitros por tipo.
+        
+        Args:
+            recursos: Nuevos recursos del evento
+        """
+        self._recursos = {r.id: r for r in recursos}
+        self._arbitros_por_tipo = {tipo: [] for tipo in TipoArbitro}
+        for recurso in self._recursos.values():
+            if isinstance(recurso, Arbitro):
+                self._arbitros_por_tipo[recurso.tipo].append(recurso)
+    
+    def arbitros_por_tipo(self) -> Tuple[List, List, List]:
+        """
+        Obtiene los árbitros asignados agrupados por tipo.
+        
+        Los grupos se mantienen al asignar, agregar o remover recursos,
+        así que no se recorren los recursos en cada llamada.
+        
+        Returns:
+            Tuple[List, List, List]: (principales, lineas, cuartos)
+        """
+        grupos = self._arbitros_por_tipo
+        return (
+            grupos[TipoArbitro.PRINCIPAL],
+            grupos[TipoArbitro.LINEA],
+            grupos[TipoArbitro.CUARTO]
+        )
+    
     def __eq__(self, other) -> bool:
         """Compara dos eventos por su ID."""
         if isinstance(other, Evento):
@@ -59,7 +192,7 @@ class Evento:
     
     def __hash__(self) -> int:
         """Hash basado en el ID del evento."""
-        return hash(self.id)
+        return self._hash
     
     def obtener_detalles(self) -> str:
         """
@@ -68,28 +201,66 @@ class Evento:
         Returns:
             str: Cadena con todos los detalles del evento
         """
-        detalles = [
-            f"\n{'='*50}",
-            f"📌 DETALLES DEL EVENTO",
-            f"{'='*50}",
-            f"\nNombre: {self.nombre}",
-            f"ID: {self.id[:8]}...",
-            f"\n📅 HORARIO:",
-            f"   Inicio: {self.fecha_inicio.strftime('%d/%m/%Y %H:%M')}",
-            f"   Fin: {self.fecha_fin.strftime('%d/%m/%Y %H:%M')}",
-            f"   Duración: {self._calcular_duracion()}",
-            f"\n📦 RECURSOS ASIGNADOS ({len(self.recursos)}):"
-        ]
+        return "\n".join(self._iter_detalles())
+    
+    def imprimir_detalles(self, stream: Optional[TextIO] = None) -> None:
+        """
+        Escribe la representación detallada línea a línea, sin construirla
+        entera en memoria.
         
-        if self.recursos:
-            for recurso in self.recursos:
-                detalles.append(f"   • {recurso}")
+        Args:
+            stream: Destino de la salida (default: sys.stdout)
+        """
+        if stream is None:
+            stream = sys.stdout
+        stream.writelines(linea + "\n" for linea in self._iter_detalles())
+    
+    def _iter_detalles(self) -> Iterator[str]:
+        """
+        Genera las líneas de la representación detallada del evento.
+        
+        Yields:
+            str: Cada línea del detalle
+        """
+        textos = self._textos()
+        yield f"\n{'='*50}"
+        yield f"📌 DETALLES DEL EVENTO"
+        yield f"{'='*50}"
+        yield f"\nNombre: {self.nombre}"
+        yield f"ID: {self.id[:8]}..."
+        yield f"\n📅 HORARIO:"
+        yield f"   Inicio: {textos[0]}"
+        yield f"   Fin: {textos[1]}"
+        yield f"   Duración: {textos[5]}"
+        yield f"\n📦 RECURSOS ASIGNADOS ({len(self._recursos)}):"
+        
+        if self._recursos:
+            for recurso in self._recursos.values():
+                yield f"   • {recurso}"
         else:
-            detalles.append("   (Sin recursos asignados)")
+            yield "   (Sin recursos asignados)"
         
-        detalles.append(f"\n{'='*50}")
+        yield f"\n{'='*50}"
+    
+    def _textos(self) -> Tuple[str, str, str, str, str, str]:
+        """
+        Devuelve los textos de fecha del evento, formateados una sola vez.
+        
+        Se recalculan solo si cambia alguna de las fechas.
         
-        return "\n".join(detalles)
+        Returns:
+            Tuple: (inicio, fin, fecha_inicio, hora_inicio, hora_fin, duracion)
+        """
+        if self._textos_cache is None:
+            self._textos_cache = (
+                self._fecha_inicio.strftime('%d/%m/%Y %H:%M'),
+                self._fecha_fin.strftime('%d/%m/%Y %H:%M'),
+                self._fecha_inicio.strftime('%d/%m/%Y'),
+                self._fecha_inicio.strftime('%H:%M'),
+                self._fecha_fin.strftime('%H:%M'),
+                self._calcular_duracion()
+            )
+        return self._textos_cache
     
     def _calcular_duracion(self) -> str:
         """
@@ -98,9 +269,10 @@ class Evento:
         Returns:
             str: Duración en formato "X horas Y minutos"
         """
-        diferencia = self.fecha_fin - self.fecha_inicio
-        horas = diferencia.seconds // 3600
-        minutos = (diferencia.seconds % 3600) // 60
+        # total_seconds incluye los días completos (eventos de más de 24 h)
+        total = int((self.fecha_fin - self.fecha_inicio).total_seconds())
+        horas, resto = divmod(total, 3600)
+        minutos = resto // 60
         
         if horas > 0 and minutos > 0:
             return f"{horas} hora(s) {minutos} minuto(s)"
@@ -121,14 +293,32 @@ class Evento:
             otra_fecha_inicio: Inicio del otro intervalo
             otra_fecha_fin: Fin del otro intervalo
             
+        Returns:
+            bool: True si hay superposición, False en caso contrario
+        """
+        return self.se_superpone_ts(
+            marca_tiempo(otra_fecha_inicio), marca_tiempo(otra_fecha_fin)
+        )
+    
+    def se_superpone_ts(self, ts_inicio: int, ts_fin: int) -> bool:
+        """
+        Igual que se_superpone_con, pero con marcas de tiempo ya calculadas.
+        
+        Pensado para bucles que comparan un mismo intervalo contra muchos
+        eventos: la conversión se hace una vez fuera del bucle.
+        
+        Args:
+            ts_inicio: Marca de tiempo (ver marca_tiempo) del inicio
+            ts_fin: Marca de tiempo del fin
+            
         Returns:
             bool: True si hay superposición, False en caso contrario
         """
         # No hay superposición si:
         # - Este evento termina antes de que el otro empiece, O
         # - Este evento empieza después de que el otro termine
-        return not (self.fecha_fin <= otra_fecha_inicio or 
-                    self.fecha_inicio >= otra_fecha_fin)
+        return not (self._ts_fin <= ts_inicio or 
+                    self._ts_inicio >= ts_fin)
     
     def contiene_recurso(self, recurso_id: str) -> bool:
         """
@@ -140,7 +330,7 @@ class Evento:
         Returns:
             bool: True si el recurso está asignado
         """
-        return any(r.id == recurso_id for r in self.recursos)
+        return recurso_id in self._recursos
     
     def agregar_recurso(self, recurso) -> bool:
         """
@@ -152,10 +342,12 @@ class Evento:
         Returns:
             bool: True si se agregó, False si ya existía
         """
-        if not self.contiene_recurso(recurso.id):
-            self.recursos.append(recurso)
-            return True
-        return False
+        if recurso.id in self._recursos:
+            return False
+        self._recursos[recurso.id] = recurso
+        if isinstance(recurso, Arbitro):
+            self._arbitros_por_tipo[recurso.tipo].append(recurso)
+        return True
     
     def remover_recurso(self, recurso_id: str) -> bool:
         """
@@ -167,11 +359,12 @@ class Evento:
         Returns:
             bool: True si se removió, False si no existía
         """
-        for i, recurso in enumerate(self.recursos):
-            if recurso.id == recurso_id:
-                self.recursos.pop(i)
-                return True
-        return False
+        recurso = self._recursos.pop(recurso_id, None)
+        if recurso is None:
+            return False
+        if isinstance(recurso, Arbitro):
+            self._arbitros_por_tipo[recurso.tipo].remove(recurso)
+        return True
     
     def to_dict(self) -> dict:
         """
@@ -186,7 +379,7 @@ class Evento:
             'nombre': self.nombre,
             'fecha_inicio': self.fecha_inicio.isoformat(),
             'fecha_fin': self.fecha_fin.isoformat(),
-            'recursos_ids': [r.id for r in self.recursos]
+            'recursos_ids': list(self._recursos)
         }
     
     @classmethod
@@ -209,9 +402,9 @@ class Evento:
                 recursos_map[rid] 
                 for rid in data.get('recursos_ids', []) 
                 if rid in recursos_map
-            ]
+            ],
+            id=data['id']
         )
-        evento.id = data['id']
         return evento
 
 
@@ -227,12 +420,14 @@ class Partido(Evento):
         equipo_visitante (str): Nombre del equipo visitante
     """
     
+    __slots__ = ('equipo_local', 'equipo_visitante')
+    
     # Duración estándar de un partido en horas (90 min + descanso + extras)
     DURACION_ESTANDAR_HORAS = 2
     
     def __init__(self, equipo_local: str, equipo_visitante: str,
                  fecha_inicio: datetime, fecha_fin: datetime, 
-                 recursos: List = None):
+                 recursos: List = None, id: Optional[str] = None):
         """
         Inicializa un nuevo partido.
         
@@ -242,64 +437,51 @@ class Partido(Evento):
             fecha_inicio: Fecha y hora de inicio del partido
             fecha_fin: Fecha y hora de finalización del partido
             recursos: Lista opcional de recursos (árbitros)
+            id: Identificador existente (al cargar); si se omite se genera uno
         """
-        nombre = f"{equipo_local} vs {equipo_visitante}"
-        super().__init__(nombre, fecha_inicio, fecha_fin, recursos)
+        # Los nombres de equipo se repiten en muchos partidos y se usan
+        # como claves de orden y de agrupación; internarlos permite que
+        # las comparaciones se resuelvan por identidad
+        equipo_local = sys.intern(equipo_local)
+        equipo_visitante = sys.intern(equipo_visitante)
+        nombre = sys.intern(f"{equipo_local} vs {equipo_visitante}")
+        super().__init__(nombre, fecha_inicio, fecha_fin, recursos, id)
         self.equipo_local = equipo_local
         self.equipo_visitante = equipo_visitante
     
     def __str__(self) -> str:
         """Representación en cadena del partido."""
-        return f"⚽ {self.nombre} - {self.fecha_inicio.strftime('%d/%m/%Y %H:%M')}"
+        return f"⚽ {self.nombre} - {self._textos()[0]}"
     
-    def obtener_detalles(self) -> str:
+    def _iter_detalles(self) -> Iterator[str]:
         """
-        Retorna una representación detallada del partido.
+        Genera las líneas de la representación detallada del partido.
         
-        Returns:
-            str: Cadena con todos los detalles del partido
+        Yields:
+            str: Cada línea del detalle
         """
-        # Importación local para evitar dependencia circular
-        from .recurso import TipoArbitro
-        
-        lineas = [
-            f"\n{'='*55}",
-            f"⚽ PARTIDO DE FÚTBOL - ETIHAD STADIUM",
-            f"{'='*55}",
-            f"\n🏠 Equipo Local:     {self.equipo_local}",
-            f"✈️  Equipo Visitante: {self.equipo_visitante}",
-            f"\n📅 FECHA Y HORA:",
-            f"   Fecha: {self.fecha_inicio.strftime('%d/%m/%Y')}",
-            f"   Hora:  {self.fecha_inicio.strftime('%H:%M')} - {self.fecha_fin.strftime('%H:%M')}",
-            f"\n👨‍⚖️ EQUIPO ARBITRAL:",
-            f"{'-'*35}"
-        ]
+        textos = self._textos()
+        yield f"\n{'='*55}"
+        yield f"⚽ PARTIDO DE FÚTBOL - ETIHAD STADIUM"
+        yield f"{'='*55}"
+        yield f"\n🏠 Equipo Local:     {self.equipo_local}"
+        yield f"✈️  Equipo Visitante: {self.equipo_visitante}"
+        yield f"\n📅 FECHA Y HORA:"
+        yield f"   Fecha: {textos[2]}"
+        yield f"   Hora:  {textos[3]} - {textos[4]}"
+        yield f"\n👨‍⚖️ EQUIPO ARBITRAL:"
+        yield f"{'-'*35}"
         
-        # Organizar árbitros por tipo
-        arbitros_por_tipo = {
-            'Árbitro Principal': [],
-            'Árbitro de Línea': [],
-            'Cuarto Árbitro': []
-        }
-        
-        for recurso in self.recursos:
-            if hasattr(recurso, 'tipo'):
-                tipo = recurso.tipo.value
-                if tipo in arbitros_por_tipo:
-                    arbitros_por_tipo[tipo].append(recurso.nombre)
-        
-        # Mostrar árbitros en orden
-        for tipo in ['Árbitro Principal', 'Árbitro de Línea', 'Cuarto Árbitro']:
-            arbitros = arbitros_por_tipo[tipo]
+        # Mostrar árbitros en orden (ya agrupados por tipo)
+        for tipo in TipoArbitro:
+            arbitros = self._arbitros_por_tipo.get(tipo)
             if arbitros:
-                for nombre in arbitros:
-                    lineas.append(f"   {tipo}: {nombre}")
+                for arbitro in arbitros:
+                    yield f"   {tipo.value}: {arbitro.nombre}"
             else:
-                lineas.append(f"   {tipo}: (No asignado)")
-        
-        lineas.append(f"\n{'='*55}")
+                yield f"   {tipo.value}: (No asignado)"
         
-        return "\n".join(lineas)
+        yield f"\n{'='*55}"
     
     def to_dict(self) -> dict:
         """
@@ -334,7 +516,7 @@ class Partido(Evento):
                 recursos_map[rid] 
                 for rid in data.get('recursos_ids', []) 
                 if rid in recursos_map
-            ]
+            ],
+            id=data['id']
         )
-        partido.id = data['id']
         return partido
\ No newline at end of file
@@ -8,6 +8,7 @@ Define las clases para representar recursos del sistema (árbitros).
 
 from enum import Enum
 from typing import Optional
+import sys
 import uuid
 
 
@@ -19,10 +20,54 @@ class TipoArbitro(Enum):
     - 1 Árbitro Principal
     - 2 Árbitros de Línea
     - 1 Cuarto Árbitro (reserva)
+    
+    Cada miembro se define con (texto, índice); el valor del miembro es
+    solo el texto.
+    
+    Attributes:
+        indice (int): Posición del tipo en la enumeración (0, 1, 2); permite
+                      contar árbitros en una lista de tres celdas en lugar
+                      de un diccionario con el tipo como clave (el hash de
+                      un miembro de Enum se calcula en Python)
     """
-    PRINCIPAL = "Árbitro Principal"
-    LINEA = "Árbitro de Línea"
-    CUARTO = "Cuarto Árbitro"
+    
+    indice: int
+    
+    PRINCIPAL = ("Árbitro Principal", 0)
+    LINEA = ("Árbitro de Línea", 1)
+    CUARTO = ("Cuarto Árbitro", 2)
+    
+    def __new__(cls, valor: str, indice: int) -> 'TipoArbitro':
+        """
+        Crea un miembro con su texto como valor y su índice.
+        
+        Args:
+            valor: Texto del tipo
+            indice: Posición del tipo en la enumeración
+        """
+        miembro = object.__new__(cls)
+        miembro._value_ = valor
+        miembro.indice = indice
+        return miembro
+    
+    @classmethod
+    def desde_valor(cls, valor: Optional[str],
+                    defecto: Optional['TipoArbitro'] = None) -> Optional['TipoArbitro']:
+        """
+        Obtiene el tipo a partir de su texto (p. ej. al cargar datos).
+        
+        Args:
+            valor: Texto del tipo ("Árbitro Principal", ...)
+            defecto: Tipo a devolver si el texto no corresponde a ninguno
+            
+        Returns:
+            TipoArbitro o el valor por defecto
+        """
+        return _TIPO_POR_VALOR.get(valor, defecto)
+
+
+# Tabla texto -> tipo, construida una sola vez
+_TIPO_POR_VALOR = {t.value: t for t in TipoArbitro}
 
 
 class Recurso:
@@ -38,15 +83,22 @@ class Recurso:
         descripcion (str): Descripción opcional del recurso
     """
     
-    def __init__(self, nombre: str, descripcion: str = ""):
+    # Atributos fijos: sin __dict__ por instancia
+    __slots__ = ('id', '_hash', 'nombre', 'descripcion')
+    
+    def __init__(self, nombre: str, descripcion: str = "",
+                 id: Optional[str] = None):
         """
         Inicializa un nuevo recurso.
         
         Args:
             nombre: Nombre descriptivo del recurso
             descripcion: Descripción opcional del recurso
+            id: Identificador existente (al cargar); si se omite se genera uno
         """
-        self.id = str(uuid.uuid4())
+        self.id = id if id is not None else str(uuid.uuid4())
+        # El id no cambia tras la construcción: el hash se calcula una vez
+        self._hash = hash(self.id)
         self.nombre = nombre
         self.descripcion = descripcion
     
@@ -66,7 +118,7 @@ class Recurso:
     
     def __hash__(self) -> int:
         """Hash basado en el ID del recurso."""
-        return hash(self.id)
+        return self._hash
     
     def to_dict(self) -> dict:
         """
@@ -95,9 +147,9 @@ class Recurso:
         """
         recurso = cls(
             nombre=data['nombre'],
-            descripcion=data.get('descripcion', '')
+            descripcion=data.get('descripcion', ''),
+            id=data['id']
         )
-        recurso.id = data['id']
         return recurso
 
 
@@ -115,12 +167,15 @@ class Arbitro(Recurso):
         experiencia_anios (int): Años de experiencia como árbitro
     """
     
+    __slots__ = ('tipo', 'nacionalidad', 'experiencia_anios')
+    
     # Días de descanso requeridos entre partidos
     DIAS_DESCANSO_REQUERIDOS = 7
     
     def __init__(self, nombre: str, tipo: TipoArbitro, 
                  nacionalidad: str = "Inglaterra", 
-                 experiencia_anios: int = 0):
+                 experiencia_anios: int = 0,
+                 id: Optional[str] = None):
         """
         Inicializa un nuevo árbitro.
         
@@ -129,9 +184,14 @@ class Arbitro(Recurso):
             tipo: Tipo de árbitro (Principal, Línea, Cuarto)
             nacionalidad: País de origen (default: Inglaterra)
             experiencia_anios: Años de experiencia (default: 0)
+            id: Identificador existente (al cargar); si se omite se genera uno
         """
-        descripcion = f"{tipo.value} - {nacionalidad}"
-        super().__init__(nombre, descripcion)
+        # Nacionalidad y descripción se repiten entre árbitros (y en cada
+        # carga desde JSON): se comparte una sola copia de cada texto
+        nacionalidad = sys.intern(nacionalidad)
+        descripcion = sys.intern(f"{tipo.value} - {nacionalidad}")
+        # El nombre se usa como clave de orden en los índices por tipo
+        super().__init__(sys.intern(nombre), descripcion, id)
         self.tipo = tipo
         self.nacionalidad = nacionalidad
         self.experiencia_anios = experiencia_anios
@@ -196,14 +256,13 @@ class Arbitro(Recurso):
             Arbitro: Nueva instancia del árbitro
         """
         # Mapear el valor del tipo al enum
-        tipo_map = {t.value: t for t in TipoArbitro}
-        tipo = tipo_map.get(data.get('tipo_arbitro'), TipoArbitro.PRINCIPAL)
+        tipo = TipoArbitro.desde_valor(data.get('tipo_arbitro'), TipoArbitro.PRINCIPAL)
         
         arbitro = cls(
             nombre=data['nombre'],
             tipo=tipo,
             nacionalidad=data.get('nacionalidad', 'Inglaterra'),
-            experiencia_anios=data.get('experiencia_anios', 0)
+            experiencia_anios=data.get('experiencia_anios', 0),
+            id=data['id']
         )
-        arbitro.id = data['id']
         return arbitro
\ No newline at end of file
@@ -10,16 +10,362 @@ Restricciones implementadas:
 =============================================================================
 """
 
+import bisect
+import sys
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-from typing import List, Tuple, TYPE_CHECKING
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union, TYPE_CHECKING
 
-# Importación condicional para evitar dependencias circulares
+from .evento import marca_tiempo
+from .recurso import Arbitro, TipoArbitro
+
+# Importación condicional, solo para las anotaciones de tipo
 if TYPE_CHECKING:
-    from .recurso import Recurso, Arbitro
+    from .recurso import Recurso
     from .evento import Evento
 
 
+# =============================================================================
+# MENSAJES DE ERROR
+# =============================================================================
+
+class MensajeDiferido:
+    """
+    Mensaje de error que se arma recién al convertirlo a texto.
+    
+    Las validaciones devuelven el motivo de cada rechazo, pero muchas
+    llamadas (búsqueda de horarios, árbitros disponibles) solo miran si
+    el resultado es válido. Guardar la función que arma el texto y sus
+    argumentos evita formatear fechas y unir cadenas que nadie va a leer.
+    
+    Example:
+        >>> mensaje = MensajeDiferido("Partido el {}".format, evento.texto_fecha)
+        >>> print(mensaje)  # El texto se arma aquí
+    """
+    
+    __slots__ = ('_formatear', '_argumentos')
+    
+    def __init__(self, formatear: Callable[..., str], *argumentos):
+        """
+        Inicializa el mensaje sin armar su texto.
+        
+        Args:
+            formatear: Función que devuelve el texto del mensaje
+            *argumentos: Argumentos con que se llamará a formatear
+        """
+        self._formatear = formatear
+        self._argumentos = argumentos
+    
+    def __str__(self) -> str:
+        """Arma el texto del mensaje."""
+        return self._formatear(*self._argumentos)
+    
+    def __add__(self, otro: str) -> str:
+        """Concatena el texto del mensaje con una cadena."""
+        return str(self) + otro
+    
+    def __radd__(self, otro: str) -> str:
+        """Concatena una cadena con el texto del mensaje."""
+        return otro + str(self)
+    
+    def __repr__(self) -> str:
+        """Representación técnica del mensaje."""
+        return f"MensajeDiferido({str(self)!r})"
+
+
+# Mensaje que devuelve una validación: texto ya armado o diferido (en ese
+# caso, quien lo muestre debe convertirlo con str())
+MensajeValidacion = Union[str, MensajeDiferido]
+
+
+def _anteponer(prefijo: str, mensaje: MensajeValidacion) -> str:
+    """
+    Arma el texto de un mensaje precedido por un prefijo.
+    
+    Args:
+        prefijo: Texto a anteponer (p. ej. "[Nombre de la restricción] ")
+        mensaje: Mensaje a continuación del prefijo
+        
+    Returns:
+        str: Texto completo
+    """
+    return prefijo + str(mensaje)
+
+
+# =============================================================================
+# AGENDA DE ÁRBITROS
+# =============================================================================
+
+class AgendaArbitros:
+    """
+    Índice de los partidos de cada árbitro, ordenados por fecha de inicio.
+    
+    Para cada árbitro guarda la lista ordenada de días (ordinales) de sus
+    partidos y, en paralelo, los partidos (dentro de un mismo día, por
+    hora de inicio). Así los partidos que caen dentro
+    de un período de descanso se localizan con búsqueda binaria, sin
+    recorrer toda la agenda del árbitro.
+    
+    Example:
+        >>> agenda = AgendaArbitros()
+        >>> agenda.agregar(arbitro.id, partido)
+        >>> cercanos = agenda.eventos_cercanos(arbitro.id, dia, dias_descanso=7)
+    """
+    
+    def __init__(self):
+        """Inicializa la agenda vacía."""
+        self._dias: Dict[str, List[int]] = {}
+        self._eventos: Dict[str, List] = {}
+    
+    @classmethod
+    def desde_eventos(cls, eventos: Iterable,
+                      arbitro_ids: Optional[Iterable[str]] = None) -> 'AgendaArbitros':
+        """
+        Construye una agenda a partir de una lista de eventos.
+        
+        Args:
+            eventos: Eventos a indexar
+            arbitro_ids: Si se indica, solo se indexan estos recursos
+            
+        Returns:
+            AgendaArbitros: Agenda con los eventos indexados
+        """
+        agenda = cls()
+        filtro = set(arbitro_ids) if arbitro_ids is not None else None
+        
+        for evento in eventos:
+            for recurso_id in evento.recurso_ids:
+                if filtro is None or recurso_id in filtro:
+                    agenda.agregar(recurso_id, evento)
+        
+        return agenda
+    
+    def agregar(self, arbitro_id: str, evento) -> None:
+        """
+        Agrega un evento a la agenda de un árbitro, manteniendo el orden.
+        
+        Args:
+            arbitro_id: ID del árbitro
+            evento: Evento en el que participa
+        """
+        dias = self._dias.setdefault(arbitro_id, [])
+        eventos = self._eventos.setdefault(arbitro_id, [])
+        
+        dia = evento.dia_inicio
+        posicion = bisect.bisect_right(dias, dia)
+        
+        # Dentro del día, después de los que empiezan antes o a la vez
+        inicio = evento.fecha_inicio
+        while (posicion and dias[posicion - 1] == dia
+               and eventos[posicion - 1].fecha_inicio > inicio):
+            posicion -= 1
+        
+        dias.insert(posicion, dia)
+        eventos.insert(posicion, evento)
+    
+    def remover(self, arbitro_id: str, evento) -> bool:
+        """
+        Quita un evento de la agenda de un árbitro.
+        
+        Args:
+            arbitro_id: ID del árbitro
+            evento: Evento a quitar
+            
+        Returns:
+            bool: True si se quitó, False si no estaba en la agenda
+        """
+        dias = self._dias.get(arbitro_id)
+        if not dias:
+            return False
+        
+        eventos = self._eventos[arbitro_id]
+        dia = evento.dia_inicio
+        
+        # Solo pueden coincidir los eventos del mismo día
+        for posicion in range(bisect.bisect_left(dias, dia),
+                              bisect.bisect_right(dias, dia)):
+            if eventos[posicion] == evento:
+                del dias[posicion]
+                del eventos[posicion]
+                return True
+        
+        return False
+    
+    def limpiar(self) -> None:
+        """Vacía la agenda."""
+        self._dias.clear()
+        self._eventos.clear()
+    
+    def obtener_eventos(self, arbitro_id: str) -> List:
+        """
+        Obtiene los eventos de un árbitro, ordenados por fecha de inicio.
+        
+        Args:
+            arbitro_id: ID del árbitro
+            
+        Returns:
+            List: Copia de la lista de eventos del árbitro
+        """
+        return list(self._eventos.get(arbitro_id, ()))
+    
+    def obtener_eventos_por_arbitro(self) -> Dict[str, List]:
+        """
+        Obtiene los eventos de todos los árbitros con algún evento.
+        
+        Returns:
+            Dict[str, List]: Diccionario {arbitro_id: [eventos]}
+        """
+        return {
+            arbitro_id: list(eventos)
+            for arbitro_id, eventos in self._eventos.items()
+            if eventos
+        }
+    
+    def eventos_cercanos(self, arbitro_id: str, dia: int,
+                         dias_descanso: int) -> List:
+        """
+        Obtiene los eventos de un árbitro a menos de dias_descanso días de un día.
+        
+        Args:
+            arbitro_id: ID del árbitro
+            dia: Día de referencia (ordinal de la fecha)
+            dias_descanso: Días mínimos de descanso
+            
+        Returns:
+            List: Eventos con abs(dia_evento - dia) < dias_descanso,
+                  ordenados por día
+        """
+        dias = self._dias.get(arbitro_id)
+        if not dias:
+            return []
+        
+        desde = bisect.bisect_left(dias, dia - dias_descanso + 1)
+        hasta = bisect.bisect_left(dias, dia + dias_descanso, desde)
+        
+        return self._eventos[arbitro_id][desde:hasta]
+    
+    def hay_eventos_cercanos(self, arbitro_id: str, dia: int,
+                             dias_descanso: int) -> bool:
+        """
+        Indica si un árbitro tiene algún evento a menos de dias_descanso días.
+        
+        Basta con mirar el primer día de la agenda que no es anterior a la
+        ventana de descanso, sin construir la lista de eventos.
+        
+        Args:
+            arbitro_id: ID del árbitro
+            dia: Día de referencia (ordinal de la fecha)
+            dias_descanso: Días mínimos de descanso
+            
+        Returns:
+            bool: True si algún evento cae dentro del período de descanso
+        """
+        dias = self._dias.get(arbitro_id)
+        if not dias:
+            return False
+        
+        posicion = bisect.bisect_left(dias, dia - dias_descanso + 1)
+        return posicion < len(dias) and dias[posicion] < dia + dias_descanso
+
+
+# =============================================================================
+# CALENDARIO DEL ESTADIO
+# =============================================================================
+
+class CalendarioEstadio:
+    """
+    Índice de los eventos del estadio, ordenados por día de inicio.
+    
+    Guarda la lista ordenada de días (ordinales) de inicio y, en paralelo,
+    los eventos, junto con la mayor duración en días de un evento. Con
+    ella se acota por búsqueda binaria el tramo de eventos que puede
+    chocar con un horario, sin recorrer el calendario entero.
+    
+    Example:
+        >>> calendario = CalendarioEstadio()
+        >>> calendario.agregar(partido)
+        >>> candidatos = calendario.eventos_cercanos(inicio, fin, dias_descanso=2)
+    """
+    
+    def __init__(self):
+        """Inicializa el calendario vacío."""
+        self._dias: List[int] = []
+        self._eventos: List = []
+        # Cota superior de dia_fin - dia_inicio de los eventos agregados
+        self._duracion_maxima_dias = 0
+    
+    def agregar(self, evento) -> None:
+        """
+        Agrega un evento al calendario, manteniendo el orden.
+        
+        Args:
+            evento: Evento a agregar
+        """
+        posicion = bisect.bisect_right(self._dias, evento.dia_inicio)
+        self._dias.insert(posicion, evento.dia_inicio)
+        self._eventos.insert(posicion, evento)
+        
+        duracion = evento.dia_fin - evento.dia_inicio
+        if duracion > self._duracion_maxima_dias:
+            self._duracion_maxima_dias = duracion
+    
+    def remover(self, evento) -> bool:
+        """
+        Quita un evento del calendario.
+        
+        Args:
+            evento: Evento a quitar
+            
+        Returns:
+            bool: True si se quitó, False si no estaba en el calendario
+        """
+        dia = evento.dia_inicio
+        
+        for posicion in range(bisect.bisect_left(self._dias, dia),
+                              bisect.bisect_right(self._dias, dia)):
+            if self._eventos[posicion] == evento:
+                del self._dias[posicion]
+                del self._eventos[posicion]
+                return True
+        
+        return False
+    
+    def limpiar(self) -> None:
+        """Vacía el calendario."""
+        self._dias.clear()
+        self._eventos.clear()
+        self._duracion_maxima_dias = 0
+    
+    def eventos_cercanos(self, fecha_inicio: datetime, fecha_fin: datetime,
+                         dias_descanso: int) -> List:
+        """
+        Obtiene los eventos que podrían chocar con un horario.
+        
+        Incluye todos los que se superponen con el horario o quedan a
+        menos de dias_descanso días de él (y quizá alguno más); el
+        resultado se revisa luego con buscar_conflicto_estadio.
+        
+        Args:
+            fecha_inicio: Fecha de inicio del horario
+            fecha_fin: Fecha de fin del horario
+            dias_descanso: Días mínimos de descanso del estadio
+            
+        Returns:
+            List: Eventos candidatos, ordenados por día de inicio
+        """
+        # Un evento que empieza antes solo choca si termina a menos de
+        # dias_descanso días del inicio; como mucho dura la duración máxima
+        desde = bisect.bisect_left(
+            self._dias,
+            fecha_inicio.toordinal() - dias_descanso + 1 - self._duracion_maxima_dias
+        )
+        hasta = bisect.bisect_right(
+            self._dias, fecha_fin.toordinal() + dias_descanso - 1, desde
+        )
+        
+        return self._eventos[desde:hasta]
+
+
 class Restriccion(ABC):
     """
     Clase base abstracta para las restricciones del sistema.
@@ -30,8 +376,15 @@ class Restriccion(ABC):
     Attributes:
         nombre (str): Nombre identificativo de la restricción
         descripcion (str): Descripción detallada de la restricción
+        costo (int): Costo relativo de validarla; las más baratas se
+                     evalúan primero en ValidadorRestricciones
     """
     
+    # Atributos fijos: sin __dict__ por instancia
+    __slots__ = ('nombre', 'descripcion')
+    
+    costo = 1
+    
     def __init__(self, nombre: str, descripcion: str = ""):
         """
         Inicializa una nueva restricción.
@@ -40,8 +393,10 @@ class Restriccion(ABC):
             nombre: Nombre identificativo de la restricción
             descripcion: Descripción detallada de la restricción
         """
-        self.nombre = nombre
-        self.descripcion = descripcion
+        # Los nombres se usan como claves (remover_restriccion, prefijo
+        # de los errores) y se repiten en cada instancia: se internan
+        self.nombre = sys.intern(nombre)
+        self.descripcion = sys.intern(descripcion)
     
     def __str__(self) -> str:
         """Representación en cadena de la restricción."""
@@ -53,7 +408,10 @@ class Restriccion(ABC):
     
     @abstractmethod
     def validar(self, recursos: List, fecha_inicio: datetime, 
-                fecha_fin: datetime, eventos_existentes: List) -> Tuple[bool, str]:
+                fecha_fin: datetime, eventos_existentes: List,
+                agenda_arbitros: Optional[AgendaArbitros] = None,
+                recursos_por_tipo: Optional[Tuple[List, List, List]] = None,
+                calendario_estadio: Optional[CalendarioEstadio] = None) -> Tuple[bool, MensajeValidacion]:
         """
         Valida si la restricción se cumple.
         
@@ -62,9 +420,17 @@ class Restriccion(ABC):
             fecha_inicio: Fecha de inicio del evento
             fecha_fin: Fecha de fin del evento
             eventos_existentes: Lista de eventos ya planificados
+            agenda_arbitros: Agenda de los árbitros con los eventos de
+                             eventos_existentes (opcional)
+            recursos_por_tipo: Árbitros agrupados por tipo como
+                               (principales, lineas, cuartos) (opcional)
+            calendario_estadio: Calendario del estadio con los eventos de
+                                eventos_existentes (opcional)
             
         Returns:
-            Tuple[bool, str]: (True, "") si es válido, (False, mensaje_error) si no
+            Tuple[bool, MensajeValidacion]: (True, "") si es válido,
+                (False, mensaje_error) si no; el mensaje puede ser un
+                MensajeDiferido, que se arma al convertirlo con str()
         """
         pass
 
@@ -93,6 +459,27 @@ class RestriccionCoRequisito(Restriccion):
     ARBITROS_LINEA_REQUERIDOS = 2
     CUARTOS_ARBITROS_REQUERIDOS = 1
     
+    __slots__ = ()
+    
+    # Solo cuenta los recursos del evento
+    costo = 1
+    
+    # Requisito por tipo de árbitro, en el orden de TipoArbitro (el mismo
+    # de recursos_por_tipo): (cantidad requerida, error si faltan, error
+    # si sobran). La parte fija de cada mensaje se arma una vez al definir
+    # la clase y la cantidad actual (%d) solo se completa si hay error
+    _REQUISITOS = (
+        (ARBITROS_PRINCIPALES_REQUERIDOS,
+         f"Se requiere {ARBITROS_PRINCIPALES_REQUERIDOS} árbitro principal (tiene %d)",
+         f"Solo se permite {ARBITROS_PRINCIPALES_REQUERIDOS} árbitro principal (tiene %d)"),
+        (ARBITROS_LINEA_REQUERIDOS,
+         f"Se requieren {ARBITROS_LINEA_REQUERIDOS} árbitros de línea (tiene %d)",
+         f"Solo se permiten {ARBITROS_LINEA_REQUERIDOS} árbitros de línea (tiene %d)"),
+        (CUARTOS_ARBITROS_REQUERIDOS,
+         f"Se requiere {CUARTOS_ARBITROS_REQUERIDOS} cuarto árbitro (tiene %d)",
+         f"Solo se permite {CUARTOS_ARBITROS_REQUERIDOS} cuarto árbitro (tiene %d)"),
+    )
+    
     def __init__(self):
         """Inicializa la restricción de co-requisito."""
         super().__init__(
@@ -106,7 +493,10 @@ class RestriccionCoRequisito(Restriccion):
         )
     
     def validar(self, recursos: List, fecha_inicio: datetime,
-                fecha_fin: datetime, eventos_existentes: List) -> Tuple[bool, str]:
+                fecha_fin: datetime, eventos_existentes: List,
+                agenda_arbitros: Optional[AgendaArbitros] = None,
+                recursos_por_tipo: Optional[Tuple[List, List, List]] = None,
+                calendario_estadio: Optional[CalendarioEstadio] = None) -> Tuple[bool, MensajeValidacion]:
         """
         Valida que estén todos los árbitros requeridos.
         
@@ -115,65 +505,33 @@ class RestriccionCoRequisito(Restriccion):
             fecha_inicio: Fecha de inicio del partido
             fecha_fin: Fecha de fin del partido
             eventos_existentes: Lista de eventos ya planificados (no usado aquí)
+            agenda_arbitros: Agenda de los árbitros (no usado aquí)
+            recursos_por_tipo: (principales, lineas, cuartos) ya agrupados
+                               (opcional); evita recorrer los recursos
+            calendario_estadio: Calendario del estadio (no usado aquí)
             
         Returns:
-            Tuple[bool, str]: (True, "") si el equipo está completo,
-                              (False, mensaje_error) si falta algún árbitro
+            Tuple[bool, MensajeValidacion]: (True, "") si el equipo está completo,
+                (False, mensaje_error) si falta algún árbitro
         """
-        # Importación local para evitar dependencia circular
-        from .recurso import Arbitro, TipoArbitro
-        
-        # Inicializar conteo de árbitros por tipo
-        conteo = {
-            TipoArbitro.PRINCIPAL: 0,
-            TipoArbitro.LINEA: 0,
-            TipoArbitro.CUARTO: 0
-        }
-        
-        # Contar árbitros por tipo
-        for recurso in recursos:
-            if isinstance(recurso, Arbitro):
-                if recurso.tipo in conteo:
-                    conteo[recurso.tipo] += 1
+        if recursos_por_tipo is not None:
+            # Árbitros ya agrupados: basta con el tamaño de cada grupo
+            conteo = [len(grupo) for grupo in recursos_por_tipo]
+        else:
+            # Contar árbitros por tipo, indexando por la posición del tipo
+            conteo = [0, 0, 0]
+            for recurso in recursos:
+                if isinstance(recurso, Arbitro):
+                    conteo[recurso.tipo.indice] += 1
         
-        # Validar cantidades requeridas
+        # Validar cada tipo contra su requisito en una sola pasada
         errores = []
         
-        # Validar árbitro principal
-        if conteo[TipoArbitro.PRINCIPAL] < self.ARBITROS_PRINCIPALES_REQUERIDOS:
-            errores.append(
-                f"Se requiere {self.ARBITROS_PRINCIPALES_REQUERIDOS} árbitro principal "
-                f"(tiene {conteo[TipoArbitro.PRINCIPAL]})"
-            )
-        elif conteo[TipoArbitro.PRINCIPAL] > self.ARBITROS_PRINCIPALES_REQUERIDOS:
-            errores.append(
-                f"Solo se permite {self.ARBITROS_PRINCIPALES_REQUERIDOS} árbitro principal "
-                f"(tiene {conteo[TipoArbitro.PRINCIPAL]})"
-            )
-        
-        # Validar árbitros de línea
-        if conteo[TipoArbitro.LINEA] < self.ARBITROS_LINEA_REQUERIDOS:
-            errores.append(
-                f"Se requieren {self.ARBITROS_LINEA_REQUERIDOS} árbitros de línea "
-                f"(tiene {conteo[TipoArbitro.LINEA]})"
-            )
-        elif conteo[TipoArbitro.LINEA] > self.ARBITROS_LINEA_REQUERIDOS:
-            errores.append(
-                f"Solo se permiten {self.ARBITROS_LINEA_REQUERIDOS} árbitros de línea "
-                f"(tiene {conteo[TipoArbitro.LINEA]})"
-            )
-        
-        # Validar cuarto árbitro
-        if conteo[TipoArbitro.CUARTO] < self.CUARTOS_ARBITROS_REQUERIDOS:
-            errores.append(
-                f"Se requiere {self.CUARTOS_ARBITROS_REQUERIDOS} cuarto árbitro "
-                f"(tiene {conteo[TipoArbitro.CUARTO]})"
-            )
-        elif conteo[TipoArbitro.CUARTO] > self.CUARTOS_ARBITROS_REQUERIDOS:
-            errores.append(
-                f"Solo se permite {self.CUARTOS_ARBITROS_REQUERIDOS} cuarto árbitro "
-                f"(tiene {conteo[TipoArbitro.CUARTO]})"
-            )
+        for cantidad, (requeridos, error_falta, error_sobra) in zip(
+                conteo, self._REQUISITOS):
+            if cantidad != requeridos:
+                plantilla = error_falta if cantidad < requeridos else error_sobra
+                errores.append(plantilla % cantidad)
         
         # Retornar resultado
         if errores:
@@ -204,6 +562,11 @@ class RestriccionExclusionMutua(Restriccion):
         ...     print(f"Error: {mensaje}")
     """
     
+    __slots__ = ('dias_descanso',)
+    
+    # Consulta los eventos de cada árbitro asignado
+    costo = 3
+    
     def __init__(self, dias_descanso: int = 7):
         """
         Inicializa la restricción de exclusión mutua.
@@ -218,71 +581,119 @@ class RestriccionExclusionMutua(Restriccion):
         self.dias_descanso = dias_descanso
     
     def validar(self, recursos: List, fecha_inicio: datetime,
-                fecha_fin: datetime, eventos_existentes: List) -> Tuple[bool, str]:
+                fecha_fin: datetime, eventos_existentes: List,
+                agenda_arbitros: Optional[AgendaArbitros] = None,
+                recursos_por_tipo: Optional[Tuple[List, List, List]] = None,
+                calendario_estadio: Optional[CalendarioEstadio] = None) -> Tuple[bool, MensajeValidacion]:
         """
         Valida que los árbitros tengan suficiente descanso entre partidos.
         
+        Con agenda_arbitros solo se revisan los partidos de cada árbitro
+        que caen dentro del período de descanso, localizados por búsqueda
+        binaria, en lugar de recorrer todos los partidos por cada árbitro.
+        
         Args:
             recursos: Lista de recursos (árbitros) a asignar
             fecha_inicio: Fecha de inicio del nuevo partido
             fecha_fin: Fecha de fin del nuevo partido
             eventos_existentes: Lista de partidos ya planificados
+            agenda_arbitros: Agenda de los árbitros con los partidos de
+                             eventos_existentes (opcional)
+            recursos_por_tipo: Árbitros agrupados por tipo (no usado aquí)
+            calendario_estadio: Calendario del estadio (no usado aquí)
             
         Returns:
-            Tuple[bool, str]: (True, "") si todos los árbitros están disponibles,
-                              (False, mensaje_error) si alguno no tiene suficiente descanso
+            Tuple[bool, MensajeValidacion]: (True, "") si todos los árbitros
+                están disponibles, (False, mensaje_error) si alguno no tiene
+                suficiente descanso (MensajeDiferido: se arma con str())
         """
-        # Importación local para evitar dependencia circular
-        from .recurso import Arbitro
-        
-        errores = []
+        conflictos = []
+        dia = fecha_inicio.toordinal()
         
         # Verificar cada árbitro
         for recurso in recursos:
             if isinstance(recurso, Arbitro):
-                # Buscar partidos donde participa este árbitro
-                for evento in eventos_existentes:
-                    # Verificar si el árbitro está en este evento
-                    arbitro_en_evento = any(
-                        r.id == recurso.id for r in evento.recursos
+                # Partidos de este árbitro dentro del período de descanso
+                for evento in self._eventos_cercanos(
+                        recurso.id, dia, eventos_existentes, agenda_arbitros):
+                    conflictos.append(
+                        (recurso, evento, abs(dia - evento.dia_inicio))
                     )
-                    
-                    if arbitro_en_evento:
-                        # Calcular días de diferencia entre partidos
-                        dias_diferencia = self._calcular_dias_diferencia(
-                            fecha_inicio, evento.fecha_inicio
-                        )
-                        
-                        # Verificar si cumple con el descanso mínimo
-                        if dias_diferencia < self.dias_descanso:
-                            errores.append(
-                                f"{recurso.nombre} no tiene suficiente descanso. "
-                                f"Tiene partido el {evento.fecha_inicio.strftime('%d/%m/%Y')} "
-                                f"({dias_diferencia} días de diferencia, "
-                                f"mínimo requerido: {self.dias_descanso} días)"
-                            )
         
-        # Retornar resultado
-        if errores:
-            return False, "; ".join(errores)
+        # Retornar resultado (el texto se arma solo si se lee)
+        if conflictos:
+            return False, MensajeDiferido(self._formatear_conflictos, conflictos)
         
         return True, ""
     
-    def _calcular_dias_diferencia(self, fecha1: datetime, fecha2: datetime) -> int:
+    def _formatear_conflictos(self, conflictos: List[Tuple]) -> str:
+        """
+        Arma el mensaje de error de los árbitros sin descanso suficiente.
+        
+        Args:
+            conflictos: Tuplas (árbitro, partido cercano, días de diferencia)
+            
+        Returns:
+            str: Un motivo por conflicto, separados por "; "
+        """
+        return "; ".join(
+            f"{recurso.nombre} no tiene suficiente descanso. "
+            f"Tiene partido el {evento.texto_fecha} "
+            f"({dias_diferencia} días de diferencia, "
+            f"mínimo requerido: {self.dias_descanso} días)"
+            for recurso, evento, dias_diferencia in conflictos
+        )
+    
+    def _eventos_cercanos(self, arbitro_id: str, dia: int,
+                          eventos_existentes: List,
+                          agenda_arbitros: Optional[AgendaArbitros] = None) -> List:
+        """
+        Obtiene los partidos de un árbitro que no respetan el descanso mínimo.
+        
+        Args:
+            arbitro_id: ID del árbitro
+            dia: Día del nuevo partido (ordinal de la fecha)
+            eventos_existentes: Lista de partidos ya planificados
+            agenda_arbitros: Agenda de los árbitros (opcional)
+            
+        Returns:
+            List: Partidos del árbitro a menos de dias_descanso días
+        """
+        if agenda_arbitros is not None:
+            return agenda_arbitros.eventos_cercanos(arbitro_id, dia, self.dias_descanso)
+        
+        return [
+            evento for evento in eventos_existentes
+            if evento.contiene_recurso(arbitro_id) and
+            abs(dia - evento.dia_inicio) < self.dias_descanso
+        ]
+    
+    def validar_rapido(self, recursos: List, fecha_inicio: datetime,
+                       bloqueos) -> bool:
         """
-        Calcula la diferencia absoluta en días entre dos fechas.
+        Comprueba el descanso de los árbitros contra días bloqueados precalculados.
+        
+        Cada partido bloquea, para cada uno de sus árbitros, los días a
+        menos de dias_descanso de su fecha; validar se reduce entonces a
+        una consulta por árbitro. No arma mensajes: ante un conflicto se
+        puede usar validar para obtener el detalle.
         
         Args:
-            fecha1: Primera fecha
-            fecha2: Segunda fecha
+            recursos: Lista de recursos (árbitros) a asignar
+            fecha_inicio: Fecha del nuevo partido
+            bloqueos: Contenedor de pares (arbitro_id, dia_ordinal)
+                      bloqueados, calculado con este mismo dias_descanso
             
         Returns:
-            int: Diferencia absoluta en días
+            bool: True si ningún árbitro tiene bloqueado el día
         """
-        return abs((fecha1.date() - fecha2.date()).days)
+        dia = fecha_inicio.toordinal()
+        return not any((recurso.id, dia) in bloqueos for recurso in recursos)
     
     def verificar_disponibilidad_arbitro(self, arbitro, fecha_inicio: datetime,
-                                          eventos_existentes: List) -> Tuple[bool, str]:
+                                          eventos_existentes: List,
+                                          agenda_arbitros: Optional[AgendaArbitros] = None
+                                          ) -> Tuple[bool, MensajeValidacion]:
         """
         Verifica si un árbitro específico está disponible para una fecha.
         
@@ -290,29 +701,40 @@ class RestriccionExclusionMutua(Restriccion):
             arbitro: Árbitro a verificar
             fecha_inicio: Fecha del nuevo partido
             eventos_existentes: Lista de partidos ya planificados
+            agenda_arbitros: Agenda de los árbitros (opcional)
             
         Returns:
-            Tuple[bool, str]: (True, "") si está disponible,
-                              (False, mensaje) con el motivo si no lo está
+            Tuple[bool, MensajeValidacion]: (True, "") si está disponible,
+                (False, mensaje) con el motivo si no lo está
+                (MensajeDiferido: se arma con str())
         """
-        for evento in eventos_existentes:
-            # Verificar si el árbitro está en este evento
-            arbitro_en_evento = any(
-                r.id == arbitro.id for r in evento.recursos
+        dia = fecha_inicio.toordinal()
+        
+        for evento in self._eventos_cercanos(
+                arbitro.id, dia, eventos_existentes, agenda_arbitros):
+            return False, MensajeDiferido(
+                self._formatear_partido_asignado,
+                evento, abs(dia - evento.dia_inicio)
             )
-            
-            if arbitro_en_evento:
-                dias_diferencia = self._calcular_dias_diferencia(
-                    fecha_inicio, evento.fecha_inicio
-                )
-                
-                if dias_diferencia < self.dias_descanso:
-                    return False, (
-                        f"Partido asignado el {evento.fecha_inicio.strftime('%d/%m/%Y')} "
-                        f"({dias_diferencia} días de diferencia)"
-                    )
         
         return True, ""
+    
+    @staticmethod
+    def _formatear_partido_asignado(evento, dias_diferencia: int) -> str:
+        """
+        Arma el motivo por el que un árbitro no está disponible.
+        
+        Args:
+            evento: Partido del árbitro dentro del período de descanso
+            dias_diferencia: Días entre ese partido y el consultado
+            
+        Returns:
+            str: Mensaje con la fecha del partido asignado
+        """
+        return (
+            f"Partido asignado el {evento.texto_fecha} "
+            f"({dias_diferencia} días de diferencia)"
+        )
 
 
 class RestriccionDescansoEstadio(Restriccion):
@@ -327,6 +749,11 @@ class RestriccionDescansoEstadio(Restriccion):
         dias_descanso (int): Días mínimos de descanso del estadio
     """
     
+    __slots__ = ('dias_descanso',)
+    
+    # Recorre los eventos una vez, con comparaciones de enteros
+    costo = 2
+    
     def __init__(self, dias_descanso: int = 2):
         """
         Inicializa la restricción de descanso del estadio.
@@ -341,7 +768,10 @@ class RestriccionDescansoEstadio(Restriccion):
         self.dias_descanso = dias_descanso
     
     def validar(self, recursos: List, fecha_inicio: datetime,
-                fecha_fin: datetime, eventos_existentes: List) -> Tuple[bool, str]:
+                fecha_fin: datetime, eventos_existentes: List,
+                agenda_arbitros: Optional[AgendaArbitros] = None,
+                recursos_por_tipo: Optional[Tuple[List, List, List]] = None,
+                calendario_estadio: Optional[CalendarioEstadio] = None) -> Tuple[bool, MensajeValidacion]:
         """
         Valida que el estadio tenga suficiente descanso entre partidos.
         
@@ -350,40 +780,58 @@ class RestriccionDescansoEstadio(Restriccion):
             fecha_inicio: Fecha de inicio del nuevo partido
             fecha_fin: Fecha de fin del nuevo partido
             eventos_existentes: Lista de partidos ya planificados
+            agenda_arbitros: Agenda de los árbitros (no usado aquí)
+            recursos_por_tipo: Árbitros agrupados por tipo (no usado aquí)
+            calendario_estadio: Calendario del estadio con los partidos de
+                                eventos_existentes (opcional); limita la
+                                revisión a los partidos cercanos
             
         Returns:
-            Tuple[bool, str]: (True, "") si hay suficiente descanso,
-                              (False, mensaje_error) si no lo hay
-        """
-        for evento in eventos_existentes:
-            # Verificar superposición directa
-            if evento.se_superpone_con(fecha_inicio, fecha_fin):
-                return False, (
-                    f"Conflicto de horario: Ya existe el partido '{evento.nombre}' "
-                    f"programado para {evento.fecha_inicio.strftime('%d/%m/%Y %H:%M')}"
-                )
-            
-            # Calcular días de diferencia
-            dias_antes = (fecha_inicio.date() - evento.fecha_fin.date()).days
-            dias_despues = (evento.fecha_inicio.date() - fecha_fin.date()).days
-            
-            # Verificar descanso antes del partido existente
-            if 0 <= dias_antes < self.dias_descanso:
-                return False, (
-                                        f"El estadio necesita {self.dias_descanso} días de descanso. "
-                    f"Hay un partido el {evento.fecha_inicio.strftime('%d/%m/%Y')} "
-                    f"(solo {dias_antes} día(s) de diferencia)"
-                )
+            Tuple[bool, MensajeValidacion]: (True, "") si hay suficiente
+                descanso, (False, mensaje_error) si no lo hay
+                (MensajeDiferido: se arma con str())
+        """
+        if calendario_estadio is not None:
+            eventos_existentes = calendario_estadio.eventos_cercanos(
+                fecha_inicio, fecha_fin, self.dias_descanso
+            )
+        
+        evento, dias_diferencia = buscar_conflicto_estadio(
+            eventos_existentes, fecha_inicio, fecha_fin, self.dias_descanso
+        )
+        
+        if evento is None:
+            return True, ""
+        
+        # El texto se arma solo si se lee
+        return False, MensajeDiferido(
+            self._formatear_conflicto, evento, dias_diferencia
+        )
+    
+    def _formatear_conflicto(self, evento, dias_diferencia: Optional[int]) -> str:
+        """
+        Arma el mensaje de error de un conflicto con otro partido.
+        
+        Args:
+            evento: Partido con el que se produce el conflicto
+            dias_diferencia: Días de diferencia, o None si se superponen
             
-            # Verificar descanso después del partido existente
-            if 0 <= dias_despues < self.dias_descanso:
-                return False, (
-                    f"El estadio necesita {self.dias_descanso} días de descanso. "
-                    f"Hay un partido el {evento.fecha_inicio.strftime('%d/%m/%Y')} "
-                    f"(solo {dias_despues} día(s) de diferencia)"
-                )
+        Returns:
+            str: Mensaje de error
+        """
+        # Superposición directa
+        if dias_diferencia is None:
+            return (
+                f"Conflicto de horario: Ya existe el partido '{evento.nombre}' "
+                f"programado para {evento.texto_inicio}"
+            )
         
-        return True, ""
+        # Descanso insuficiente antes o después del partido existente
+        return (
+            f"El estadio necesita {self.dias_descanso} días de descanso. "
+            f"Hay un partido el {evento.texto_fecha} "
+            f"(solo {dias_diferencia} día(s) de diferencia)"
+        )
 
 
 class ValidadorRestricciones:
@@ -394,7 +842,7 @@ class ValidadorRestricciones:
     en una sola llamada.
     
     Attributes:
-        restricciones (List[Restriccion]): Lista de restricciones a validar
+        restricciones (List[Restriccion]): Restricciones a validar, ordenadas por costo
     
     Example:
         >>> validador = ValidadorRestricciones()
@@ -406,15 +854,34 @@ class ValidadorRestricciones:
     def __init__(self):
         """Inicializa el validador sin restricciones."""
         self.restricciones: List[Restriccion] = []
+        # Por cada restricción, en el mismo orden: (prefijo del error,
+        # método validar ya ligado), para no resolverlos en cada validación
+        self._validaciones: List[Tuple[str, Callable]] = []
+        # Posición en restricciones de la primera restricción con cada nombre
+        self._posiciones: Dict[str, int] = {}
+        # Copia de solo lectura para obtener_restricciones (None: por armar)
+        self._restricciones_tupla: Optional[Tuple[Restriccion, ...]] = None
     
     def agregar_restriccion(self, restriccion: Restriccion) -> None:
         """
         Agrega una restricción al validador.
         
+        Las restricciones se mantienen ordenadas por costo (las de igual
+        costo, en orden de agregado), de modo que las más baratas se
+        validan primero.
+        
         Args:
             restriccion: Restricción a agregar
         """
-        self.restricciones.append(restriccion)
+        posicion = len(self.restricciones)
+        while posicion > 0 and self.restricciones[posicion - 1].costo > restriccion.costo:
+            posicion -= 1
+        self.restricciones.insert(posicion, restriccion)
+        self._validaciones.insert(
+            posicion, (f"[{restriccion.nombre}] ", restriccion.validar)
+        )
+        self._indexar_nombres()
+        self._restricciones_tupla = None
     
     def remover_restriccion(self, nombre: str) -> bool:
         """
@@ -426,49 +893,116 @@ class ValidadorRestricciones:
         Returns:
             bool: True si se removió, False si no existía
         """
+        posicion = self._posiciones.get(nombre)
+        if posicion is None:
+            return False
+        
+        self.restricciones.pop(posicion)
+        self._validaciones.pop(posicion)
+        self._indexar_nombres()
+        self._restricciones_tupla = None
+        return True
+    
+    def _indexar_nombres(self) -> None:
+        """
+        Reconstruye el índice de posiciones por nombre.
+        
+        Las restricciones deben seguir ordenadas por costo, así que al
+        agregar o quitar una se desplazan las siguientes y sus posiciones
+        se recalculan (solo ocurre al reconfigurar el validador).
+        """
+        posiciones = {}
         for i, restriccion in enumerate(self.restricciones):
-            if restriccion.nombre == nombre:
-                self.restricciones.pop(i)
-                return True
-        return False
+            posiciones.setdefault(restriccion.nombre, i)
+        self._posiciones = posiciones
     
-    def obtener_restricciones(self) -> List[Restriccion]:
+    def obtener_restricciones(self) -> Tuple[Restriccion, ...]:
         """
-        Obtiene la lista de restricciones configuradas.
+        Obtiene las restricciones configuradas.
+        
+        La tupla se arma una vez y se reutiliza hasta que se agregue o
+        quite una restricción.
         
         Returns:
-            List[Restriccion]: Lista de restricciones
+            Tuple[Restriccion, ...]: Restricciones, ordenadas por costo
         """
-        return self.restricciones.copy()
+        if self._restricciones_tupla is None:
+            self._restricciones_tupla = tuple(self.restricciones)
+        return self._restricciones_tupla
     
     def validar_todas(self, recursos: List, fecha_inicio: datetime,
                       fecha_fin: datetime, 
-                      eventos_existentes: List) -> Tuple[bool, List[str]]:
+                      eventos_existentes: List,
+                      agenda_arbitros: Optional[AgendaArbitros] = None,
+                      recursos_por_tipo: Optional[Tuple[List, List, List]] = None,
+                      calendario_estadio: Optional[CalendarioEstadio] = None,
+                      short_circuit: bool = False) -> Tuple[bool, List[MensajeValidacion]]:
         """
-        Valida todas las restricciones configuradas.
+        Valida todas las restricciones configuradas, de la más barata
+        a la más costosa.
         
         Args:
             recursos: Lista de recursos a validar
             fecha_inicio: Fecha de inicio del evento
             fecha_fin: Fecha de fin del evento
             eventos_existentes: Lista de eventos ya planificados
+            agenda_arbitros: Agenda de los árbitros (opcional)
+            recursos_por_tipo: Árbitros del evento agrupados por tipo (opcional)
+            calendario_estadio: Calendario del estadio (opcional)
+            short_circuit: Si es True, se detiene en la primera restricción
+                           que falla (útil cuando solo importa saber si el
+                           candidato es válido)
             
         Returns:
-            Tuple[bool, List[str]]: (True, []) si todas las restricciones se cumplen,
-                                    (False, [lista_de_errores]) si alguna falla
+            Tuple[bool, List[MensajeValidacion]]: (True, []) si todas las
+                restricciones se cumplen, (False, [lista_de_errores]) si
+                alguna falla. Los errores pueden ser MensajeDiferido: el
+                texto se arma recién al convertirlos con str() para
+                mostrarlos
         """
         errores = []
         
-        for restriccion in self.restricciones:
-            es_valido, mensaje = restriccion.validar(
-                recursos, fecha_inicio, fecha_fin, eventos_existentes
+        for prefijo, validar in self._validaciones:
+            es_valido, mensaje = validar(
+                recursos, fecha_inicio, fecha_fin, eventos_existentes,
+                agenda_arbitros, recursos_por_tipo, calendario_estadio
             )
             
             if not es_valido:
-                errores.append(f"[{restriccion.nombre}] {mensaje}")
+                # Un mensaje diferido sigue diferido, ahora con el prefijo
+                if isinstance(mensaje, MensajeDiferido):
+                    errores.append(MensajeDiferido(_anteponer, prefijo, mensaje))
+                else:
+                    errores.append(prefijo + mensaje)
+                if short_circuit:
+                    return False, errores
         
         return len(errores) == 0, errores
     
+    def validar_lote(self, candidatos: Iterable[Tuple[List, datetime, datetime]],
+                     eventos_existentes: List) -> List[Tuple[bool, List[MensajeValidacion]]]:
+        """
+        Valida varios candidatos independientes contra el mismo calendario.
+        
+        Cada candidato es una tupla (recursos, fecha_inicio, fecha_fin).
+        La agenda de árbitros y el calendario del estadio se arman una sola
+        vez para todo el lote.
+        
+        Args:
+            candidatos: Tuplas (recursos, fecha_inicio, fecha_fin)
+            eventos_existentes: Eventos ya planificados (no cambian durante el lote)
+            
+        Returns:
+            List[Tuple[bool, List[MensajeValidacion]]]: Un resultado de validar_todas por
+                                          candidato, en el mismo orden
+        """
+        agenda, calendario = _indexar_lote(eventos_existentes)
+        return [
+            self.validar_todas(recursos, fecha_inicio, fecha_fin,
+                               eventos_existentes, agenda, None, calendario)
+            for recursos, fecha_inicio, fecha_fin in candidatos
+        ]
+    
     def __str__(self) -> str:
         """Representación en cadena del validador."""
         nombres = [r.nombre for r in self.restricciones]
@@ -479,6 +1013,68 @@ class ValidadorRestricciones:
 # FUNCIONES DE UTILIDAD
 # =============================================================================
 
+def _indexar_lote(eventos: List) -> Tuple[AgendaArbitros, CalendarioEstadio]:
+    """
+    Arma la agenda de árbitros y el calendario del estadio de un lote.
+    
+    Args:
+        eventos: Eventos ya planificados
+        
+    Returns:
+        Tuple[AgendaArbitros, CalendarioEstadio]: Índices de los eventos
+    """
+    calendario = CalendarioEstadio()
+    for evento in eventos:
+        calendario.agregar(evento)
+    
+    return AgendaArbitros.desde_eventos(eventos), calendario
+
+
+def buscar_conflicto_estadio(eventos: Iterable, fecha_inicio: datetime,
+                             fecha_fin: datetime,
+                             dias_descanso: int) -> Tuple[Optional['Evento'], Optional[int]]:
+    """
+    Busca el primer evento que impide usar el estadio en un horario.
+    
+    Compara solo enteros (marcas de tiempo y días ordinales) calculados
+    una vez para el horario consultado; los mensajes de error los arma
+    quien llama, a partir del evento devuelto.
+    
+    Args:
+        eventos: Eventos ya planificados
+        fecha_inicio: Fecha de inicio del horario consultado
+        fecha_fin: Fecha de fin del horario consultado
+        dias_descanso: Días mínimos de descanso del estadio
+        
+    Returns:
+        Tuple: (None, None) si el estadio está libre,
+               (evento, None) si el horario se superpone con el evento,
+               (evento, dias) si no se respeta el descanso, con los días
+               de diferencia
+    """
+    ts_inicio = marca_tiempo(fecha_inicio)
+    ts_fin = marca_tiempo(fecha_fin)
+    dia_inicio = fecha_inicio.toordinal()
+    dia_fin = fecha_fin.toordinal()
+    
+    for evento in eventos:
+        # Verificar superposición directa
+        if evento.se_superpone_ts(ts_inicio, ts_fin):
+            return evento, None
+        
+        # Verificar descanso antes del partido existente
+        dias_antes = dia_inicio - evento.dia_fin
+        if 0 <= dias_antes < dias_descanso:
+            return evento, dias_antes
+        
+        # Verificar descanso después del partido existente
+        dias_despues = evento.dia_inicio - dia_fin
+        if 0 <= dias_despues < dias_descanso:
+            return evento, dias_despues
+    
+    return None, None
+
+
 def crear_validador_estadio() -> ValidadorRestricciones:
     """
     Crea un validador preconfigurado con las restricciones del Etihad Stadium.
@@ -505,12 +1101,17 @@ def crear_validador_estadio() -> ValidadorRestricciones:
     return validador
 
 
-def verificar_equipo_arbitral_completo(recursos: List) -> Tuple[bool, dict]:
+def verificar_equipo_arbitral_completo(recursos: List,
+                                       recursos_por_tipo: Optional[Tuple[List, List, List]] = None
+                                       ) -> Tuple[bool, dict]:
     """
     Verifica si una lista de recursos contiene un equipo arbitral completo.
     
     Args:
         recursos: Lista de recursos a verificar
+        recursos_por_tipo: (principales, lineas, cuartos) ya agrupados
+                           (opcional, p. ej. Evento.arbitros_por_tipo());
+                           evita recorrer los recursos
         
     Returns:
         Tuple[bool, dict]: (True/False, diccionario con conteo por tipo)
@@ -520,22 +1121,24 @@ def verificar_equipo_arbitral_completo(recursos: List) -> Tuple[bool, dict]:
         >>> print(f"Equipo completo: {completo}")
         >>> print(f"Principales: {conteo['principal']}")
     """
-    from .recurso import Arbitro, TipoArbitro
-    
-    conteo = {
-        'principal': 0,
-        'linea': 0,
-        'cuarto': 0
-    }
-    
-    for recurso in recursos:
-        if isinstance(recurso, Arbitro):
-            if recurso.tipo == TipoArbitro.PRINCIPAL:
-                conteo['principal'] += 1
-            elif recurso.tipo == TipoArbitro.LINEA:
-                conteo['linea'] += 1
-            elif recurso.tipo == TipoArbitro.CUARTO:
-                conteo['cuarto'] += 1
+    if recursos_por_tipo is not None:
+        principales, lineas, cuartos = recursos_por_tipo
+        conteo = {
+            'principal': len(principales),
+            'linea': len(lineas),
+            'cuarto': len(cuartos)
+        }
+    else:
+        cantidades = [0, 0, 0]
+        for recurso in recursos:
+            if isinstance(recurso, Arbitro):
+                cantidades[recurso.tipo.indice] += 1
+        
+        conteo = {
+            'principal': cantidades[TipoArbitro.PRINCIPAL.indice],
+            'linea': cantidades[TipoArbitro.LINEA.indice],
+            'cuarto': cantidades[TipoArbitro.CUARTO.indice]
+        }
     
     equipo_completo = (
         conteo['principal'] == RestriccionCoRequisito.ARBITROS_PRINCIPALES_REQUERIDOS and
@@ -9,12 +9,29 @@ Este módulo contiene los servicios del sistema:
 =============================================================================
 """
 
-from .planificador import PlanificadorEventos
-from .validador import Validador
-from .persistencia import GestorPersistencia
+import importlib
 
-__all__ = [
-    'PlanificadorEventos',
-    'Validador',
-    'GestorPersistencia'
-]
\ No newline at end of file
+# Submódulo que define cada nombre exportado, importado la primera vez
+# que se pide (PEP 562): así usar el planificador no carga también la
+# persistencia, que solo hace falta al guardar o cargar datos.
+_SUBMODULOS = {
+    'PlanificadorEventos': '.planificador',
+    'Validador': '.validador',
+    'GestorPersistencia': '.persistencia'
+}
+
+__all__ = list(_SUBMODULOS)
+
+
+def __getattr__(nombre: str):
+    """Importa bajo demanda el submódulo que define un nombre exportado."""
+    if nombre not in _SUBMODULOS:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    
+    valor = getattr(importlib.import_module(_SUBMODULOS[nombre], __name__), nombre)
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
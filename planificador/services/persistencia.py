@@ -3,17 +3,50 @@
 MÓDULO PERSISTENCIA - PLANIFICADOR DE EVENTOS ETIHAD STADIUM
 =============================================================================
 Servicio de persistencia de datos.
-Gestiona el guardado y carga de datos desde archivos JSON.
+Gestiona el guardado y carga de datos desde archivos JSON o, para copias
+internas, en un formato binario más compacto y rápido.
+
+Por defecto los archivos JSON se guardan indentados con 4 espacios, para
+leerlos a mano; con guardar(..., compacto=True) se escriben en una sola
+línea, más chica y más rápida de generar. La carga acepta ambos.
 =============================================================================
 """
 
 import json
 import os
+import pickle
+import shutil
 from datetime import datetime
-from typing import Tuple, Any, Optional, Dict
+from typing import (Tuple, Any, BinaryIO, Callable, Optional, Dict, Iterable,
+                    Iterator, List)
+
+from ..models.evento import Evento, Partido
+from ..models.recurso import Recurso, Arbitro, TipoArbitro
+from .planificador import PlanificadorEventos
+
+
+# Codificador JSON reutilizado en cada guardado (json.dumps con opciones
+# no predeterminadas crea uno nuevo por llamada)
+_CODIFICADOR_JSON = json.JSONEncoder(ensure_ascii=False)
 
-from models.evento import Evento, Partido
-from models.recurso import Recurso, Arbitro, TipoArbitro
+# Variante indentada (formato por defecto de los archivos de datos)
+_CODIFICADOR_JSON_LEGIBLE = json.JSONEncoder(ensure_ascii=False, indent=4)
+
+
+class _LectorBinario(pickle.Unpickler):
+    """
+    Lector del formato binario que solo acepta tipos básicos.
+    
+    Los datos guardados son diccionarios, listas, textos y números, que
+    pickle reconstruye sin buscar clases. Rechazar cualquier otra clase
+    impide que un archivo manipulado ejecute código al cargarse.
+    """
+    
+    def find_class(self, modulo: str, nombre: str):
+        """Rechaza toda clase que el archivo pida reconstruir."""
+        raise pickle.UnpicklingError(
+            f"Tipo no permitido en el archivo de datos: {modulo}.{nombre}"
+        )
 
 
 class GestorPersistencia:
@@ -26,6 +59,7 @@ class GestorPersistencia:
     Attributes:
         VERSION (str): Versión del formato de datos
         ENCODING (str): Codificación de archivos
+        EXTENSION_BINARIA (str): Extensión de los archivos en formato binario
     
     Example:
         >>> gestor = GestorPersistencia()
@@ -41,21 +75,56 @@ class GestorPersistencia:
     VERSION = "1.0"
     ENCODING = "utf-8"
     
+    # Formatos de archivo: JSON (legible, para intercambio) o binario
+    # (copias internas); sin indicarlo se elige por la extensión
+    FORMATO_JSON = "json"
+    FORMATO_BINARIO = "binario"
+    EXTENSION_BINARIA = ".pickle"
+    
+    # Sufijo del archivo auxiliar con el resumen de cada archivo de datos
+    SUFIJO_METADATOS = ".meta"
+    
     def __init__(self):
         """Inicializa el gestor de persistencia."""
-        pass
+        # Conversión a diccionario según la clase exacta de cada objeto;
+        # las subclases se resuelven una vez (ver _conversor_para)
+        self._conversores_recurso: Dict[type, Callable[[Any], Dict]] = {
+            Arbitro: self._arbitro_a_dict,
+            Recurso: self._recurso_a_dict
+        }
+        self._conversores_evento: Dict[type, Callable[[Any], Dict]] = {
+            Partido: self._partido_a_dict,
+            Evento: self._evento_a_dict
+        }
+        # Y a la inversa, constructor según el campo de tipo guardado
+        # (un tipo desconocido se carga como la clase base)
+        self._constructores_recurso: Dict[str, Callable[[Dict], Recurso]] = {
+            'Arbitro': self._construir_arbitro,
+            'Recurso': self._construir_recurso
+        }
+        self._constructores_evento: Dict[str, Callable[..., Evento]] = {
+            'Partido': self._construir_partido,
+            'Evento': self._construir_evento
+        }
     
     # =========================================================================
     # GUARDADO DE DATOS
     # =========================================================================
     
-    def guardar(self, planificador, ruta_archivo: str) -> Tuple[bool, str]:
+    def guardar(self, planificador, ruta_archivo: str,
+                formato: Optional[str] = None,
+                compacto: bool = False) -> Tuple[bool, str]:
         """
-        Guarda el estado del planificador en un archivo JSON.
+        Guarda el estado del planificador en un archivo JSON o binario.
         
         Args:
             planificador: Instancia del PlanificadorEventos a guardar
             ruta_archivo: Ruta del archivo donde guardar
+            formato: FORMATO_JSON o FORMATO_BINARIO (default: según la
+                     extensión del archivo)
+            compacto: En JSON, si es True se escribe en una sola línea
+                      (más chico y más rápido de escribir); por defecto se
+                      indenta para leerlo a mano
             
         Returns:
             Tuple[bool, str]: (True, mensaje_exito) o (False, mensaje_error)
@@ -67,15 +136,34 @@ class GestorPersistencia:
         try:
             # Crear directorio si no existe
             directorio = os.path.dirname(ruta_archivo)
-            if directorio and not os.path.exists(directorio):
-                os.makedirs(directorio)
+            if directorio:
+                os.makedirs(directorio, exist_ok=True)
             
-            # Construir estructura de datos
-            datos = self._construir_datos_guardado(planificador)
+            formato = self._resolver_formato(ruta_archivo, formato)
             
-            # Guardar en archivo
-            with open(ruta_archivo, 'w', encoding=self.ENCODING) as archivo:
-                json.dump(datos, archivo, indent=4, ensure_ascii=False)
+            if formato == self.FORMATO_JSON and compacto:
+                # JSON compacto: cada registro se codifica y se escribe por
+                # separado, sin armar el documento completo en memoria
+                metadata = self._construir_metadatos()
+                self._escribir_atomico(
+                    ruta_archivo,
+                    lambda archivo: self._escribir_json_por_registros(
+                        archivo, metadata, planificador
+                    )
+                )
+            else:
+                # Construir estructura de datos y serializarla en memoria
+                datos = self._construir_datos_guardado(planificador)
+                metadata = datos['metadata']
+                contenido = self._serializar(datos, formato, compacto)
+                self._escribir_atomico(
+                    ruta_archivo, lambda archivo: archivo.write(contenido)
+                )
+            
+            self._guardar_metadatos(
+                ruta_archivo, metadata,
+                len(planificador.recursos), len(planificador.eventos)
+            )
             
             return True, (
                 f"Datos guardados exitosamente en '{ruta_archivo}'. "
@@ -90,6 +178,190 @@ class GestorPersistencia:
         except Exception as e:
             return False, f"Error inesperado al guardar: {str(e)}"
     
+    def _resolver_formato(self, ruta_archivo: str, formato: Optional[str]) -> str:
+        """
+        Determina el formato de un archivo de datos.
+        
+        Args:
+            ruta_archivo: Ruta del archivo
+            formato: Formato pedido, o None para deducirlo de la extensión
+            
+        Returns:
+            str: FORMATO_JSON o FORMATO_BINARIO
+            
+        Raises:
+            ValueError: Si el formato pedido no existe
+        """
+        if formato is None:
+            if ruta_archivo.endswith(self.EXTENSION_BINARIA):
+                return self.FORMATO_BINARIO
+            return self.FORMATO_JSON
+        
+        if formato not in (self.FORMATO_JSON, self.FORMATO_BINARIO):
+            raise ValueError(f"Formato de datos desconocido: '{formato}'")
+        
+        return formato
+    
+    def _serializar(self, datos: Dict, formato: str,
+                    compacto: bool = False) -> bytes:
+        """
+        Convierte los datos a bytes en el formato indicado.
+        
+        Args:
+            datos: Estructura de datos a guardar
+            formato: FORMATO_JSON o FORMATO_BINARIO
+            compacto: En JSON, False para indentar el resultado
+            
+        Returns:
+            bytes: Contenido del archivo
+        """
+        if formato == self.FORMATO_BINARIO:
+            return pickle.dumps(datos, protocol=pickle.HIGHEST_PROTOCOL)
+        
+        # Sin indentación json usa su codificador en C (con indent usa el
+        # de Python puro): la versión compacta es la más rápida
+        codificador = _CODIFICADOR_JSON if compacto else _CODIFICADOR_JSON_LEGIBLE
+        return codificador.encode(datos).encode(self.ENCODING)
+    
+    def _escribir_json_por_registros(self, archivo: BinaryIO, metadata: Dict,
+                                     planificador):
+        """
+        Escribe el planificador en JSON compacto, un registro a la vez.
+        
+        El resultado es el mismo que codificar la estructura de
+        _construir_datos_guardado de una vez, pero en memoria solo hay un
+        registro convertido en cada momento.
+        
+        Args:
+            archivo: Archivo binario abierto para escritura
+            metadata: Sección de metadatos a guardar
+            planificador: Instancia del PlanificadorEventos a guardar
+        """
+        codificar = _CODIFICADOR_JSON.encode
+        
+        archivo.write(f'{{"metadata": {codificar(metadata)}, "recursos": ['
+                      .encode(self.ENCODING))
+        self._escribir_registros(archivo, planificador.recursos.values(),
+                                 self._conversores_recurso)
+        archivo.write(b'], "eventos": [')
+        self._escribir_registros(archivo, planificador.eventos.values(),
+                                 self._conversores_evento)
+        archivo.write(b']}')
+    
+    def _escribir_registros(self, archivo: BinaryIO, registros: Iterable,
+                            conversores: Dict[type, Callable[[Any], Dict]]):
+        """
+        Escribe los elementos de una lista JSON, separados por comas.
+        
+        Args:
+            archivo: Archivo binario abierto para escritura
+            registros: Objetos a convertir y escribir, en orden
+            conversores: Tabla clase -> conversor a diccionario
+        """
+        codificar = _CODIFICADOR_JSON.encode
+        escribir = archivo.write
+        codificacion = self.ENCODING
+        separador = b''
+        
+        for registro in registros:
+            convertir = (conversores.get(type(registro))
+                         or self._conversor_para(conversores, type(registro)))
+            escribir(separador)
+            escribir(codificar(convertir(registro)).encode(codificacion))
+            separador = b', '
+    
+    def _escribir_atomico(self, ruta_archivo: str,
+                          escribir: Callable[[BinaryIO], Any]):
+        """
+        Escribe un archivo completo de forma atómica.
+        
+        El contenido se escribe en un archivo temporal junto al destino,
+        se sincroniza con el disco una sola vez y luego reemplaza al
+        original, de modo que un corte a mitad del guardado nunca deja
+        un archivo de datos truncado. Después se sincroniza también el
+        directorio, para que el reemplazo en sí sobreviva a un corte.
+        
+        Args:
+            ruta_archivo: Ruta del archivo de destino
+            escribir: Función que recibe el archivo temporal abierto en
+                      modo binario y escribe en él el contenido
+        """
+        ruta_temporal = f"{ruta_archivo}.tmp"
+        
+        try:
+            with open(ruta_temporal, 'wb') as archivo:
+                escribir(archivo)
+                archivo.flush()
+                os.fsync(archivo.fileno())
+            os.replace(ruta_temporal, ruta_archivo)
+        except BaseException:
+            if os.path.exists(ruta_temporal):
+                os.remove(ruta_temporal)
+            raise
+        
+        self._sincronizar_directorio(ruta_archivo)
+    
+    def _sincronizar_directorio(self, ruta_archivo: str):
+        """
+        Sincroniza con el disco el directorio que contiene un archivo.
+        
+        En sistemas POSIX el cambio de nombre de os.replace queda en el
+        directorio; sin sincronizarlo, un corte de energía puede dejar
+        visible el archivo anterior. En Windows no hace falta (ni se puede
+        abrir un directorio), y si el sistema de archivos no lo admite se
+        omite: el contenido ya quedó escrito.
+        
+        Args:
+            ruta_archivo: Ruta del archivo recién reemplazado
+        """
+        if not hasattr(os, 'O_DIRECTORY'):
+            return
+        
+        directorio = os.path.dirname(os.path.abspath(ruta_archivo))
+        
+        try:
+            descriptor = os.open(directorio, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return
+        
+        try:
+            os.fsync(descriptor)
+        except OSError:
+            pass
+        finally:
+            os.close(descriptor)
+    
+    def _guardar_metadatos(self, ruta_archivo: str, metadata: Dict,
+                           num_recursos: int, num_eventos: int):
+        """
+        Guarda junto al archivo de datos un resumen para obtener_info_archivo.
+        
+        El resumen registra el tamaño y la fecha de modificación del
+        archivo de datos; si este cambia por otro medio, el resumen deja de
+        usarse. Un fallo al escribirlo no afecta al guardado.
+        
+        Args:
+            ruta_archivo: Ruta del archivo de datos recién guardado
+            metadata: Sección de metadatos guardada
+            num_recursos: Cantidad de recursos guardados
+            num_eventos: Cantidad de eventos guardados
+        """
+        try:
+            estado = os.stat(ruta_archivo)
+            resumen = {
+                'version': metadata['version'],
+                'fecha_guardado': metadata['fecha_guardado'],
+                'num_recursos': num_recursos,
+                'num_eventos': num_eventos,
+                'tamanio_bytes': estado.st_size,
+                'modificado_ns': estado.st_mtime_ns
+            }
+            # Sin fsync: un resumen dañado solo hace que se lean los datos
+            with open(ruta_archivo + self.SUFIJO_METADATOS, 'wb') as archivo:
+                archivo.write(_CODIFICADOR_JSON.encode(resumen).encode(self.ENCODING))
+        except OSError:
+            pass
+    
     def _construir_datos_guardado(self, planificador) -> Dict:
         """
         Construye la estructura de datos para guardar.
@@ -101,25 +373,111 @@ class GestorPersistencia:
             Dict: Estructura de datos lista para serializar
         """
         return {
-            'metadata': {
-                'version': self.VERSION,
-                'aplicacion': 'Planificador Etihad Stadium',
-                'fecha_guardado': datetime.now().isoformat(),
-                'descripcion': 'Datos del planificador de eventos'
-            },
-            'recursos': [
-                self._recurso_a_dict(r) 
-                for r in planificador.recursos.values()
-            ],
-            'eventos': [
-                self._evento_a_dict(e) 
-                for e in planificador.eventos.values()
-            ]
+            'metadata': self._construir_metadatos(),
+            'recursos': self._recursos_a_dicts(planificador.recursos.values()),
+            'eventos': self._eventos_a_dicts(planificador.eventos.values())
+        }
+    
+    def _construir_metadatos(self) -> Dict:
+        """
+        Construye la sección de metadatos de un guardado.
+        
+        Returns:
+            Dict: Versión, aplicación y fecha del guardado
+        """
+        return {
+            'version': self.VERSION,
+            'aplicacion': 'Planificador Etihad Stadium',
+            'fecha_guardado': datetime.now().isoformat(),
+            'descripcion': 'Datos del planificador de eventos'
+        }
+    
+    def _recursos_a_dicts(self, recursos: Iterable[Recurso]) -> List[Dict]:
+        """
+        Convierte todos los recursos a diccionarios en una sola pasada.
+        
+        Args:
+            recursos: Recursos a convertir, en el orden a guardar
+            
+        Returns:
+            List[Dict]: Representación de cada recurso, en el mismo orden
+        """
+        conversores = self._conversores_recurso
+        resultado = []
+        agregar = resultado.append
+        
+        for recurso in recursos:
+            convertir = (conversores.get(type(recurso))
+                         or self._conversor_para(conversores, type(recurso)))
+            agregar(convertir(recurso))
+        
+        return resultado
+    
+    def _eventos_a_dicts(self, eventos: Iterable[Evento]) -> List[Dict]:
+        """
+        Convierte todos los eventos a diccionarios en una sola pasada.
+        
+        Args:
+            eventos: Eventos a convertir, en el orden a guardar
+            
+        Returns:
+            List[Dict]: Representación de cada evento, en el mismo orden
+        """
+        conversores = self._conversores_evento
+        resultado = []
+        agregar = resultado.append
+        
+        for evento in eventos:
+            convertir = (conversores.get(type(evento))
+                         or self._conversor_para(conversores, type(evento)))
+            agregar(convertir(evento))
+        
+        return resultado
+    
+    @staticmethod
+    def _conversor_para(conversores: Dict[type, Callable], clase: type) -> Callable:
+        """
+        Busca el conversor de una clase sin registrar y lo registra.
+        
+        Usa el de la clase base más cercana, de modo que cada subclase
+        recorre su jerarquía una sola vez.
+        
+        Args:
+            conversores: Tabla clase -> conversor
+            clase: Clase del objeto a convertir
+            
+        Returns:
+            Callable: Conversor a diccionario para la clase
+        """
+        for base in clase.__mro__:
+            if base in conversores:
+                conversores[clase] = conversores[base]
+                return conversores[clase]
+        raise TypeError(f"No se puede guardar un objeto de tipo {clase.__name__}")
+    
+    def _arbitro_a_dict(self, arbitro: Arbitro) -> Dict:
+        """
+        Convierte un árbitro a diccionario.
+        
+        Args:
+            arbitro: Árbitro a convertir
+            
+        Returns:
+            Dict: Representación del árbitro
+        """
+        return {
+            'id': arbitro.id,
+            'tipo_clase': 'Arbitro',
+            'nombre': arbitro.nombre,
+            'descripcion': arbitro.descripcion,
+            'tipo_arbitro': arbitro.tipo.value,
+            'nacionalidad': arbitro.nacionalidad,
+            'experiencia_anios': arbitro.experiencia_anios
         }
     
     def _recurso_a_dict(self, recurso: Recurso) -> Dict:
         """
-        Convierte un recurso a diccionario.
+        Convierte un recurso genérico a diccionario.
         
         Args:
             recurso: Recurso a convertir
@@ -127,27 +485,37 @@ class GestorPersistencia:
         Returns:
             Dict: Representación del recurso
         """
-        if isinstance(recurso, Arbitro):
-            return {
-                'id': recurso.id,
-                'tipo_clase': 'Arbitro',
-                'nombre': recurso.nombre,
-                'descripcion': recurso.descripcion,
-                'tipo_arbitro': recurso.tipo.value,
-                'nacionalidad': recurso.nacionalidad,
-                'experiencia_anios': recurso.experiencia_anios
-            }
-        else:
-            return {
-                'id': recurso.id,
-                'tipo_clase': 'Recurso',
-                'nombre': recurso.nombre,
-                'descripcion': recurso.descripcion
-            }
+        return {
+            'id': recurso.id,
+            'tipo_clase': 'Recurso',
+            'nombre': recurso.nombre,
+            'descripcion': recurso.descripcion
+        }
+    
+    def _partido_a_dict(self, partido: Partido) -> Dict:
+        """
+        Convierte un partido a diccionario.
+        
+        Args:
+            partido: Partido a convertir
+            
+        Returns:
+            Dict: Representación del partido
+        """
+        return {
+            'id': partido.id,
+            'tipo': partido.__class__.__name__,
+            'nombre': partido.nombre,
+            'fecha_inicio': partido.fecha_inicio.isoformat(),
+            'fecha_fin': partido.fecha_fin.isoformat(),
+            'recursos_ids': list(partido.recurso_ids),
+            'equipo_local': partido.equipo_local,
+            'equipo_visitante': partido.equipo_visitante
+        }
     
     def _evento_a_dict(self, evento: Evento) -> Dict:
         """
-        Convierte un evento a diccionario.
+        Convierte un evento genérico a diccionario.
         
         Args:
             evento: Evento a convertir
@@ -155,31 +523,30 @@ class GestorPersistencia:
         Returns:
             Dict: Representación del evento
         """
-        datos_base = {
+        return {
             'id': evento.id,
             'tipo': evento.__class__.__name__,
             'nombre': evento.nombre,
+            # json no serializa datetime: isoformat (en C) es más barato
+            # que un hook default llamado por cada fecha
             'fecha_inicio': evento.fecha_inicio.isoformat(),
             'fecha_fin': evento.fecha_fin.isoformat(),
-            'recursos_ids': [r.id for r in evento.recursos]
+            'recursos_ids': list(evento.recurso_ids)
         }
-        
-        if isinstance(evento, Partido):
-            datos_base['equipo_local'] = evento.equipo_local
-            datos_base['equipo_visitante'] = evento.equipo_visitante
-        
-        return datos_base
     
     # =========================================================================
     # CARGA DE DATOS
     # =========================================================================
     
-    def cargar(self, ruta_archivo: str) -> Tuple[bool, Any]:
+    def cargar(self, ruta_archivo: str,
+               formato: Optional[str] = None) -> Tuple[bool, Any]:
         """
-        Carga el estado del planificador desde un archivo JSON.
+        Carga el estado del planificador desde un archivo JSON o binario.
         
         Args:
             ruta_archivo: Ruta del archivo a cargar
+            formato: FORMATO_JSON o FORMATO_BINARIO (default: según la
+                     extensión del archivo)
             
         Returns:
             Tuple[bool, Any]: (True, planificador) si se cargó correctamente,
@@ -199,8 +566,9 @@ class GestorPersistencia:
                 return False, f"El archivo '{ruta_archivo}' no existe"
             
             # Leer archivo
-            with open(ruta_archivo, 'r', encoding=self.ENCODING) as archivo:
-                datos = json.load(archivo)
+            datos = self._leer_datos(
+                ruta_archivo, self._resolver_formato(ruta_archivo, formato)
+            )
             
             # Validar estructura básica
             valido, mensaje = self._validar_estructura_datos(datos)
@@ -214,6 +582,8 @@ class GestorPersistencia:
             
         except json.JSONDecodeError as e:
             return False, f"Error al leer JSON: El archivo no tiene formato válido. {str(e)}"
+        except pickle.UnpicklingError as e:
+            return False, f"Error al leer datos binarios: El archivo no tiene formato válido. {str(e)}"
         except PermissionError:
             return False, f"Error de permisos: No se puede leer '{ruta_archivo}'"
         except OSError as e:
@@ -221,6 +591,37 @@ class GestorPersistencia:
         except Exception as e:
             return False, f"Error inesperado al cargar: {str(e)}"
     
+    def _leer_datos(self, ruta_archivo: str, formato: str) -> Any:
+        """
+        Lee y decodifica un archivo de datos completo.
+        
+        Un archivo JSON se lee en binario de una sola vez y se convierte a
+        texto en la misma expresión: los bytes leídos se liberan antes de
+        armar los datos, de modo que el pico de memoria es el texto más los
+        datos y no los bytes, el texto y los datos a la vez.
+        
+        Args:
+            ruta_archivo: Ruta del archivo a leer
+            formato: FORMATO_JSON o FORMATO_BINARIO
+            
+        Returns:
+            Any: Datos decodificados
+            
+        Raises:
+            json.JSONDecodeError: Si el contenido no es JSON válido
+            pickle.UnpicklingError: Si el contenido binario no es válido
+            UnicodeDecodeError: Si el archivo no está en la codificación esperada
+            OSError: Si no se puede leer el archivo
+        """
+        if formato == self.FORMATO_BINARIO:
+            with open(ruta_archivo, 'rb') as archivo:
+                return _LectorBinario(archivo).load()
+        
+        with open(ruta_archivo, 'rb') as archivo:
+            texto = archivo.read().decode(self.ENCODING)
+        
+        return json.loads(texto)
+    
     def _validar_estructura_datos(self, datos: Dict) -> Tuple[bool, str]:
         """
         Valida que los datos tengan la estructura correcta.
@@ -252,33 +653,50 @@ class GestorPersistencia:
         """
         Reconstruye un planificador desde los datos cargados.
         
+        Las listas de recursos y eventos de datos se consumen: cada
+        elemento se libera apenas se convierte, así los datos leídos y el
+        planificador reconstruido no ocupan memoria completa a la vez.
+        
         Args:
-            datos: Diccionario con los datos
+            datos: Diccionario con los datos (se vacía durante la carga)
             
         Returns:
             PlanificadorEventos: Instancia reconstruida
         """
-        # Importación local para evitar dependencia circular
-        from services.planificador import PlanificadorEventos
-        
         planificador = PlanificadorEventos()
         
         # Cargar recursos primero
         recursos_map = {}
-        for recurso_data in datos.get('recursos', []):
+        for recurso_data in self._consumir(datos.get('recursos', [])):
             recurso = self._dict_a_recurso(recurso_data)
             if recurso:
-                planificador.recursos[recurso.id] = recurso
+                planificador.agregar_recurso(recurso)
                 recursos_map[recurso.id] = recurso
         
         # Cargar eventos
-        for evento_data in datos.get('eventos', []):
+        for evento_data in self._consumir(datos.get('eventos', [])):
             evento = self._dict_a_evento(evento_data, recursos_map)
             if evento:
-                planificador.eventos[evento.id] = evento
+                planificador.registrar_evento(evento)
         
         return planificador
     
+    @staticmethod
+    def _consumir(elementos: List) -> Iterator:
+        """
+        Recorre una lista liberando cada elemento después de entregarlo.
+        
+        Args:
+            elementos: Lista a recorrer; al terminar solo contiene None
+            
+        Yields:
+            Cada elemento de la lista, en orden
+        """
+        for i in range(len(elementos)):
+            elemento = elementos[i]
+            elementos[i] = None
+            yield elemento
+    
     def _dict_a_recurso(self, datos: Dict) -> Optional[Recurso]:
         """
         Convierte un diccionario a recurso.
@@ -290,31 +708,10 @@ class GestorPersistencia:
             Recurso o None si hay error
         """
         try:
-            tipo_clase = datos.get('tipo_clase', 'Recurso')
-            
-            if tipo_clase == 'Arbitro':
-                # Mapear tipo de árbitro
-                tipo_map = {t.value: t for t in TipoArbitro}
-                tipo = tipo_map.get(
-                    datos.get('tipo_arbitro'), 
-                    TipoArbitro.PRINCIPAL
-                )
-                
-                arbitro = Arbitro(
-                    nombre=datos['nombre'],
-                    tipo=tipo,
-                    nacionalidad=datos.get('nacionalidad', 'Inglaterra'),
-                    experiencia_anios=datos.get('experiencia_anios', 0)
-                )
-                arbitro.id = datos['id']
-                return arbitro
-            else:
-                recurso = Recurso(
-                    nombre=datos['nombre'],
-                    descripcion=datos.get('descripcion', '')
-                )
-                recurso.id = datos['id']
-                return recurso
+            constructor = self._constructores_recurso.get(
+                datos.get('tipo_clase'), self._construir_recurso
+            )
+            return constructor(datos)
                 
         except KeyError as e:
             print(f"Advertencia: Recurso incompleto, falta campo {e}")
@@ -323,6 +720,45 @@ class GestorPersistencia:
             print(f"Advertencia: Error al cargar recurso: {e}")
             return None
     
+    def _construir_arbitro(self, datos: Dict) -> Arbitro:
+        """
+        Construye un árbitro desde su diccionario.
+        
+        Args:
+            datos: Diccionario con los datos del árbitro
+            
+        Returns:
+            Arbitro: Árbitro reconstruido
+        """
+        tipo = TipoArbitro.desde_valor(
+            datos.get('tipo_arbitro'), 
+            TipoArbitro.PRINCIPAL
+        )
+        
+        return Arbitro(
+            nombre=datos['nombre'],
+            tipo=tipo,
+            nacionalidad=datos.get('nacionalidad', 'Inglaterra'),
+            experiencia_anios=datos.get('experiencia_anios', 0),
+            id=datos['id']
+        )
+    
+    def _construir_recurso(self, datos: Dict) -> Recurso:
+        """
+        Construye un recurso genérico desde su diccionario.
+        
+        Args:
+            datos: Diccionario con los datos del recurso
+            
+        Returns:
+            Recurso: Recurso reconstruido
+        """
+        return Recurso(
+            nombre=datos['nombre'],
+            descripcion=datos.get('descripcion', ''),
+            id=datos['id']
+        )
+    
     def _dict_a_evento(self, datos: Dict, recursos_map: Dict) -> Optional[Evento]:
         """
         Convierte un diccionario a evento.
@@ -335,37 +771,21 @@ class GestorPersistencia:
             Evento o None si hay error
         """
         try:
-            tipo = datos.get('tipo', 'Evento')
+            constructor = self._constructores_evento.get(
+                datos.get('tipo'), self._construir_evento
+            )
             
             # Recuperar recursos asignados
-            recursos = []
-            for rid in datos.get('recursos_ids', []):
-                if rid in recursos_map:
-                    recursos.append(recursos_map[rid])
+            recursos = [
+                recursos_map[rid] for rid in datos.get('recursos_ids', [])
+                if rid in recursos_map
+            ]
             
             # Parsear fechas
             fecha_inicio = datetime.fromisoformat(datos['fecha_inicio'])
             fecha_fin = datetime.fromisoformat(datos['fecha_fin'])
             
-            if tipo == 'Partido':
-                partido = Partido(
-                    equipo_local=datos['equipo_local'],
-                    equipo_visitante=datos['equipo_visitante'],
-                    fecha_inicio=fecha_inicio,
-                    fecha_fin=fecha_fin,
-                    recursos=recursos
-                )
-                partido.id = datos['id']
-                return partido
-            else:
-                evento = Evento(
-                    nombre=datos['nombre'],
-                    fecha_inicio=fecha_inicio,
-                    fecha_fin=fecha_fin,
-                    recursos=recursos
-                )
-                evento.id = datos['id']
-                return evento
+            return constructor(datos, fecha_inicio, fecha_fin, recursos)
                 
         except KeyError as e:
             print(f"Advertencia: Evento incompleto, falta campo {e}")
@@ -377,6 +797,51 @@ class GestorPersistencia:
             print(f"Advertencia: Error al cargar evento: {e}")
             return None
     
+    def _construir_partido(self, datos: Dict, fecha_inicio: datetime,
+                           fecha_fin: datetime, recursos: List) -> Partido:
+        """
+        Construye un partido desde su diccionario.
+        
+        Args:
+            datos: Diccionario con los datos del partido
+            fecha_inicio: Fecha de inicio ya parseada
+            fecha_fin: Fecha de fin ya parseada
+            recursos: Recursos asignados ya resueltos
+            
+        Returns:
+            Partido: Partido reconstruido
+        """
+        return Partido(
+            equipo_local=datos['equipo_local'],
+            equipo_visitante=datos['equipo_visitante'],
+            fecha_inicio=fecha_inicio,
+            fecha_fin=fecha_fin,
+            recursos=recursos,
+            id=datos['id']
+        )
+    
+    def _construir_evento(self, datos: Dict, fecha_inicio: datetime,
+                          fecha_fin: datetime, recursos: List) -> Evento:
+        """
+        Construye un evento genérico desde su diccionario.
+        
+        Args:
+            datos: Diccionario con los datos del evento
+            fecha_inicio: Fecha de inicio ya parseada
+            fecha_fin: Fecha de fin ya parseada
+            recursos: Recursos asignados ya resueltos
+            
+        Returns:
+            Evento: Evento reconstruido
+        """
+        return Evento(
+            nombre=datos['nombre'],
+            fecha_inicio=fecha_inicio,
+            fecha_fin=fecha_fin,
+            recursos=recursos,
+            id=datos['id']
+        )
+    
     # =========================================================================
     # UTILIDADES
     # =========================================================================
@@ -406,9 +871,16 @@ class GestorPersistencia:
         if not self.existe_archivo(ruta_archivo):
             return None
         
+        # Si el resumen guardado corresponde al archivo actual, no hace
+        # falta leer todos los datos
+        info = self._leer_metadatos(ruta_archivo)
+        if info is not None:
+            return info
+        
         try:
-            with open(ruta_archivo, 'r', encoding=self.ENCODING) as archivo:
-                datos = json.load(archivo)
+            datos = self._leer_datos(
+                ruta_archivo, self._resolver_formato(ruta_archivo, None)
+            )
             
             metadata = datos.get('metadata', {})
             
@@ -424,6 +896,39 @@ class GestorPersistencia:
         except Exception:
             return None
     
+    def _leer_metadatos(self, ruta_archivo: str) -> Optional[Dict]:
+        """
+        Lee el resumen guardado junto a un archivo de datos.
+        
+        Args:
+            ruta_archivo: Ruta del archivo de datos
+            
+        Returns:
+            Dict con la misma información que obtener_info_archivo, o None
+            si no hay resumen o no corresponde al archivo actual
+        """
+        try:
+            resumen = self._leer_datos(
+                ruta_archivo + self.SUFIJO_METADATOS, self.FORMATO_JSON
+            )
+            estado = os.stat(ruta_archivo)
+            
+            if (resumen['tamanio_bytes'] != estado.st_size or
+                    resumen['modificado_ns'] != estado.st_mtime_ns):
+                return None
+            
+            return {
+                'ruta': ruta_archivo,
+                'version': resumen['version'],
+                'fecha_guardado': resumen['fecha_guardado'],
+                'num_recursos': resumen['num_recursos'],
+                'num_eventos': resumen['num_eventos'],
+                'tamanio_bytes': estado.st_size
+            }
+            
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
     def crear_backup(self, ruta_archivo: str) -> Tuple[bool, str]:
         """
         Crea una copia de respaldo de un archivo.
@@ -440,20 +945,18 @@ class GestorPersistencia:
         try:
             # Generar nombre de backup
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            nombre_base = os.path.splitext(ruta_archivo)[0]
-            ruta_backup = f"{nombre_base}_backup_{timestamp}.json"
-            
-            # Leer archivo original
-            with open(ruta_archivo, 'r', encoding=self.ENCODING) as archivo:
-                contenido = archivo.read()
+            nombre_base, extension = os.path.splitext(ruta_archivo)
+            if extension != self.EXTENSION_BINARIA:
+                extension = ".json"
+            ruta_backup = f"{nombre_base}_backup_{timestamp}{extension}"
             
-            # Escribir backup
-            with open(ruta_backup, 'w', encoding=self.ENCODING) as archivo:
-                archivo.write(contenido)
+            # Copiar byte a byte (el sistema operativo copia el contenido
+            # sin pasar por Python cuando puede)
+            shutil.copyfile(ruta_archivo, ruta_backup)
             
             return True, ruta_backup
             
-        except Exception as e:
+        except OSError as e:
             return False, f"Error al crear backup: {str(e)}"
     
     def listar_archivos_datos(self, directorio: str = "data") -> list:
@@ -466,21 +969,17 @@ class GestorPersistencia:
         Returns:
             list: Lista de rutas de archivos JSON encontrados
         """
-        archivos = []
-        
-        if not os.path.exists(directorio):
-            return archivos
-        
+        # scandir trae nombre y tipo de cada entrada en la misma lectura
+        # del directorio; si el directorio no existe, no hay archivos
         try:
-            for archivo in os.listdir(directorio):
-                if archivo.endswith('.json'):
-                    ruta_completa = os.path.join(directorio, archivo)
-                    archivos.append(ruta_completa)
-            
-            return sorted(archivos)
+            with os.scandir(directorio) as entradas:
+                return sorted(
+                    entrada.path for entrada in entradas
+                    if entrada.name.endswith('.json') and entrada.is_file()
+                )
             
-        except Exception:
-            return archivos
+        except OSError:
+            return []
     
     def eliminar_archivo(self, ruta_archivo: str) -> Tuple[bool, str]:
         """
@@ -497,6 +996,12 @@ class GestorPersistencia:
         
         try:
             os.remove(ruta_archivo)
+            
+            # El resumen auxiliar, si existe, ya no corresponde a nada
+            ruta_metadatos = ruta_archivo + self.SUFIJO_METADATOS
+            if os.path.exists(ruta_metadatos):
+                os.remove(ruta_metadatos)
+            
             return True, f"Archivo '{ruta_archivo}' eliminado exitosamente"
             
         except PermissionError:
@@ -518,13 +1023,18 @@ class GestorPersistencia:
         try:
             # Crear directorio si no existe
             directorio = os.path.dirname(ruta_archivo)
-            if directorio and not os.path.exists(directorio):
-                os.makedirs(directorio)
+            if directorio:
+                os.makedirs(directorio, exist_ok=True)
             
             lineas = self._generar_resumen(planificador)
             
+            # Escribir línea por línea en el búfer del archivo, sin armar
+            # antes el texto completo (mismo contenido que '\n'.join)
             with open(ruta_archivo, 'w', encoding=self.ENCODING) as archivo:
-                archivo.write('\n'.join(lineas))
+                for numero, linea in enumerate(lineas):
+                    if numero:
+                        archivo.write('\n')
+                    archivo.write(linea)
             
             return True, f"Resumen exportado a '{ruta_archivo}'"
             
@@ -541,11 +1051,14 @@ class GestorPersistencia:
         Returns:
             list: Lista de líneas del resumen
         """
+        # Un único instante de referencia para todo el resumen
+        ahora = datetime.now()
+        
         lineas = [
             "=" * 60,
             "RESUMEN DEL PLANIFICADOR - ETIHAD STADIUM",
             "=" * 60,
-            f"Fecha de generación: {datetime.now().strftime('%d/%m/%Y %H:%M')}",
+            f"Fecha de generación: {ahora.strftime('%d/%m/%Y %H:%M')}",
             "",
             "-" * 60,
             "ESTADÍSTICAS GENERALES",
@@ -556,45 +1069,31 @@ class GestorPersistencia:
         ]
         
         # Árbitros por tipo
-        from models.recurso import TipoArbitro
-        
-        lineas.append("-" * 60)
-        lineas.append("ÁRBITROS POR TIPO")
-        lineas.append("-" * 60)
+        lineas.extend(("-" * 60, "ÁRBITROS POR TIPO", "-" * 60))
         
         for tipo in TipoArbitro:
             arbitros = planificador.obtener_recursos_por_tipo(tipo)
             lineas.append(f"{tipo.value}: {len(arbitros)}")
-            for arbitro in arbitros:
-                lineas.append(f"   • {arbitro.nombre}")
-        
-        lineas.append("")
+            lineas.extend([f"   • {arbitro.nombre}" for arbitro in arbitros])
         
         # Eventos
-        lineas.append("-" * 60)
-        lineas.append("PARTIDOS PROGRAMADOS")
-        lineas.append("-" * 60)
+        lineas.extend(("", "-" * 60, "PARTIDOS PROGRAMADOS", "-" * 60))
         
-        eventos = sorted(
-            planificador.obtener_eventos(), 
-            key=lambda e: e.fecha_inicio
-        )
+        eventos = planificador.obtener_eventos_ordenados()
         
         if eventos:
             for evento in eventos:
-                estado = "PRÓXIMO" if evento.fecha_inicio > datetime.now() else "PASADO"
-                lineas.append(f"\n[{estado}] {evento.nombre}")
-                lineas.append(f"   Fecha: {evento.fecha_inicio.strftime('%d/%m/%Y %H:%M')}")
-                lineas.append(f"   Árbitros asignados:")
-                for recurso in evento.recursos:
-                    lineas.append(f"      • {recurso}")
+                estado = "PRÓXIMO" if evento.fecha_inicio > ahora else "PASADO"
+                lineas.extend((
+                    f"\n[{estado}] {evento.nombre}",
+                    f"   Fecha: {evento.texto_inicio}",
+                    "   Árbitros asignados:"
+                ))
+                lineas.extend([f"      • {recurso}" for recurso in evento.recursos])
         else:
             lineas.append("No hay partidos programados.")
         
-        lineas.append("")
-        lineas.append("=" * 60)
-        lineas.append("FIN DEL RESUMEN")
-        lineas.append("=" * 60)
+        lineas.extend(("", "=" * 60, "FIN DEL RESUMEN", "=" * 60))
         
         return lineas
     
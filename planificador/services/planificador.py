@@ -7,17 +7,21 @@ Gestiona el calendario, recursos y coordina las validaciones.
 =============================================================================
 """
 
+import bisect
+import heapq
+from itertools import chain
 from datetime import datetime, timedelta
-from typing import List, Dict, Tuple, Optional, Any
+from typing import List, Dict, Tuple, Optional, Any, Iterable
 
-from models.evento import Evento, Partido
-from models.recurso import Recurso, Arbitro, TipoArbitro
-from models.restricciones import (
+from ..models.evento import Evento, Partido, marca_tiempo
+from ..models.recurso import Recurso, Arbitro, TipoArbitro
+from ..models.restricciones import (
+    AgendaArbitros,
+    CalendarioEstadio,
+    MensajeValidacion,
     RestriccionCoRequisito,
     RestriccionExclusionMutua,
-    RestriccionDescansoEstadio,
-    ValidadorRestricciones,
-    crear_validador_estadio
+    RestriccionDescansoEstadio
 )
 from .validador import Validador
 
@@ -43,11 +47,49 @@ class PlanificadorEventos:
         >>> exito, mensaje = planificador.planificar_evento(partido)
     """
     
+    # Cantidad de árbitros de cada tipo que forman un equipo completo
+    EQUIPO_ARBITRAL = (
+        (TipoArbitro.PRINCIPAL, RestriccionCoRequisito.ARBITROS_PRINCIPALES_REQUERIDOS),
+        (TipoArbitro.LINEA, RestriccionCoRequisito.ARBITROS_LINEA_REQUERIDOS),
+        (TipoArbitro.CUARTO, RestriccionCoRequisito.CUARTOS_ARBITROS_REQUERIDOS)
+    )
+    
     def __init__(self):
         """Inicializa el planificador con colecciones vacías."""
         self.eventos: Dict[str, Evento] = {}
         self.recursos: Dict[str, Recurso] = {}
         self.validador = Validador()
+        
+        # Claves (fecha_inicio, id) de los eventos, mantenidas en orden
+        self._eventos_ordenados: List[Tuple[datetime, str]] = []
+        
+        # Cota superior de la duración de los eventos indexados: acota
+        # hacia atrás la búsqueda de superposiciones en el índice ordenado
+        self._duracion_maxima = timedelta(0)
+        
+        # Eventos de cada recurso ordenados por día, mantenido al
+        # indexar/desindexar eventos
+        self._agenda_recursos = AgendaArbitros()
+        
+        # Eventos del estadio ordenados por día de inicio, para validar
+        # solo contra los eventos cercanos
+        self._calendario_estadio = CalendarioEstadio()
+        
+        # Días bloqueados por el descanso de cada árbitro, con la cantidad
+        # de partidos que bloquean cada uno {(recurso_id, dia): cantidad}:
+        # saber si un árbitro puede trabajar un día es una sola consulta
+        self._bloqueos_arbitros: Dict[Tuple[str, int], int] = {}
+        
+        # Restricción de descanso de árbitros para comprobaciones rápidas
+        self._exclusion_arbitros = RestriccionExclusionMutua(
+            dias_descanso=self.validador.DIAS_DESCANSO_ARBITROS
+        )
+        
+        # Índice de árbitros por tipo, cada lista ordenada por nombre
+        # (se mantiene en agregar/eliminar)
+        self._arbitros_por_tipo: Dict[TipoArbitro, List[Arbitro]] = {
+            tipo: [] for tipo in TipoArbitro
+        }
     
     # =========================================================================
     # GESTIÓN DE RECURSOS
@@ -65,9 +107,40 @@ class PlanificadorEventos:
         """
         if recurso.id not in self.recursos:
             self.recursos[recurso.id] = recurso
+            if isinstance(recurso, Arbitro):
+                arbitros = self._arbitros_por_tipo[recurso.tipo]
+                arbitros.append(recurso)
+                arbitros.sort(key=lambda a: a.nombre)
             return True
         return False
     
+    def agregar_recursos(self, recursos: Iterable[Recurso]) -> int:
+        """
+        Agrega varios recursos al sistema en una sola operación.
+        
+        Los recursos cuyo ID ya existe se ignoran.
+        
+        Args:
+            recursos: Recursos a agregar
+            
+        Returns:
+            int: Cantidad de recursos agregados
+        """
+        nuevos = {r.id: r for r in recursos if r.id not in self.recursos}
+        self.recursos.update(nuevos)
+        
+        tipos_modificados = set()
+        for recurso in nuevos.values():
+            if isinstance(recurso, Arbitro):
+                self._arbitros_por_tipo[recurso.tipo].append(recurso)
+                tipos_modificados.add(recurso.tipo)
+        
+        # Reordenar una sola vez cada lista afectada
+        for tipo in tipos_modificados:
+            self._arbitros_por_tipo[tipo].sort(key=lambda a: a.nombre)
+        
+        return len(nuevos)
+    
     def eliminar_recurso(self, recurso_id: str) -> Tuple[bool, str]:
         """
         Elimina un recurso del sistema.
@@ -84,8 +157,9 @@ class PlanificadorEventos:
             return False, "Recurso no encontrado"
         
         # Verificar si está asignado a eventos futuros
+        ahora = datetime.now()
         eventos_futuros = self.obtener_eventos_recurso(recurso_id)
-        eventos_futuros = [e for e in eventos_futuros if e.fecha_inicio > datetime.now()]
+        eventos_futuros = [e for e in eventos_futuros if e.fecha_inicio > ahora]
         
         if eventos_futuros:
             return False, (
@@ -93,7 +167,9 @@ class PlanificadorEventos:
                 f"{len(eventos_futuros)} evento(s) futuro(s)"
             )
         
-        del self.recursos[recurso_id]
+        recurso = self.recursos.pop(recurso_id)
+        if isinstance(recurso, Arbitro):
+            self._arbitros_por_tipo[recurso.tipo].remove(recurso)
         return True, "Recurso eliminado exitosamente"
     
     def obtener_recurso(self, recurso_id: str) -> Optional[Recurso]:
@@ -125,17 +201,26 @@ class PlanificadorEventos:
             tipo: Tipo de árbitro a buscar
             
         Returns:
-            List[Arbitro]: Lista de árbitros del tipo especificado
+            List[Arbitro]: Lista de árbitros del tipo especificado,
+                           ordenada por nombre
+        """
+        return list(self._arbitros_por_tipo[tipo])
+    
+    def obtener_arbitros_ordenados(self) -> List[Arbitro]:
+        """
+        Obtiene todos los árbitros ordenados por tipo y luego por nombre.
+        
+        Returns:
+            List[Arbitro]: Principales, de línea y cuartos árbitros, en ese orden
         """
-        return [
-            r for r in self.recursos.values()
-            if isinstance(r, Arbitro) and r.tipo == tipo
-        ]
+        return list(chain.from_iterable(
+            self._arbitros_por_tipo[tipo] for tipo in TipoArbitro
+        ))
     
     def obtener_arbitros_disponibles(self, tipo: TipoArbitro, 
                                       fecha_inicio: datetime,
                                       fecha_fin: datetime,
-                                      excluir_ids: List[str] = None) -> List[Arbitro]:
+                                      excluir_ids: Iterable[str] = None) -> List[Arbitro]:
         """
         Obtiene los árbitros disponibles de un tipo para una fecha específica.
         
@@ -143,16 +228,17 @@ class PlanificadorEventos:
             tipo: Tipo de árbitro a buscar
             fecha_inicio: Fecha de inicio del evento
             fecha_fin: Fecha de fin del evento
-            excluir_ids: Lista de IDs de árbitros a excluir
+            excluir_ids: IDs de árbitros a excluir (idealmente un set)
             
         Returns:
             List[Arbitro]: Lista de árbitros disponibles
         """
-        excluir_ids = excluir_ids or []
-        arbitros_tipo = self.obtener_recursos_por_tipo(tipo)
+        if not isinstance(excluir_ids, (set, frozenset)):
+            excluir_ids = frozenset(excluir_ids or ())
         disponibles = []
         
-        for arbitro in arbitros_tipo:
+        # Se recorre el índice por tipo directamente: solo se lee
+        for arbitro in self._arbitros_por_tipo[tipo]:
             if arbitro.id in excluir_ids:
                 continue
             
@@ -178,6 +264,18 @@ class PlanificadorEventos:
         """
         return list(self.eventos.values())
     
+    def obtener_eventos_ordenados(self) -> List[Evento]:
+        """
+        Obtiene todos los eventos ordenados por fecha de inicio.
+        
+        El orden se mantiene al planificar, modificar y eliminar eventos,
+        por lo que no es necesario ordenar en cada consulta.
+        
+        Returns:
+            List[Evento]: Lista de eventos ordenados por fecha
+        """
+        return [self.eventos[evento_id] for _, evento_id in self._eventos_ordenados]
+    
     def obtener_eventos_futuros(self) -> List[Evento]:
         """
         Obtiene solo los eventos futuros (fecha mayor a ahora).
@@ -185,9 +283,9 @@ class PlanificadorEventos:
         Returns:
             List[Evento]: Lista de eventos futuros ordenados por fecha
         """
-        ahora = datetime.now()
-        futuros = [e for e in self.eventos.values() if e.fecha_inicio > ahora]
-        return sorted(futuros, key=lambda e: e.fecha_inicio)
+        corte = self._indice_posterior(datetime.now())
+        return [self.eventos[evento_id]
+                for _, evento_id in self._eventos_ordenados[corte:]]
     
     def obtener_eventos_pasados(self) -> List[Evento]:
         """
@@ -196,9 +294,30 @@ class PlanificadorEventos:
         Returns:
             List[Evento]: Lista de eventos pasados ordenados por fecha
         """
-        ahora = datetime.now()
-        pasados = [e for e in self.eventos.values() if e.fecha_inicio <= ahora]
-        return sorted(pasados, key=lambda e: e.fecha_inicio, reverse=True)
+        corte = self._indice_posterior(datetime.now())
+        return [self.eventos[evento_id]
+                for _, evento_id in reversed(self._eventos_ordenados[:corte])]
+    
+    def _indice_posterior(self, fecha: datetime) -> int:
+        """
+        Busca en el índice ordenado el primer evento que empieza después
+        de una fecha.
+        
+        Args:
+            fecha: Fecha de corte
+            
+        Returns:
+            int: Posición del primer evento con fecha de inicio mayor a
+                 fecha (len si no hay ninguno)
+        """
+        orden = self._eventos_ordenados
+        indice = bisect.bisect_left(orden, (fecha,))
+        
+        # (fecha,) queda antes de los eventos que empiezan justo en fecha
+        while indice < len(orden) and orden[indice][0] == fecha:
+            indice += 1
+        
+        return indice
     
     def obtener_evento(self, evento_id: str) -> Optional[Evento]:
         """
@@ -220,15 +339,23 @@ class PlanificadorEventos:
             recurso_id: ID del recurso
             
         Returns:
-            List[Evento]: Lista de eventos donde participa el recurso
+            List[Evento]: Lista de eventos donde participa el recurso,
+                          ordenados por fecha de inicio
+        """
+        # La agenda ya los mantiene en orden: no hace falta ordenarlos
+        return self._agenda_recursos.obtener_eventos(recurso_id)
+    
+    def obtener_eventos_por_recurso(self) -> Dict[str, List[Evento]]:
         """
-        eventos_recurso = []
+        Agrupa los eventos por recurso.
         
-        for evento in self.eventos.values():
-            if evento.contiene_recurso(recurso_id):
-                eventos_recurso.append(evento)
+        Útil cuando se necesita la agenda de muchos recursos a la vez,
+        evitando recorrer todos los eventos una vez por recurso.
         
-        return sorted(eventos_recurso, key=lambda e: e.fecha_inicio)
+        Returns:
+            Dict[str, List[Evento]]: Diccionario {recurso_id: [eventos]}
+        """
+        return self._agenda_recursos.obtener_eventos_por_arbitro()
     
     def obtener_eventos_en_rango(self, fecha_inicio: datetime, 
                                   fecha_fin: datetime) -> List[Evento]:
@@ -242,13 +369,23 @@ class PlanificadorEventos:
         Returns:
             List[Evento]: Lista de eventos en el rango
         """
-        eventos_rango = []
+        # Solo pueden superponerse los eventos que empiezan antes del fin
+        # del rango y no antes de (inicio del rango - duración máxima)
+        desde = bisect.bisect_right(
+            self._eventos_ordenados, (fecha_inicio - self._duracion_maxima,)
+        )
+        hasta = bisect.bisect_left(self._eventos_ordenados, (fecha_fin,))
         
-        for evento in self.eventos.values():
-            if evento.se_superpone_con(fecha_inicio, fecha_fin):
+        ts_inicio = marca_tiempo(fecha_inicio)
+        ts_fin = marca_tiempo(fecha_fin)
+        
+        eventos_rango = []
+        for _, evento_id in self._eventos_ordenados[desde:hasta]:
+            evento = self.eventos[evento_id]
+            if evento.se_superpone_ts(ts_inicio, ts_fin):
                 eventos_rango.append(evento)
         
-        return sorted(eventos_rango, key=lambda e: e.fecha_inicio)
+        return eventos_rango
     
     # =========================================================================
     # PLANIFICACIÓN DE EVENTOS
@@ -256,7 +393,7 @@ class PlanificadorEventos:
     
     def verificar_disponibilidad_recurso(self, recurso: Recurso,
                                           fecha_inicio: datetime,
-                                          fecha_fin: datetime) -> Tuple[bool, str]:
+                                          fecha_fin: datetime) -> Tuple[bool, MensajeValidacion]:
         """
         Verifica si un recurso está disponible en un rango de fechas.
         
@@ -266,13 +403,20 @@ class PlanificadorEventos:
             fecha_fin: Fecha de fin
             
         Returns:
-            Tuple[bool, str]: (True, "") si disponible, (False, mensaje) si no
+            Tuple[bool, MensajeValidacion]: (True, "") si disponible,
+                (False, mensaje) si no; el mensaje se arma al convertirlo
+                con str()
         """
-        eventos_existentes = self.obtener_eventos()
-        
         if isinstance(recurso, Arbitro):
+            # Caso habitual: ningún partido bloquea el día
+            if self._exclusion_arbitros.validar_rapido(
+                    [recurso], fecha_inicio, self._bloqueos_arbitros):
+                return True, ""
+            
+            # Con conflicto, el validador arma el mensaje; con la agenda
+            # no recorre la lista de eventos, así que no se copia
             return self.validador.validar_disponibilidad_arbitro(
-                recurso, fecha_inicio, fecha_fin, eventos_existentes
+                recurso, fecha_inicio, fecha_fin, [], self._agenda_recursos
             )
         
         return True, ""
@@ -295,18 +439,139 @@ class PlanificadorEventos:
         """
         eventos_existentes = self.obtener_eventos()
         
-        # Validar el evento completo
+        # Validar el evento completo (la agenda por recurso y el calendario
+        # del estadio corresponden exactamente a eventos_existentes)
         es_valido, errores = self.validador.validar_evento_completo(
-            evento, eventos_existentes
+            evento, eventos_existentes, self._agenda_recursos,
+            self._calendario_estadio
         )
         
         if not es_valido:
             return False, "\n".join(errores)
         
         # Agregar el evento
-        self.eventos[evento.id] = evento
+        self.registrar_evento(evento)
         return True, "Evento planificado exitosamente"
     
+    def planificar_eventos(self, eventos: Iterable[Evento]
+                           ) -> Tuple[List[Evento], List[Tuple[Evento, str]]]:
+        """
+        Planifica varios eventos en una sola operación.
+        
+        Aplica las mismas validaciones que planificar_evento, en orden
+        cronológico, de modo que cada evento se valida contra los ya
+        existentes y contra los aceptados antes en el mismo lote. La lista
+        de eventos existentes se construye una sola vez para todo el lote.
+        
+        Args:
+            eventos: Eventos a planificar
+            
+        Returns:
+            Tuple[List[Evento], List[Tuple[Evento, str]]]:
+                (eventos_planificados, [(evento_rechazado, motivo)])
+        """
+        eventos_existentes = self.obtener_eventos()
+        planificados: List[Evento] = []
+        rechazados: List[Tuple[Evento, str]] = []
+        
+        for evento in sorted(eventos, key=lambda e: e.fecha_inicio):
+            es_valido, errores = self.validador.validar_evento_completo(
+                evento, eventos_existentes, self._agenda_recursos,
+                self._calendario_estadio
+            )
+            
+            if not es_valido:
+                rechazados.append((evento, "\n".join(errores)))
+                continue
+            
+            self.registrar_evento(evento)
+            eventos_existentes.append(evento)
+            planificados.append(evento)
+        
+        return planificados, rechazados
+    
+    def registrar_evento(self, evento: Evento) -> None:
+        """
+        Registra un evento en el calendario sin validar restricciones.
+        
+        Se usa al cargar datos guardados; para planificar nuevos eventos
+        debe usarse planificar_evento.
+        
+        Args:
+            evento: Evento a registrar
+        """
+        if evento.id in self.eventos:
+            self._desindexar_evento(self.eventos[evento.id])
+        
+        self.eventos[evento.id] = evento
+        self._indexar_evento(evento)
+    
+    def _indexar_evento(self, evento: Evento) -> None:
+        """
+        Agrega un evento al índice ordenado por fecha y al índice por recurso.
+        
+        Args:
+            evento: Evento a indexar
+        """
+        bisect.insort(self._eventos_ordenados, (evento.fecha_inicio, evento.id))
+        
+        duracion = evento.fecha_fin - evento.fecha_inicio
+        if duracion > self._duracion_maxima:
+            self._duracion_maxima = duracion
+        
+        self._calendario_estadio.agregar(evento)
+        
+        bloqueos = self._bloqueos_arbitros
+        dias_bloqueados = self._dias_bloqueados(evento.dia_inicio)
+        
+        for recurso_id in evento.recurso_ids:
+            self._agenda_recursos.agregar(recurso_id, evento)
+            for dia in dias_bloqueados:
+                clave = (recurso_id, dia)
+                bloqueos[clave] = bloqueos.get(clave, 0) + 1
+    
+    def _desindexar_evento(self, evento: Evento) -> None:
+        """
+        Quita un evento del índice ordenado por fecha y del índice por recurso.
+        
+        Args:
+            evento: Evento a quitar de los índices
+        """
+        clave = (evento.fecha_inicio, evento.id)
+        posicion = bisect.bisect_left(self._eventos_ordenados, clave)
+        
+        if (posicion < len(self._eventos_ordenados) and 
+                self._eventos_ordenados[posicion] == clave):
+            self._eventos_ordenados.pop(posicion)
+        
+        self._calendario_estadio.remover(evento)
+        
+        bloqueos = self._bloqueos_arbitros
+        dias_bloqueados = self._dias_bloqueados(evento.dia_inicio)
+        
+        for recurso_id in evento.recurso_ids:
+            if not self._agenda_recursos.remover(recurso_id, evento):
+                continue
+            for dia in dias_bloqueados:
+                clave = (recurso_id, dia)
+                if bloqueos[clave] == 1:
+                    del bloqueos[clave]
+                else:
+                    bloqueos[clave] -= 1
+    
+    def _dias_bloqueados(self, dia: int) -> range:
+        """
+        Días en que un árbitro con partido en un día no puede volver a dirigir.
+        
+        Args:
+            dia: Día del partido (ordinal de la fecha)
+            
+        Returns:
+            range: Días a menos de DIAS_DESCANSO_ARBITROS del partido
+        """
+        descanso = self.validador.DIAS_DESCANSO_ARBITROS
+        return range(dia - descanso + 1, dia + descanso)
+    
     def eliminar_evento(self, evento_id: str) -> Tuple[bool, str]:
         """
         Elimina un evento planificado.
@@ -323,8 +588,8 @@ class PlanificadorEventos:
         if evento_id not in self.eventos:
             return False, "Evento no encontrado"
         
-        evento = self.eventos[evento_id]
-        del self.eventos[evento_id]
+        evento = self.eventos.pop(evento_id)
+        self._desindexar_evento(evento)
         
         return True, f"Evento '{evento.nombre}' eliminado exitosamente"
     
@@ -380,10 +645,12 @@ class PlanificadorEventos:
         if not es_valido:
             return False, "\n".join(errores)
         
-        # Aplicar cambios
+        # Aplicar cambios (reubicando el evento en el índice ordenado)
+        self._desindexar_evento(evento_original)
         evento_original.fecha_inicio = fecha_inicio
         evento_original.fecha_fin = fecha_fin
         evento_original.recursos = recursos
+        self._indexar_evento(evento_original)
         
         return True, "Evento modificado exitosamente"
     
@@ -416,6 +683,10 @@ class PlanificadorEventos:
         # Horarios típicos de partidos
         horarios_partido = [12, 15, 17, 20]
         
+        # Datos que no cambian durante la búsqueda: se preparan una sola vez
+        ahora = datetime.now()
+        ocupacion_estadio = self._obtener_ocupacion_estadio()
+        
         while fecha_actual < fecha_limite:
             for hora in horarios_partido:
                 fecha_inicio = fecha_actual.replace(
@@ -423,58 +694,149 @@ class PlanificadorEventos:
                 )
                 
                 # Saltar si la fecha ya pasó
-                if fecha_inicio < datetime.now():
+                if fecha_inicio < ahora:
                     continue
                 
                 fecha_fin = fecha_inicio + timedelta(hours=duracion_horas)
                 
                 # Verificar disponibilidad del estadio
-                estadio_disponible = self._verificar_disponibilidad_estadio(
-                    fecha_inicio, fecha_fin
-                )
-                
-                if not estadio_disponible:
+                if not self._estadio_libre(ocupacion_estadio, fecha_inicio, fecha_fin):
                     continue
                 
-                # Verificar disponibilidad de árbitros
-                arbitros_disponibles = self._obtener_arbitros_disponibles_todos_tipos(
-                    fecha_inicio, fecha_fin
-                )
+                # El descanso de los árbitros se mide en días: sin equipo
+                # completo ningún otro horario del día sirve
+                dia = fecha_inicio.toordinal()
+                if not self._hay_equipo_en_dia(dia):
+                    break
                 
-                # Verificar que haya suficientes árbitros de cada tipo
-                if self._hay_equipo_arbitral_completo(arbitros_disponibles):
-                    return fecha_inicio, arbitros_disponibles
+                # Las listas completas solo se arman para el horario elegido
+                return fecha_inicio, self._obtener_arbitros_disponibles_en_dia(dia)
             
             # Pasar al siguiente día
             fecha_actual += timedelta(days=1)
         
         return None
     
-    def _verificar_disponibilidad_estadio(self, fecha_inicio: datetime,
-                                           fecha_fin: datetime) -> bool:
+    def _obtener_ocupacion_estadio(self) -> Tuple[List[int], List[int], set, set]:
+        """
+        Prepara, en una sola pasada, los datos para consultar el estadio.
+        
+        Equivale a validar_conflicto_estadio contra todos los eventos, pero
+        permite responder cada consulta sin recorrer el calendario:
+        - Marcas de inicio en orden y el máximo acumulado de las marcas de
+          fin: hay superposición si algún evento que empieza antes del fin
+          consultado termina después del inicio consultado.
+        - Días en que no puede empezar ni terminar un partido por el
+          descanso del estadio.
+        
+        Returns:
+            Tuple: (inicios, max_fines, dias_sin_inicio, dias_sin_fin)
+        """
+        descanso = self.validador.DIAS_DESCANSO_ESTADIO
+        inicios: List[int] = []
+        max_fines: List[int] = []
+        dias_sin_inicio = set()
+        dias_sin_fin = set()
+        max_fin = None
+        
+        for _, evento_id in self._eventos_ordenados:
+            evento = self.eventos[evento_id]
+            inicios.append(evento._ts_inicio)
+            if max_fin is None or evento._ts_fin > max_fin:
+                max_fin = evento._ts_fin
+            max_fines.append(max_fin)
+            
+            dia_inicio = evento.dia_inicio
+            dia_fin = evento.dia_fin
+            dias_sin_inicio.update(range(dia_fin, dia_fin + descanso))
+            dias_sin_fin.update(range(dia_inicio - descanso + 1, dia_inicio + 1))
+        
+        return inicios, max_fines, dias_sin_inicio, dias_sin_fin
+    
+    def _estadio_libre(self, ocupacion: Tuple[List[int], List[int], set, set],
+                       fecha_inicio: datetime, fecha_fin: datetime) -> bool:
         """
-        Verifica si el estadio está disponible en un horario.
+        Indica si el estadio está disponible usando la ocupación precalculada.
         
         Args:
+            ocupacion: Resultado de _obtener_ocupacion_estadio
             fecha_inicio: Fecha de inicio
             fecha_fin: Fecha de fin
             
         Returns:
             bool: True si el estadio está disponible
         """
-        eventos_existentes = self.obtener_eventos()
+        inicios, max_fines, dias_sin_inicio, dias_sin_fin = ocupacion
         
-        valido, _ = self.validador.validar_conflicto_estadio(
-            fecha_inicio, fecha_fin, eventos_existentes
-        )
+        if (fecha_inicio.toordinal() in dias_sin_inicio or
+                fecha_fin.toordinal() in dias_sin_fin):
+            return False
+        
+        # Eventos que empiezan antes del fin consultado
+        i = bisect.bisect_left(inicios, marca_tiempo(fecha_fin))
+        return i == 0 or max_fines[i - 1] <= marca_tiempo(fecha_inicio)
+    
+    def _obtener_arbitros_disponibles_en_dia(self, dia: int) -> Dict[str, List[Arbitro]]:
+        """
+        Obtiene los árbitros de cada tipo con descanso suficiente en un día.
         
-        return valido
+        Equivale a validar_disponibilidad_arbitro del validador, pero
+        con una consulta a los días bloqueados por árbitro en lugar de
+        recorrer los eventos.
+        
+        Args:
+            dia: Día del partido (ordinal de la fecha)
+            
+        Returns:
+            Dict[str, List[Arbitro]]: Diccionario {tipo: [arbitros_disponibles]}
+        """
+        bloqueos = self._bloqueos_arbitros
+        
+        return {
+            tipo.value: [
+                arbitro for arbitro in self._arbitros_por_tipo[tipo]
+                if (arbitro.id, dia) not in bloqueos
+            ]
+            for tipo in TipoArbitro
+        }
     
-    def _obtener_arbitros_disponibles_todos_tipos(self, fecha_inicio: datetime,
-                                                    fecha_fin: datetime) -> Dict[str, List[Arbitro]]:
+    def _hay_equipo_en_dia(self, dia: int) -> bool:
+        """
+        Indica si hay árbitros libres para un equipo completo en un día.
+        
+        Equivale a _hay_equipo_arbitral_completo sobre el resultado de
+        _obtener_arbitros_disponibles_en_dia, pero cada tipo se deja de
+        recorrer apenas se alcanza la cantidad necesaria.
+        
+        Args:
+            dia: Día del partido (ordinal de la fecha)
+            
+        Returns:
+            bool: True si hay equipo completo disponible
+        """
+        bloqueos = self._bloqueos_arbitros
+        
+        for tipo, requeridos in self.EQUIPO_ARBITRAL:
+            libres = 0
+            for arbitro in self._arbitros_por_tipo[tipo]:
+                if (arbitro.id, dia) not in bloqueos:
+                    libres += 1
+                    if libres >= requeridos:
+                        break
+            else:
+                return False
+        
+        return True
+    
+    def obtener_arbitros_disponibles_todos_tipos(self, fecha_inicio: datetime,
+                                                   fecha_fin: datetime) -> Dict[str, List[Arbitro]]:
         """
         Obtiene los árbitros disponibles de todos los tipos.
         
+        Resuelve los tres tipos en una sola llamada, por lo que conviene
+        usarlo en lugar de llamar a obtener_arbitros_disponibles para
+        cada tipo.
+        
         Args:
             fecha_inicio: Fecha de inicio
             fecha_fin: Fecha de fin
@@ -482,17 +844,7 @@ class PlanificadorEventos:
         Returns:
             Dict[str, List[Arbitro]]: Diccionario {tipo: [arbitros_disponibles]}
         """
-        return {
-            'Árbitro Principal': self.obtener_arbitros_disponibles(
-                TipoArbitro.PRINCIPAL, fecha_inicio, fecha_fin
-            ),
-            'Árbitro de Línea': self.obtener_arbitros_disponibles(
-                TipoArbitro.LINEA, fecha_inicio, fecha_fin
-            ),
-            'Cuarto Árbitro': self.obtener_arbitros_disponibles(
-                TipoArbitro.CUARTO, fecha_inicio, fecha_fin
-            )
-        }
+        return self._obtener_arbitros_disponibles_en_dia(fecha_inicio.toordinal())
     
     def _hay_equipo_arbitral_completo(self, arbitros_disponibles: Dict[str, List[Arbitro]]) -> bool:
         """
@@ -504,10 +856,9 @@ class PlanificadorEventos:
         Returns:
             bool: True si hay equipo completo disponible
         """
-        return (
-            len(arbitros_disponibles.get('Árbitro Principal', [])) >= 1 and
-            len(arbitros_disponibles.get('Árbitro de Línea', [])) >= 2 and
-            len(arbitros_disponibles.get('Cuarto Árbitro', [])) >= 1
+        return all(
+            len(arbitros_disponibles.get(tipo.value, ())) >= requeridos
+            for tipo, requeridos in self.EQUIPO_ARBITRAL
         )
     
     def sugerir_arbitros(self, fecha_inicio: datetime,
@@ -515,6 +866,11 @@ class PlanificadorEventos:
         """
         Sugiere un equipo arbitral completo para una fecha.
         
+        Cada puesto solo admite árbitros de su tipo, así que la asignación
+        óptima por experiencia se resuelve tipo a tipo: se eligen los más
+        experimentados entre los disponibles (a igual experiencia, por
+        nombre).
+        
         Args:
             fecha_inicio: Fecha de inicio del partido
             fecha_fin: Fecha de fin del partido
@@ -523,18 +879,21 @@ class PlanificadorEventos:
             Dict o None: Diccionario con árbitros sugeridos por tipo,
                          None si no hay equipo completo disponible
         """
-        arbitros_disponibles = self._obtener_arbitros_disponibles_todos_tipos(
+        arbitros_disponibles = self.obtener_arbitros_disponibles_todos_tipos(
             fecha_inicio, fecha_fin
         )
         
         if not self._hay_equipo_arbitral_completo(arbitros_disponibles):
             return None
         
-        # Seleccionar los primeros disponibles de cada tipo
+        def experiencia(arbitro: Arbitro) -> int:
+            return arbitro.experiencia_anios
+        
+        # Seleccionar los más experimentados de cada tipo
         sugerencia = {
-            'principal': arbitros_disponibles['Árbitro Principal'][0],
-            'linea': arbitros_disponibles['Árbitro de Línea'][:2],
-            'cuarto': arbitros_disponibles['Cuarto Árbitro'][0]
+            'principal': max(arbitros_disponibles['Árbitro Principal'], key=experiencia),
+            'linea': heapq.nlargest(2, arbitros_disponibles['Árbitro de Línea'], key=experiencia),
+            'cuarto': max(arbitros_disponibles['Cuarto Árbitro'], key=experiencia)
         }
         
         return sugerencia
@@ -550,26 +909,32 @@ class PlanificadorEventos:
         Returns:
             Dict: Diccionario con estadísticas
         """
-        eventos = self.obtener_eventos()
         ahora = datetime.now()
         
-        eventos_futuros = [e for e in eventos if e.fecha_inicio > ahora]
-        eventos_pasados = [e for e in eventos if e.fecha_inicio <= ahora]
+        # Una sola pasada: contar los futuros y recordar el primero
+        num_futuros = 0
+        proximo_partido = None
+        for evento in self.eventos.values():
+            if evento.fecha_inicio > ahora:
+                if proximo_partido is None:
+                    proximo_partido = evento
+                num_futuros += 1
         
-        # Contar árbitros por tipo
+        # Contar árbitros por tipo (sin copiar las listas del índice)
+        arbitros = self._arbitros_por_tipo
         arbitros_por_tipo = {
-            'principales': len(self.obtener_recursos_por_tipo(TipoArbitro.PRINCIPAL)),
-            'linea': len(self.obtener_recursos_por_tipo(TipoArbitro.LINEA)),
-            'cuartos': len(self.obtener_recursos_por_tipo(TipoArbitro.CUARTO))
+            'principales': len(arbitros[TipoArbitro.PRINCIPAL]),
+            'linea': len(arbitros[TipoArbitro.LINEA]),
+            'cuartos': len(arbitros[TipoArbitro.CUARTO])
         }
         
         return {
-            'total_eventos': len(eventos),
-            'eventos_futuros': len(eventos_futuros),
-            'eventos_pasados': len(eventos_pasados),
+            'total_eventos': len(self.eventos),
+            'eventos_futuros': num_futuros,
+            'eventos_pasados': len(self.eventos) - num_futuros,
             'total_recursos': len(self.recursos),
             'arbitros_por_tipo': arbitros_por_tipo,
-            'proximo_partido': eventos_futuros[0] if eventos_futuros else None
+            'proximo_partido': proximo_partido
         }
     
     def obtener_agenda_recurso(self, recurso_id: str) -> Dict[str, Any]:
@@ -631,6 +996,13 @@ class PlanificadorEventos:
             # Limpiar estado actual
             self.recursos.clear()
             self.eventos.clear()
+            self._eventos_ordenados.clear()
+            self._duracion_maxima = timedelta(0)
+            self._agenda_recursos.limpiar()
+            self._bloqueos_arbitros.clear()
+            self._calendario_estadio.limpiar()
+            for arbitros in self._arbitros_por_tipo.values():
+                arbitros.clear()
             
             # Cargar recursos
             for recurso_data in data.get('recursos', []):
@@ -638,7 +1010,7 @@ class PlanificadorEventos:
                     recurso = Arbitro.from_dict(recurso_data)
                 else:
                     recurso = Recurso.from_dict(recurso_data)
-                self.recursos[recurso.id] = recurso
+                self.agregar_recurso(recurso)
             
             # Cargar eventos
             for evento_data in data.get('eventos', []):
@@ -646,7 +1018,7 @@ class PlanificadorEventos:
                     evento = Partido.from_dict(evento_data, self.recursos)
                 else:
                     evento = Evento.from_dict(evento_data, self.recursos)
-                self.eventos[evento.id] = evento
+                self.registrar_evento(evento)
             
             return True, (
                 f"Datos cargados: {len(self.recursos)} recursos, "
@@ -8,15 +8,20 @@ Centraliza toda la lógica de validación del sistema.
 """
 
 from datetime import datetime, timedelta
-from typing import List, Tuple, Any, Optional
+from typing import Dict, List, Tuple, Any, Optional
 
-from models.evento import Evento, Partido
-from models.recurso import Recurso, Arbitro, TipoArbitro
-from models.restricciones import (
+from ..models.evento import Evento, Partido
+from ..models.recurso import Recurso, Arbitro, TipoArbitro
+from ..models.restricciones import (
+    AgendaArbitros,
+    CalendarioEstadio,
+    MensajeDiferido,
+    MensajeValidacion,
     Restriccion,
     RestriccionCoRequisito,
     RestriccionExclusionMutua,
-    RestriccionDescansoEstadio
+    RestriccionDescansoEstadio,
+    buscar_conflicto_estadio
 )
 
 
@@ -200,6 +205,10 @@ class Validador:
         
         valor_str = valor_str.strip()
         
+        # Caso habitual: solo dígitos ASCII, int() no puede fallar
+        if valor_str.isascii() and valor_str.isdigit():
+            return True, int(valor_str)
+        
         # Verificar letras
         if any(c.isalpha() for c in valor_str):
             return False, f"El {nombre_campo} no puede contener letras"
@@ -222,7 +231,9 @@ class Validador:
     
     def validar_conflicto_estadio(self, fecha_inicio: datetime, 
                                    fecha_fin: datetime,
-                                   eventos_existentes: List[Evento]) -> Tuple[bool, str]:
+                                   eventos_existentes: List[Evento],
+                                   calendario_estadio: Optional[CalendarioEstadio] = None
+                                   ) -> Tuple[bool, MensajeValidacion]:
         """
         Valida que no haya conflictos de uso del estadio.
         
@@ -233,44 +244,59 @@ class Validador:
             fecha_inicio: Fecha de inicio del nuevo evento
             fecha_fin: Fecha de fin del nuevo evento
             eventos_existentes: Lista de eventos ya planificados
+            calendario_estadio: Calendario del estadio con los eventos de
+                                eventos_existentes (opcional); limita la
+                                revisión a los eventos cercanos
             
         Returns:
-            Tuple[bool, str]: (True, "") si no hay conflicto,
-                              (False, mensaje_error) si hay conflicto
+            Tuple[bool, MensajeValidacion]: (True, "") si no hay conflicto,
+                (False, mensaje_error) si hay conflicto; el mensaje se
+                arma al convertirlo con str()
         """
-        for evento in eventos_existentes:
-            # Verificar superposición directa
-            if evento.se_superpone_con(fecha_inicio, fecha_fin):
-                return False, (
-                    f"Conflicto de horario: Ya existe el partido "
-                    f"'{evento.nombre}' programado del "
-                    f"{evento.fecha_inicio.strftime('%d/%m/%Y %H:%M')} al "
-                    f"{evento.fecha_fin.strftime('%d/%m/%Y %H:%M')}"
-                )
-            
-            # Calcular días de diferencia
-            dias_antes = (fecha_inicio.date() - evento.fecha_fin.date()).days
-            dias_despues = (evento.fecha_inicio.date() - fecha_fin.date()).days
-            
-            # Verificar descanso del estadio (antes del evento existente)
-            if 0 <= dias_antes < self.DIAS_DESCANSO_ESTADIO:
-                return False, (
-                    f"El estadio necesita {self.DIAS_DESCANSO_ESTADIO} días "
-                    f"de descanso entre partidos. Hay un partido el "
-                    f"{evento.fecha_inicio.strftime('%d/%m/%Y')} "
-                    f"(solo {dias_antes} día(s) de diferencia)"
-                )
+        if calendario_estadio is not None:
+            eventos_existentes = calendario_estadio.eventos_cercanos(
+                fecha_inicio, fecha_fin, self.DIAS_DESCANSO_ESTADIO
+            )
+        
+        evento, dias_diferencia = buscar_conflicto_estadio(
+            eventos_existentes, fecha_inicio, fecha_fin, self.DIAS_DESCANSO_ESTADIO
+        )
+        
+        if evento is None:
+            return True, ""
+        
+        # El texto se arma solo si se lee
+        return False, MensajeDiferido(
+            self._formatear_conflicto_estadio, evento, dias_diferencia
+        )
+    
+    def _formatear_conflicto_estadio(self, evento: Evento,
+                                     dias_diferencia: Optional[int]) -> str:
+        """
+        Arma el mensaje de error de un conflicto de uso del estadio.
+        
+        Args:
+            evento: Evento con el que se produce el conflicto
+            dias_diferencia: Días de diferencia, o None si se superponen
             
-            # Verificar descanso del estadio (después del evento existente)
-            if 0 <= dias_despues < self.DIAS_DESCANSO_ESTADIO:
-                return False, (
-                    f"El estadio necesita {self.DIAS_DESCANSO_ESTADIO} días "
-                    f"de descanso entre partidos. Hay un partido el "
-                    f"{evento.fecha_inicio.strftime('%d/%m/%Y')} "
-                    f"(solo {dias_despues} día(s) de diferencia)"
-                )
+        Returns:
+            str: Mensaje de error
+        """
+        # Superposición directa
+        if dias_diferencia is None:
+            return (
+                f"Conflicto de horario: Ya existe el partido "
+                f"'{evento.nombre}' programado del "
+                f"{evento.texto_inicio} al {evento.texto_fin}"
+            )
         
-        return True, ""
+        # Descanso del estadio insuficiente (antes o después del evento existente)
+        return (
+            f"El estadio necesita {self.DIAS_DESCANSO_ESTADIO} días "
+            f"de descanso entre partidos. Hay un partido el "
+            f"{evento.texto_fecha} "
+            f"(solo {dias_diferencia} día(s) de diferencia)"
+        )
     
     # =========================================================================
     # VALIDACIÓN DE DISPONIBILIDAD DE ÁRBITROS
@@ -279,7 +305,9 @@ class Validador:
     def validar_disponibilidad_arbitro(self, arbitro: Arbitro,
                                         fecha_inicio: datetime,
                                         fecha_fin: datetime,
-                                        eventos_existentes: List[Evento]) -> Tuple[bool, str]:
+                                        eventos_existentes: List[Evento],
+                                        agenda_arbitros: Optional[AgendaArbitros] = None
+                                        ) -> Tuple[bool, MensajeValidacion]:
         """
         Valida que un árbitro esté disponible para una fecha.
         
@@ -291,34 +319,58 @@ class Validador:
             fecha_inicio: Fecha de inicio del nuevo evento
             fecha_fin: Fecha de fin del nuevo evento
             eventos_existentes: Lista de eventos ya planificados
+            agenda_arbitros: Agenda de los árbitros con los eventos de
+                             eventos_existentes (opcional); evita recorrerlos
             
         Returns:
-            Tuple[bool, str]: (True, "") si está disponible,
-                              (False, mensaje_error) si no está disponible
+            Tuple[bool, MensajeValidacion]: (True, "") si está disponible,
+                (False, mensaje_error) si no está disponible; el mensaje
+                se arma al convertirlo con str()
         """
-        for evento in eventos_existentes:
-            # Verificar si el árbitro está asignado a este evento
-            arbitro_en_evento = any(
-                r.id == arbitro.id for r in evento.recursos
+        if agenda_arbitros is not None:
+            eventos_arbitro = agenda_arbitros.eventos_cercanos(
+                arbitro.id, fecha_inicio.toordinal(), self.DIAS_DESCANSO_ARBITROS
+            )
+        else:
+            eventos_arbitro = [
+                e for e in eventos_existentes if e.contiene_recurso(arbitro.id)
+            ]
+        
+        for evento in eventos_arbitro:
+            # Calcular días de diferencia
+            dias_diferencia = abs(
+                fecha_inicio.toordinal() - evento.dia_inicio
             )
             
-            if arbitro_en_evento:
-                # Calcular días de diferencia
-                dias_diferencia = abs(
-                    (fecha_inicio.date() - evento.fecha_inicio.date()).days
+            if dias_diferencia < self.DIAS_DESCANSO_ARBITROS:
+                return False, MensajeDiferido(
+                    self._formatear_arbitro_no_disponible,
+                    arbitro, evento, dias_diferencia
                 )
-                
-                if dias_diferencia < self.DIAS_DESCANSO_ARBITROS:
-                    return False, (
-                        f"{arbitro.nombre} no está disponible. "
-                        f"Tiene partido el "
-                        f"{evento.fecha_inicio.strftime('%d/%m/%Y')} "
-                        f"y necesita {self.DIAS_DESCANSO_ARBITROS} días de descanso "
-                        f"(solo hay {dias_diferencia} día(s) de diferencia)"
-                    )
-        
+    
         return True, ""
     
+    def _formatear_arbitro_no_disponible(self, arbitro: Arbitro, evento: Evento,
+                                         dias_diferencia: int) -> str:
+        """
+        Arma el mensaje de error de un árbitro sin descanso suficiente.
+        
+        Args:
+            arbitro: Árbitro no disponible
+            evento: Partido del árbitro dentro del período de descanso
+            dias_diferencia: Días entre ese partido y el nuevo
+            
+        Returns:
+            str: Mensaje de error
+        """
+        return (
+            f"{arbitro.nombre} no está disponible. "
+            f"Tiene partido el "
+            f"{evento.texto_fecha} "
+            f"y necesita {self.DIAS_DESCANSO_ARBITROS} días de descanso "
+            f"(solo hay {dias_diferencia} día(s) de diferencia)"
+        )
+    
     def validar_equipo_arbitral(self, recursos: List[Recurso]) -> Tuple[bool, str]:
         """
         Valida que la lista de recursos contenga un equipo arbitral completo.
@@ -336,7 +388,8 @@ class Validador:
                               (False, mensaje_error) si falta algún árbitro
         """
         restriccion = RestriccionCoRequisito()
-        return restriccion.validar(recursos, datetime.now(), datetime.now(), [])
+        ahora = datetime.now()
+        return restriccion.validar(recursos, ahora, ahora, [])
     
     # =========================================================================
     # VALIDACIÓN DE RESTRICCIONES
@@ -345,7 +398,11 @@ class Validador:
     def validar_restricciones(self, recursos: List[Recurso],
                                fecha_inicio: datetime,
                                fecha_fin: datetime,
-                               eventos_existentes: List[Evento]) -> Tuple[bool, List[str]]:
+                               eventos_existentes: List[Evento],
+                               agenda_arbitros: Optional[AgendaArbitros] = None,
+                               recursos_por_tipo: Optional[Tuple[List, List, List]] = None,
+                               calendario_estadio: Optional[CalendarioEstadio] = None
+                               ) -> Tuple[bool, List[str]]:
         """
         Valida todas las restricciones configuradas.
         
@@ -354,6 +411,10 @@ class Validador:
             fecha_inicio: Fecha de inicio del evento
             fecha_fin: Fecha de fin del evento
             eventos_existentes: Lista de eventos ya planificados
+            agenda_arbitros: Agenda de los árbitros (opcional)
+            recursos_por_tipo: Árbitros agrupados por tipo como
+                               (principales, lineas, cuartos) (opcional)
+            calendario_estadio: Calendario del estadio (opcional)
             
         Returns:
             Tuple[bool, List[str]]: (True, []) si todas las restricciones se cumplen,
@@ -363,7 +424,8 @@ class Validador:
         
         for restriccion in self.restricciones:
             es_valido, mensaje = restriccion.validar(
-                recursos, fecha_inicio, fecha_fin, eventos_existentes
+                recursos, fecha_inicio, fecha_fin, eventos_existentes,
+                agenda_arbitros, recursos_por_tipo, calendario_estadio
             )
             
             if not es_valido:
@@ -376,7 +438,10 @@ class Validador:
     # =========================================================================
     
     def validar_evento_completo(self, evento: Evento,
-                                 eventos_existentes: List[Evento]) -> Tuple[bool, List[str]]:
+                                 eventos_existentes: List[Evento],
+                                 agenda_arbitros: Optional[AgendaArbitros] = None,
+                                 calendario_estadio: Optional[CalendarioEstadio] = None
+                                 ) -> Tuple[bool, List[str]]:
         """
         Realiza una validación completa de un evento.
         
@@ -389,6 +454,12 @@ class Validador:
         Args:
             evento: Evento a validar
             eventos_existentes: Lista de eventos ya planificados
+            agenda_arbitros: Agenda de los árbitros con los eventos de
+                             eventos_existentes (opcional). Si no se indica,
+                             se construye una sola vez para los árbitros
+                             del evento.
+            calendario_estadio: Calendario del estadio con los eventos de
+                                eventos_existentes (opcional)
             
         Returns:
             Tuple[bool, List[str]]: (True, []) si todo es válido,
@@ -404,14 +475,21 @@ class Validador:
         """
         errores = []
         
+        if agenda_arbitros is None:
+            agenda_arbitros = AgendaArbitros.desde_eventos(
+                eventos_existentes,
+                [r.id for r in evento.recursos if isinstance(r, Arbitro)]
+            )
+        
         # 1. Validar conflicto de horario del estadio
         valido, mensaje = self.validar_conflicto_estadio(
             evento.fecha_inicio, 
             evento.fecha_fin, 
-            eventos_existentes
+            eventos_existentes,
+            calendario_estadio
         )
         if not valido:
-            errores.append(mensaje)
+            errores.append(str(mensaje))
         
         # 2. Validar disponibilidad de cada árbitro individualmente
         for recurso in evento.recursos:
@@ -420,17 +498,21 @@ class Validador:
                     recurso, 
                     evento.fecha_inicio, 
                     evento.fecha_fin, 
-                    eventos_existentes
+                    eventos_existentes,
+                    agenda_arbitros
                 )
                 if not valido:
-                    errores.append(mensaje)
+                    errores.append(str(mensaje))
         
         # 3. Validar restricciones de co-requisito y exclusión mutua
         valido, mensajes_restricciones = self.validar_restricciones(
             evento.recursos, 
             evento.fecha_inicio, 
             evento.fecha_fin, 
-            eventos_existentes
+            eventos_existentes,
+            agenda_arbitros,
+            evento.arbitros_por_tipo(),
+            calendario_estadio
         )
         
         # Agregar errores de restricciones (evitando duplicados)
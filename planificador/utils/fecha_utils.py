@@ -7,6 +7,8 @@ Incluye validaciones específicas para evitar números negativos y letras.
 =============================================================================
 """
 
+import re
+from functools import lru_cache
 from datetime import datetime, timedelta
 from typing import Tuple, Any, Optional
 
@@ -24,6 +26,12 @@ HORA_MAXIMA_PARTIDO = 22
 ANIO_MINIMO = 2020
 ANIO_MAXIMO = 2100
 
+# Forma canónica DD/MM/AAAA HH:MM; si coincide se omiten los chequeos
+# carácter a carácter y se pasa directamente a strptime
+_PATRON_FECHA_HORA = re.compile(
+    r'\A[0-9]{1,2}/[0-9]{1,2}/[0-9]{4} [0-9]{1,2}:[0-9]{2}\Z'
+)
+
 DIAS_SEMANA = [
     'Lunes', 'Martes', 'Miércoles', 'Jueves',
     'Viernes', 'Sábado', 'Domingo'
@@ -74,52 +82,11 @@ def validar_fecha(fecha_str: str) -> Tuple[bool, Any]:
     
     fecha_str = fecha_str.strip()
     
-    # Validar que no contenga números negativos (signo menos)
-    if '-' in fecha_str:
-        return False, "No se permiten números negativos en la fecha"
-    
-    # Validar que no contenga letras
-    for char in fecha_str:
-        if char.isalpha():
-            return False, (
-                "La fecha no puede contener letras. "
-                "Use solo números y los separadores / y :"
-            )
-    
-    # Validar caracteres permitidos
-    caracteres_permitidos = set('0123456789/: ')
-    caracteres_entrada = set(fecha_str)
-    caracteres_invalidos = caracteres_entrada - caracteres_permitidos
-    
-    if caracteres_invalidos:
-        caracteres_str = ', '.join(f"'{c}'" for c in caracteres_invalidos)
-        return False, f"La fecha contiene caracteres no válidos: {caracteres_str}"
-    
-    # Validar que tenga los separadores necesarios
-    if '/' not in fecha_str:
-        return False, (
-            "Formato incorrecto. Use DD/MM/AAAA HH:MM "
-            "(falta el separador /)"
-        )
-    
-    if ':' not in fecha_str:
-        return False, (
-            "Formato incorrecto. Use DD/MM/AAAA HH:MM "
-            "(falta la hora con :)"
-        )
-    
-    # Validar cantidad de separadores
-    if fecha_str.count('/') != 2:
-        return False, (
-            "Formato incorrecto. La fecha debe tener formato DD/MM/AAAA "
-            "(dos separadores /)"
-        )
-    
-    if fecha_str.count(':') != 1:
-        return False, (
-            "Formato incorrecto. La hora debe tener formato HH:MM "
-            "(un separador :)"
-        )
+    # Los chequeos de formato solo se necesitan para explicar el error
+    if not _PATRON_FECHA_HORA.match(fecha_str):
+        valido, mensaje = _diagnosticar_formato_fecha(fecha_str)
+        if not valido:
+            return False, mensaje
     
     # Intentar parsear la fecha
     try:
@@ -172,6 +139,67 @@ def validar_fecha(fecha_str: str) -> Tuple[bool, Any]:
     return True, fecha
 
 
+def _diagnosticar_formato_fecha(fecha_str: str) -> Tuple[bool, str]:
+    """
+    Revisa carácter a carácter una fecha que no tiene la forma canónica.
+    
+    Args:
+        fecha_str: Cadena con la fecha (sin espacios al inicio y final)
+        
+    Returns:
+        Tuple[bool, str]: (True, "") si puede intentarse el parseo,
+                          (False, mensaje_error) con el motivo si no
+    """
+    # Validar que no contenga números negativos (signo menos)
+    if '-' in fecha_str:
+        return False, "No se permiten números negativos en la fecha"
+    
+    # Validar que no contenga letras
+    for char in fecha_str:
+        if char.isalpha():
+            return False, (
+                "La fecha no puede contener letras. "
+                "Use solo números y los separadores / y :"
+            )
+    
+    # Validar caracteres permitidos
+    caracteres_permitidos = set('0123456789/: ')
+    caracteres_entrada = set(fecha_str)
+    caracteres_invalidos = caracteres_entrada - caracteres_permitidos
+    
+    if caracteres_invalidos:
+        caracteres_str = ', '.join(f"'{c}'" for c in caracteres_invalidos)
+        return False, f"La fecha contiene caracteres no válidos: {caracteres_str}"
+    
+    # Validar que tenga los separadores necesarios
+    if '/' not in fecha_str:
+        return False, (
+            "Formato incorrecto. Use DD/MM/AAAA HH:MM "
+            "(falta el separador /)"
+        )
+    
+    if ':' not in fecha_str:
+        return False, (
+            "Formato incorrecto. Use DD/MM/AAAA HH:MM "
+            "(falta la hora con :)"
+        )
+    
+    # Validar cantidad de separadores
+    if fecha_str.count('/') != 2:
+        return False, (
+            "Formato incorrecto. La fecha debe tener formato DD/MM/AAAA "
+            "(dos separadores /)"
+        )
+    
+    if fecha_str.count(':') != 1:
+        return False, (
+            "Formato incorrecto. La hora debe tener formato HH:MM "
+            "(un separador :)"
+        )
+    
+    return True, ""
+
+
 def parsear_fecha(fecha_str: str) -> Optional[datetime]:
     """
     Parsea una cadena de fecha al formato datetime.
@@ -202,10 +230,14 @@ def parsear_fecha(fecha_str: str) -> Optional[datetime]:
 # FORMATEO DE FECHAS
 # =============================================================================
 
+@lru_cache(maxsize=1024)
 def formatear_fecha(fecha: datetime, incluir_hora: bool = True) -> str:
     """
     Formatea una fecha para mostrar al usuario.
     
+    El resultado se memoriza: las vistas formatean una y otra vez las
+    mismas fechas de partidos.
+    
     Args:
         fecha: Objeto datetime a formatear
         incluir_hora: Si se debe incluir la hora (default: True)
@@ -225,6 +257,7 @@ def formatear_fecha(fecha: datetime, incluir_hora: bool = True) -> str:
     return fecha.strftime(FORMATO_FECHA)
 
 
+@lru_cache(maxsize=1024)
 def formatear_fecha_larga(fecha: datetime) -> str:
     """
     Formatea una fecha en formato largo legible.
@@ -477,20 +510,19 @@ def validar_numero_positivo(valor_str: str,
     
     valor_str = valor_str.strip()
     
-    # Verificar que no contenga letras
-    if any(c.isalpha() for c in valor_str):
-        return False, f"El {nombre_campo} no puede contener letras"
-    
-    # Verificar signo negativo
-    if '-' in valor_str:
-        return False, f"El {nombre_campo} no puede ser negativo"
-    
-    # Verificar caracteres válidos
-    caracteres_permitidos = set('0123456789')
-    caracteres_entrada = set(valor_str)
-    caracteres_invalidos = caracteres_entrada - caracteres_permitidos
-    
-    if caracteres_invalidos:
+    # Caso habitual: solo dígitos ASCII (chequeo hecho en C, sin recorrer
+    # la cadena desde Python)
+    if not (valor_str.isascii() and valor_str.isdigit()):
+        # Verificar que no contenga letras
+        if any(c.isalpha() for c in valor_str):
+            return False, f"El {nombre_campo} no puede contener letras"
+        
+        # Verificar signo negativo
+        if '-' in valor_str:
+            return False, f"El {nombre_campo} no puede ser negativo"
+        
+        # Informar los caracteres no válidos
+        caracteres_invalidos = set(valor_str) - set('0123456789')
         caracteres_str = ', '.join(f"'{c}'" for c in caracteres_invalidos)
         return False, f"El {nombre_campo} contiene caracteres no válidos: {caracteres_str}"
     